@@ -48,11 +48,6 @@ The functionality provided by ArrayFire spans the following domains:
 
 """
 
-try:
-    import pycuda.autoinit
-except ImportError:
-    pass
-
 from .library    import *
 from .array      import *
 from .data       import *
@@ -63,24 +58,82 @@ from .blas       import *
 from .arith      import *
 from .statistics import *
 from .lapack     import *
-from .signal     import *
-from .image      import *
 from .features   import *
-from .vision     import *
-from .graphics   import *
 from .bcast      import *
 from .index      import *
-from .interop    import *
 from .timer      import *
 from .random     import *
-from .sparse     import *
-from .ml         import *
+from .fuse       import *
+from .layout     import *
 
 # do not export default modules as part of arrayfire
 del ct
-del inspect
 del numbers
 del os
-
-if (AF_NUMPY_FOUND):
-    del np
+del functools
+del json
+del operator
+del struct
+del threading
+del weakref
+del OrderedDict
+
+# The following subsystems (and the optional packages probed by interop) are only
+# imported when one of their names is first accessed. See PEP 562.
+_lazy_modules = ('signal', 'image', 'vision', 'graphics', 'interop', 'sparse', 'ml', 'container', 'dlpack', 'numpy_dispatch')
+
+_lazy_names = {}
+for _name in ('approx1', 'approx1_uniform', 'approx2', 'approx2_uniform', 'convolve', 'convolve1', 'convolve2',
+              'convolve2NN', 'convolve2_separable', 'convolve3', 'dft', 'fft', 'fft2', 'fft2_c2r', 'fft2_inplace',
+              'fft2_r2c', 'fft3', 'fft3_c2r', 'fft3_inplace', 'fft3_r2c', 'fft_c2r', 'fft_convolve', 'fft_convolve1',
+              'fft_convolve2', 'fft_convolve3', 'fft_inplace', 'fft_r2c', 'fir', 'idft', 'ifft', 'ifft2',
+              'ifft2_inplace', 'ifft3', 'ifft3_inplace', 'ifft_inplace', 'iir', 'medfilt1', 'medfilt2',
+              'set_fft_plan_cache_size'):
+    _lazy_names[_name] = 'signal'
+for _name in ('anisotropic_diffusion', 'bilateral', 'canny', 'color_space', 'confidenceCC', 'dilate', 'dilate3',
+              'erode', 'erode3', 'gaussian_kernel', 'gradient', 'gray2rgb', 'hist_equal', 'histogram', 'hsv2rgb',
+              'inverseDeconv', 'is_image_io_available', 'iterativeDeconv', 'load_image', 'load_image_native',
+              'maxfilt', 'mean_shift', 'medfilt', 'minfilt', 'moments', 'regions', 'resize', 'rgb2gray', 'rgb2hsv',
+              'rgb2ycbcr', 'rotate', 'sat', 'save_image', 'save_image_native', 'scale', 'skew', 'sobel_derivatives',
+              'sobel_filter', 'transform', 'translate', 'unwrap', 'wrap', 'ycbcr2rgb'):
+    _lazy_names[_name] = 'image'
+for _name in ('dog', 'fast', 'gloh', 'hamming_matcher', 'harris', 'homography', 'match_template',
+              'nearest_neighbour', 'orb', 'sift', 'susan'):
+    _lazy_names[_name] = 'vision'
+for _name in ('Window',):
+    _lazy_names[_name] = 'graphics'
+for _name in ('AF_NUMPY_FOUND', 'AF_PYCUDA_FOUND', 'AF_PYOPENCL_FOUND', 'AF_NUMBA_FOUND', 'np_to_af_array',
+              'from_ndarray', 'pycuda_to_af_array', 'pyopencl_to_af_array', 'numba_to_af_array', 'to_array',
+              'stack_from_host'):
+    _lazy_names[_name] = 'interop'
+for _name in ('convert_sparse', 'convert_sparse_to_dense', 'create_sparse', 'create_sparse_from_dense',
+              'create_sparse_from_host', 'sparse_get_col_idx', 'sparse_get_info', 'sparse_get_nnz',
+              'sparse_get_row_idx', 'sparse_get_storage', 'sparse_get_values'):
+    _lazy_names[_name] = 'sparse'
+for _name in ('convolve2GradientNN',):
+    _lazy_names[_name] = 'ml'
+for _name in ('ArrayContainer', 'read_arrays', 'save_container'):
+    _lazy_names[_name] = 'container'
+for _name in ('from_dlpack',):
+    _lazy_names[_name] = 'dlpack'
+for _name in ('numpy_fallbacks', 'reset_numpy_fallbacks', 'set_numpy_fallback'):
+    _lazy_names[_name] = 'numpy_dispatch'
+del _name
+
+def __getattr__(name):
+    import importlib
+
+    if name in _lazy_modules:
+        return importlib.import_module('.' + name, __name__)
+
+    try:
+        module_name = _lazy_names[name]
+    except KeyError:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+    value = getattr(importlib.import_module('.' + module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_names) | set(_lazy_modules))
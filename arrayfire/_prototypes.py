@@ -0,0 +1,497 @@
+#######################################################
+# Copyright (c) 2015, ArrayFire
+# All rights reserved.
+#
+# This file is distributed under 3-clause BSD license.
+# The complete license agreement can be obtained at:
+# http://arrayfire.com/licenses/BSD-3-Clause
+########################################################
+
+"""
+C prototypes of the af_* functions used by the python bindings. For internal use only.
+
+Each entry maps a function name to its argument types. All functions return af_err
+unless they are listed in `_RESTYPES`. Opaque handles (af_array, af_features,
+af_random_engine, af_window), output parameters and raw data pointers are all declared
+as void pointers so that any ctypes pointer, handle or integer address can be passed.
+"""
+
+from .library import (c_void_ptr_t, c_char_ptr_t, c_int_t, c_uint_t, c_bool_t, c_float_t, c_double_t,
+                      c_dim_t, c_size_t, c_longlong_t, c_ulonglong_t)
+
+_a   = c_void_ptr_t   # af_array, af_features, af_random_engine, af_window
+_p   = c_void_ptr_t   # output parameters and data pointers
+_s   = c_char_ptr_t   # const char *
+_e   = c_int_t        # af_* enums
+_i   = c_int_t
+_u   = c_uint_t
+_b   = c_bool_t
+_f   = c_float_t
+_d   = c_double_t
+_dim = c_dim_t
+
+_UNARY  = (_p, _a)
+_BINARY = (_p, _a, _a, _b)
+_REDUCE = (_p, _a, _i)
+_REDUCE_NAN = (_p, _a, _i, _d)
+_REDUCE_ALL = (_p, _p, _a)
+_REDUCE_ALL_NAN = (_p, _p, _a, _d)
+_REDUCE_BY_KEY = (_p, _p, _a, _a, _i)
+_REDUCE_BY_KEY_NAN = (_p, _p, _a, _a, _i, _d)
+_IS = (_p, _a)
+_FFT_INPLACE = (_a, _d)
+
+_PROTOTYPES = {
+    # algorithm
+    'af_accum'                  : _REDUCE,
+    'af_all_true'               : _REDUCE,
+    'af_all_true_all'           : _REDUCE_ALL,
+    'af_all_true_by_key'        : _REDUCE_BY_KEY,
+    'af_any_true'               : _REDUCE,
+    'af_any_true_all'           : _REDUCE_ALL,
+    'af_any_true_by_key'        : _REDUCE_BY_KEY,
+    'af_count'                  : _REDUCE,
+    'af_count_all'              : _REDUCE_ALL,
+    'af_count_by_key'           : _REDUCE_BY_KEY,
+    'af_diff1'                  : _REDUCE,
+    'af_diff2'                  : _REDUCE,
+    'af_imax'                   : (_p, _p, _a, _i),
+    'af_imax_all'               : (_p, _p, _p, _a),
+    'af_imin'                   : (_p, _p, _a, _i),
+    'af_imin_all'               : (_p, _p, _p, _a),
+    'af_max'                    : _REDUCE,
+    'af_max_all'                : _REDUCE_ALL,
+    'af_max_by_key'             : _REDUCE_BY_KEY,
+    'af_max_ragged'             : (_p, _p, _a, _a, _i),
+    'af_min'                    : _REDUCE,
+    'af_min_all'                : _REDUCE_ALL,
+    'af_min_by_key'             : _REDUCE_BY_KEY,
+    'af_product'                : _REDUCE,
+    'af_product_all'            : _REDUCE_ALL,
+    'af_product_by_key'         : _REDUCE_BY_KEY,
+    'af_product_by_key_nan'     : _REDUCE_BY_KEY_NAN,
+    'af_product_nan'            : _REDUCE_NAN,
+    'af_product_nan_all'        : _REDUCE_ALL_NAN,
+    'af_scan'                   : (_p, _a, _i, _e, _b),
+    'af_scan_by_key'            : (_p, _a, _a, _i, _e, _b),
+    'af_set_intersect'          : (_p, _a, _a, _b),
+    'af_set_union'              : (_p, _a, _a, _b),
+    'af_set_unique'             : (_p, _a, _b),
+    'af_sort'                   : (_p, _a, _u, _b),
+    'af_sort_by_key'            : (_p, _p, _a, _a, _u, _b),
+    'af_sort_index'             : (_p, _p, _a, _u, _b),
+    'af_sum'                    : _REDUCE,
+    'af_sum_all'                : _REDUCE_ALL,
+    'af_sum_by_key'             : _REDUCE_BY_KEY,
+    'af_sum_by_key_nan'         : _REDUCE_BY_KEY_NAN,
+    'af_sum_nan'                : _REDUCE_NAN,
+    'af_sum_nan_all'            : _REDUCE_ALL_NAN,
+    'af_where'                  : _UNARY,
+
+    # arith
+    'af_abs'                    : _UNARY,
+    'af_acos'                   : _UNARY,
+    'af_acosh'                  : _UNARY,
+    'af_add'                    : _BINARY,
+    'af_and'                    : _BINARY,
+    'af_arg'                    : _UNARY,
+    'af_asin'                   : _UNARY,
+    'af_asinh'                  : _UNARY,
+    'af_atan'                   : _UNARY,
+    'af_atan2'                  : _BINARY,
+    'af_atanh'                  : _UNARY,
+    'af_bitand'                 : _BINARY,
+    'af_bitnot'                 : _UNARY,
+    'af_bitor'                  : _BINARY,
+    'af_bitshiftl'              : _BINARY,
+    'af_bitshiftr'              : _BINARY,
+    'af_bitxor'                 : _BINARY,
+    'af_cast'                   : (_p, _a, _e),
+    'af_cbrt'                   : _UNARY,
+    'af_ceil'                   : _UNARY,
+    'af_clamp'                  : (_p, _a, _a, _a, _b),
+    'af_conjg'                  : _UNARY,
+    'af_cos'                    : _UNARY,
+    'af_cosh'                   : _UNARY,
+    'af_cplx'                   : _UNARY,
+    'af_cplx2'                  : _BINARY,
+    'af_div'                    : _BINARY,
+    'af_eq'                     : _BINARY,
+    'af_erf'                    : _UNARY,
+    'af_erfc'                   : _UNARY,
+    'af_exp'                    : _UNARY,
+    'af_expm1'                  : _UNARY,
+    'af_factorial'              : _UNARY,
+    'af_floor'                  : _UNARY,
+    'af_ge'                     : _BINARY,
+    'af_gt'                     : _BINARY,
+    'af_hypot'                  : _BINARY,
+    'af_imag'                   : _UNARY,
+    'af_isinf'                  : _UNARY,
+    'af_isnan'                  : _UNARY,
+    'af_iszero'                 : _UNARY,
+    'af_le'                     : _BINARY,
+    'af_lgamma'                 : _UNARY,
+    'af_log'                    : _UNARY,
+    'af_log10'                  : _UNARY,
+    'af_log1p'                  : _UNARY,
+    'af_log2'                   : _UNARY,
+    'af_lt'                     : _BINARY,
+    'af_maxof'                  : _BINARY,
+    'af_minof'                  : _BINARY,
+    'af_mod'                    : _BINARY,
+    'af_mul'                    : _BINARY,
+    'af_neq'                    : _BINARY,
+    'af_not'                    : _UNARY,
+    'af_or'                     : _BINARY,
+    'af_pow'                    : _BINARY,
+    'af_pow2'                   : _UNARY,
+    'af_real'                   : _UNARY,
+    'af_rem'                    : _BINARY,
+    'af_root'                   : _BINARY,
+    'af_round'                  : _UNARY,
+    'af_rsqrt'                  : _UNARY,
+    'af_sigmoid'                : _UNARY,
+    'af_sign'                   : _UNARY,
+    'af_sin'                    : _UNARY,
+    'af_sinh'                   : _UNARY,
+    'af_sqrt'                   : _UNARY,
+    'af_sub'                    : _BINARY,
+    'af_tan'                    : _UNARY,
+    'af_tanh'                   : _UNARY,
+    'af_tgamma'                 : _UNARY,
+    'af_trunc'                  : _UNARY,
+
+    # array
+    'af_copy_array'             : _UNARY,
+    'af_create_array'           : (_p, _p, _u, _p, _e),
+    'af_create_handle'          : (_p, _u, _p, _e),
+    'af_create_strided_array'   : (_p, _p, _dim, _u, _p, _p, _e, _e),
+    'af_eval'                   : (_a,),
+    'af_eval_multiple'          : (_i, _p),
+    'af_get_allocated_bytes'    : (_p, _a),
+    'af_get_data_ptr'           : (_p, _a),
+    'af_get_data_ref_count'     : (_p, _a),
+    'af_get_dims'               : (_p, _p, _p, _p, _a),
+    'af_get_elements'           : (_p, _a),
+    'af_get_manual_eval_flag'   : (_p,),
+    'af_get_numdims'            : (_p, _a),
+    'af_get_offset'             : (_p, _a),
+    'af_get_raw_ptr'            : (_p, _a),
+    'af_get_scalar'             : (_p, _a),
+    'af_get_strides'            : (_p, _p, _p, _p, _a),
+    'af_get_type'               : (_p, _a),
+    'af_is_bool'                : _IS,
+    'af_is_column'              : _IS,
+    'af_is_complex'             : _IS,
+    'af_is_double'              : _IS,
+    'af_is_empty'               : _IS,
+    'af_is_floating'            : _IS,
+    'af_is_half'                : _IS,
+    'af_is_integer'             : _IS,
+    'af_is_linear'              : _IS,
+    'af_is_owner'               : _IS,
+    'af_is_real'                : _IS,
+    'af_is_realfloating'        : _IS,
+    'af_is_row'                 : _IS,
+    'af_is_scalar'              : _IS,
+    'af_is_single'              : _IS,
+    'af_is_sparse'              : _IS,
+    'af_is_vector'              : _IS,
+    'af_release_array'          : (_a,),
+    'af_retain_array'           : _UNARY,
+    'af_set_manual_eval_flag'   : (_b,),
+
+    # backend
+    'af_get_active_backend'     : (_p,),
+    'af_get_available_backends' : (_p,),
+    'af_get_backend_count'      : (_p,),
+    'af_get_backend_id'         : (_p, _a),
+    'af_get_device_id'          : (_p, _a),
+    'af_set_backend'            : (_e,),
+
+    # blas
+    'af_dot'                    : (_p, _a, _a, _e, _e),
+    'af_dot_all'                : (_p, _p, _a, _a, _e, _e),
+    'af_gemm'                   : (_p, _e, _e, _p, _a, _a, _p),
+    'af_matmul'                 : (_p, _a, _a, _e, _e),
+    'af_transpose'              : (_p, _a, _b),
+    'af_transpose_inplace'      : (_a, _b),
+
+    # data
+    'af_constant'               : (_p, _d, _u, _p, _e),
+    'af_constant_complex'       : (_p, _d, _d, _u, _p, _e),
+    'af_constant_long'          : (_p, c_longlong_t, _u, _p),
+    'af_constant_ulong'         : (_p, c_ulonglong_t, _u, _p),
+    'af_diag_create'            : (_p, _a, _i),
+    'af_diag_extract'           : (_p, _a, _i),
+    'af_flat'                   : _UNARY,
+    'af_flip'                   : (_p, _a, _u),
+    'af_identity'               : (_p, _u, _p, _e),
+    'af_iota'                   : (_p, _u, _p, _u, _p, _e),
+    'af_join'                   : (_p, _i, _a, _a),
+    'af_join_many'              : (_p, _i, _u, _p),
+    'af_lookup'                 : (_p, _a, _a, _u),
+    'af_lower'                  : (_p, _a, _b),
+    'af_moddims'                : (_p, _a, _u, _p),
+    'af_pad'                    : (_p, _a, _u, _p, _u, _p, _e),
+    'af_range'                  : (_p, _u, _p, _i, _e),
+    'af_reorder'                : (_p, _a, _u, _u, _u, _u),
+    'af_replace'                : (_a, _a, _a),
+    'af_replace_scalar'         : (_a, _a, _d),
+    'af_select'                 : (_p, _a, _a, _a),
+    'af_select_scalar_l'        : (_p, _a, _d, _a),
+    'af_select_scalar_r'        : (_p, _a, _a, _d),
+    'af_shift'                  : (_p, _a, _i, _i, _i, _i),
+    'af_tile'                   : (_p, _a, _u, _u, _u, _u),
+    'af_upper'                  : (_p, _a, _b),
+
+    # device
+    'af_alloc_device'           : (_p, _dim),
+    'af_alloc_host'             : (_p, _dim),
+    'af_alloc_pinned'           : (_p, _dim),
+    'af_device_array'           : (_p, _p, _u, _p, _e),
+    'af_device_gc'              : (),
+    'af_device_info'            : (_p, _p, _p, _p),
+    'af_device_mem_info'        : (_p, _p, _p, _p),
+    'af_free_device'            : (_p,),
+    'af_free_host'              : (_p,),
+    'af_free_pinned'            : (_p,),
+    'af_get_dbl_support'        : (_p, _i),
+    'af_get_device'             : (_p,),
+    'af_get_device_count'       : (_p,),
+    'af_get_device_ptr'         : (_p, _a),
+    'af_get_half_support'       : (_p, _i),
+    'af_info'                   : (),
+    'af_init'                   : (),
+    'af_is_locked_array'        : (_p, _a),
+    'af_lock_array'             : (_a,),
+    'af_print_mem_info'         : (_s, _i),
+    'af_set_device'             : (_i,),
+    'af_sync'                   : (_i,),
+    'af_unlock_array'           : (_a,),
+
+    # features
+    'af_create_features'        : (_p, _dim),
+    'af_get_features_num'       : (_p, _a),
+    'af_get_features_orientation' : (_p, _a),
+    'af_get_features_score'     : (_p, _a),
+    'af_get_features_size'      : (_p, _a),
+    'af_get_features_xpos'      : (_p, _a),
+    'af_get_features_ypos'      : (_p, _a),
+    'af_release_features'       : (_a,),
+
+    # graphics
+    'af_create_window'          : (_p, _i, _i, _s),
+    'af_destroy_window'         : (_a,),
+    'af_draw_hist'              : (_a, _a, _d, _d, _p),
+    'af_draw_image'             : (_a, _a, _p),
+    'af_draw_plot_2d'           : (_a, _a, _a, _p),
+    'af_draw_plot_3d'           : (_a, _a, _a, _a, _p),
+    'af_draw_plot_nd'           : (_a, _a, _p),
+    'af_draw_scatter2'          : (_a, _a, _e, _p),
+    'af_draw_scatter3'          : (_a, _a, _e, _p),
+    'af_draw_scatter_2d'        : (_a, _a, _a, _e, _p),
+    'af_draw_scatter_3d'        : (_a, _a, _a, _a, _e, _p),
+    'af_draw_scatter_nd'        : (_a, _a, _e, _p),
+    'af_draw_surface'           : (_a, _a, _a, _a, _p),
+    'af_draw_vector_field_2d'   : (_a, _a, _a, _a, _a, _p),
+    'af_draw_vector_field_3d'   : (_a, _a, _a, _a, _a, _a, _a, _p),
+    'af_draw_vector_field_nd'   : (_a, _a, _a, _p),
+    'af_grid'                   : (_a, _i, _i),
+    'af_is_window_closed'       : (_p, _a),
+    'af_set_axes_label_format'  : (_a, _s, _s, _s, _p),
+    'af_set_axes_limits_2d'     : (_a, _f, _f, _f, _f, _b, _p),
+    'af_set_axes_limits_3d'     : (_a, _f, _f, _f, _f, _f, _f, _b, _p),
+    'af_set_position'           : (_a, _u, _u),
+    'af_set_size'               : (_a, _u, _u),
+    'af_set_title'              : (_a, _s),
+    'af_set_visibility'         : (_a, _b),
+    'af_show'                   : (_a,),
+
+    # image
+    'af_anisotropic_diffusion'  : (_p, _a, _f, _f, _u, _e, _e),
+    'af_bilateral'              : (_p, _a, _f, _f, _b),
+    'af_canny'                  : (_p, _a, _e, _f, _f, _u, _b),
+    'af_color_space'            : (_p, _a, _e, _e),
+    'af_confidence_cc'          : (_p, _a, _a, _a, _u, _u, _i, _d),
+    'af_dilate'                 : (_p, _a, _a),
+    'af_dilate3'                : (_p, _a, _a),
+    'af_erode'                  : (_p, _a, _a),
+    'af_erode3'                 : (_p, _a, _a),
+    'af_gaussian_kernel'        : (_p, _i, _i, _d, _d),
+    'af_gradient'               : (_p, _p, _a),
+    'af_gray2rgb'               : (_p, _a, _f, _f, _f),
+    'af_hist_equal'             : (_p, _a, _a),
+    'af_histogram'              : (_p, _a, _u, _d, _d),
+    'af_hsv2rgb'                : _UNARY,
+    'af_inverse_deconv'         : (_p, _a, _a, _f, _e),
+    'af_is_image_io_available'  : (_p,),
+    'af_iterative_deconv'       : (_p, _a, _a, _u, _f, _e),
+    'af_load_image'             : (_p, _s, _b),
+    'af_load_image_native'      : (_p, _s),
+    'af_maxfilt'                : (_p, _a, _dim, _dim, _e),
+    'af_mean_shift'             : (_p, _a, _f, _f, _u, _b),
+    'af_minfilt'                : (_p, _a, _dim, _dim, _e),
+    'af_moments'                : (_p, _a, _e),
+    'af_regions'                : (_p, _a, _e, _e),
+    'af_resize'                 : (_p, _a, _dim, _dim, _e),
+    'af_rgb2gray'               : (_p, _a, _f, _f, _f),
+    'af_rgb2hsv'                : _UNARY,
+    'af_rgb2ycbcr'              : (_p, _a, _e),
+    'af_rotate'                 : (_p, _a, _f, _b, _e),
+    'af_sat'                    : _UNARY,
+    'af_save_image'             : (_s, _a),
+    'af_save_image_native'      : (_s, _a),
+    'af_scale'                  : (_p, _a, _f, _f, _dim, _dim, _e),
+    'af_skew'                   : (_p, _a, _f, _f, _dim, _dim, _e, _b),
+    'af_sobel_operator'         : (_p, _p, _a, _u),
+    'af_transform'              : (_p, _a, _a, _dim, _dim, _e, _b),
+    'af_translate'              : (_p, _a, _f, _f, _dim, _dim, _e),
+    'af_unwrap'                 : (_p, _a, _dim, _dim, _dim, _dim, _dim, _dim, _b),
+    'af_wrap'                   : (_p, _a, _dim, _dim, _dim, _dim, _dim, _dim, _dim, _dim, _b),
+    'af_ycbcr2rgb'              : (_p, _a, _e),
+
+    # index
+    'af_assign_gen'             : (_p, _a, _dim, _p, _a),
+    'af_index_gen'              : (_p, _a, _dim, _p),
+
+    # lapack
+    'af_cholesky'               : (_p, _p, _a, _b),
+    'af_cholesky_inplace'       : (_p, _a, _b),
+    'af_det'                    : (_p, _p, _a),
+    'af_inverse'                : (_p, _a, _e),
+    'af_is_lapack_available'    : (_p,),
+    'af_lu'                     : (_p, _p, _p, _a),
+    'af_lu_inplace'             : (_p, _a, _b),
+    'af_norm'                   : (_p, _a, _e, _d, _d),
+    'af_pinverse'               : (_p, _a, _d, _e),
+    'af_qr'                     : (_p, _p, _p, _a),
+    'af_qr_inplace'             : (_p, _a),
+    'af_rank'                   : (_p, _a, _d),
+    'af_solve'                  : (_p, _a, _a, _e),
+    'af_solve_lu'               : (_p, _a, _a, _a, _e),
+    'af_svd'                    : (_p, _p, _p, _a),
+    'af_svd_inplace'            : (_p, _p, _p, _a),
+
+    # ml
+    'af_convolve2_gradient_nn'  : (_p, _a, _a, _a, _a, _u, _p, _u, _p, _u, _p, _e),
+
+    # random
+    'af_create_random_engine'   : (_p, _e, c_ulonglong_t),
+    'af_get_default_random_engine' : (_p,),
+    'af_get_seed'               : (_p,),
+    'af_randn'                  : (_p, _u, _p, _e),
+    'af_random_engine_get_seed' : (_p, _a),
+    'af_random_engine_get_type' : (_p, _a),
+    'af_random_engine_set_seed' : (_p, c_ulonglong_t),
+    'af_random_engine_set_type' : (_p, _e),
+    'af_random_normal'          : (_p, _u, _p, _e, _a),
+    'af_random_uniform'         : (_p, _u, _p, _e, _a),
+    'af_randu'                  : (_p, _u, _p, _e),
+    'af_release_random_engine'  : (_a,),
+    'af_retain_random_engine'   : (_p, _a),
+    'af_set_default_random_engine_type' : (_e,),
+    'af_set_seed'               : (c_ulonglong_t,),
+
+    # signal
+    'af_approx1'                : (_p, _a, _a, _e, _f),
+    'af_approx1_uniform'        : (_p, _a, _a, _i, _d, _d, _e, _f),
+    'af_approx1_uniform_v2'     : (_p, _a, _a, _i, _d, _d, _e, _f),
+    'af_approx1_v2'             : (_p, _a, _a, _e, _f),
+    'af_approx2'                : (_p, _a, _a, _a, _e, _f),
+    'af_approx2_uniform'        : (_p, _a, _a, _i, _d, _d, _a, _i, _d, _d, _e, _f),
+    'af_approx2_uniform_v2'     : (_p, _a, _a, _i, _d, _d, _a, _i, _d, _d, _e, _f),
+    'af_approx2_v2'             : (_p, _a, _a, _a, _e, _f),
+    'af_convolve1'              : (_p, _a, _a, _e, _e),
+    'af_convolve2'              : (_p, _a, _a, _e, _e),
+    'af_convolve2_nn'           : (_p, _a, _a, _u, _p, _u, _p, _u, _p),
+    'af_convolve2_sep'          : (_p, _a, _a, _a, _e),
+    'af_convolve3'              : (_p, _a, _a, _e, _e),
+    'af_fft'                    : (_p, _a, _d, _dim),
+    'af_fft2'                   : (_p, _a, _d, _dim, _dim),
+    'af_fft2_c2r'               : (_p, _a, _d, _b),
+    'af_fft2_inplace'           : _FFT_INPLACE,
+    'af_fft2_r2c'               : (_p, _a, _d, _dim, _dim),
+    'af_fft3'                   : (_p, _a, _d, _dim, _dim, _dim),
+    'af_fft3_c2r'               : (_p, _a, _d, _b),
+    'af_fft3_inplace'           : _FFT_INPLACE,
+    'af_fft3_r2c'               : (_p, _a, _d, _dim, _dim, _dim),
+    'af_fft_c2r'                : (_p, _a, _d, _b),
+    'af_fft_convolve1'          : (_p, _a, _a, _e),
+    'af_fft_convolve2'          : (_p, _a, _a, _e),
+    'af_fft_convolve3'          : (_p, _a, _a, _e),
+    'af_fft_inplace'            : _FFT_INPLACE,
+    'af_fft_r2c'                : (_p, _a, _d, _dim),
+    'af_fir'                    : (_p, _a, _a),
+    'af_ifft'                   : (_p, _a, _d, _dim),
+    'af_ifft2'                  : (_p, _a, _d, _dim, _dim),
+    'af_ifft2_inplace'          : _FFT_INPLACE,
+    'af_ifft3'                  : (_p, _a, _d, _dim, _dim, _dim),
+    'af_ifft3_inplace'          : _FFT_INPLACE,
+    'af_ifft_inplace'           : _FFT_INPLACE,
+    'af_iir'                    : (_p, _a, _a, _a),
+    'af_medfilt'                : (_p, _a, _dim, _dim, _e),
+    'af_medfilt1'               : (_p, _a, _dim, _e),
+    'af_medfilt2'               : (_p, _a, _dim, _dim, _e),
+    'af_set_fft_plan_cache_size' : (c_size_t,),
+
+    # sparse
+    'af_create_sparse_array'    : (_p, _dim, _dim, _a, _a, _a, _e),
+    'af_create_sparse_array_from_dense' : (_p, _a, _e),
+    'af_sparse_convert_to'      : (_p, _a, _e),
+    'af_sparse_get_col_idx'     : _UNARY,
+    'af_sparse_get_info'        : (_p, _p, _p, _p, _a),
+    'af_sparse_get_nnz'         : (_p, _a),
+    'af_sparse_get_row_idx'     : _UNARY,
+    'af_sparse_get_storage'     : (_p, _a),
+    'af_sparse_get_values'      : _UNARY,
+    'af_sparse_to_dense'        : _UNARY,
+
+    # statistics
+    'af_corrcoef'               : (_p, _p, _a, _a),
+    'af_cov_v2'                 : (_p, _a, _a, _e),
+    'af_mean'                   : (_p, _a, _dim),
+    'af_mean_all'               : _REDUCE_ALL,
+    'af_mean_all_weighted'      : (_p, _p, _a, _a),
+    'af_mean_weighted'          : (_p, _a, _a, _dim),
+    'af_meanvar'                : (_p, _p, _a, _a, _e, _dim),
+    'af_median'                 : (_p, _a, _dim),
+    'af_median_all'             : _REDUCE_ALL,
+    'af_stdev_all_v2'           : (_p, _p, _a, _e),
+    'af_stdev_v2'               : (_p, _a, _e, _dim),
+    'af_topk'                   : (_p, _p, _a, _i, _i, _e),
+    'af_var_all_v2'             : (_p, _p, _a, _e),
+    'af_var_all_weighted'       : (_p, _p, _a, _a),
+    'af_var_v2'                 : (_p, _a, _e, _dim),
+    'af_var_weighted'           : (_p, _a, _a, _dim),
+
+    # util
+    'af_array_to_string'        : (_p, _s, _a, _i, _b),
+    'af_get_last_error'         : (_p, _p),
+    'af_get_revision'           : (),
+    'af_get_size_of'            : (_p, _e),
+    'af_get_version'            : (_p, _p, _p),
+    'af_print_array_gen'        : (_s, _a, _i),
+    'af_read_array_index'       : (_p, _s, _u),
+    'af_read_array_key'         : (_p, _s, _s),
+    'af_save_array'             : (_p, _s, _a, _s, _b),
+
+    # vision
+    'af_dog'                    : (_p, _a, _i, _i),
+    'af_fast'                   : (_p, _a, _f, _u, _b, _f, _u),
+    'af_gloh'                   : (_p, _p, _a, _u, _f, _f, _f, _b, _f, _f),
+    'af_hamming_matcher'        : (_p, _p, _a, _a, _dim, _u),
+    'af_harris'                 : (_p, _a, _u, _f, _f, _u, _f),
+    'af_homography'             : (_p, _p, _a, _a, _a, _a, _e, _f, _u, _e),
+    'af_match_template'         : (_p, _a, _a, _e),
+    'af_nearest_neighbour'      : (_p, _p, _a, _a, _dim, _u, _e),
+    'af_orb'                    : (_p, _p, _a, _f, _u, _f, _u, _b),
+    'af_sift'                   : (_p, _p, _a, _u, _f, _f, _f, _b, _f, _f),
+    'af_susan'                  : (_p, _a, _u, _f, _f, _f, _u),
+}
+
+_RESTYPES = {
+    'af_get_last_error' : None,
+    'af_get_revision'   : c_char_ptr_t,
+}
@@ -13,13 +13,19 @@ Vector algorithms (sum, min, sort, etc).
 
 from .library import *
 from .array import *
+from .array import _compute_operand, _to_out
 
-def _parallel_dim(a, dim, c_func):
-    out = Array()
-    safe_call(c_func(c_pointer(out.arr), a.arr, c_int_t(dim)))
-    return out
+def _parallel_dim(a, dim, c_func, out=None):
+    res = Array()
+    a = _compute_operand(a)
+    safe_call(c_func(c_pointer(res.arr), a.arr, c_int_t(dim)))
+    return _to_out(res, out)
+
+def _reduce_all(a, c_func, out=None):
+    if out is not None:
+        raise RuntimeError("out can only be used along with dim")
 
-def _reduce_all(a, c_func):
+    a = _compute_operand(a)
     real = c_double_t(0)
     imag = c_double_t(0)
 
@@ -29,12 +35,17 @@ def _reduce_all(a, c_func):
     imag = imag.value
     return real if imag == 0 else real + imag * 1j
 
-def _nan_parallel_dim(a, dim, c_func, nan_val):
-    out = Array()
-    safe_call(c_func(c_pointer(out.arr), a.arr, c_int_t(dim), c_double_t(nan_val)))
-    return out
+def _nan_parallel_dim(a, dim, c_func, nan_val, out=None):
+    res = Array()
+    a = _compute_operand(a)
+    safe_call(c_func(c_pointer(res.arr), a.arr, c_int_t(dim), c_double_t(nan_val)))
+    return _to_out(res, out)
+
+def _nan_reduce_all(a, c_func, nan_val, out=None):
+    if out is not None:
+        raise RuntimeError("out can only be used along with dim")
 
-def _nan_reduce_all(a, c_func, nan_val):
+    a = _compute_operand(a)
     real = c_double_t(0)
     imag = c_double_t(0)
 
@@ -69,7 +80,7 @@ def _nan_rbk_dim(a, dim, c_func, nan_val):
     safe_call(c_func(c_pointer(keys_out.arr), c_pointer(vals_out.arr), keys.arr, vals.arr, c_int_t(rdim), c_double_t(nan_val)))
     return keys_out, vals_out
 
-def sum(a, dim=None, nan_val=None):
+def sum(a, dim=None, nan_val=None, out=None):
     """
     Calculate the sum of all the elements along a specified dimension.
 
@@ -81,6 +92,8 @@ def sum(a, dim=None, nan_val=None):
          Dimension along which the sum is required.
     nan_val: optional: scalar. default: None
          The value that replaces NaN in the array
+    out: optional: af.Array. default: None
+         Array to store the result in when `dim` is specified, it is also returned.
 
     Returns
     -------
@@ -90,14 +103,14 @@ def sum(a, dim=None, nan_val=None):
     """
     if (nan_val is not None):
         if dim is not None:
-            return _nan_parallel_dim(a, dim, backend.get().af_sum_nan, nan_val)
+            return _nan_parallel_dim(a, dim, backend.get().af_sum_nan, nan_val, out)
         else:
-            return _nan_reduce_all(a, backend.get().af_sum_nan_all, nan_val)
+            return _nan_reduce_all(a, backend.get().af_sum_nan_all, nan_val, out)
     else:
         if dim is not None:
-            return _parallel_dim(a, dim, backend.get().af_sum)
+            return _parallel_dim(a, dim, backend.get().af_sum, out)
         else:
-            return _reduce_all(a, backend.get().af_sum_all)
+            return _reduce_all(a, backend.get().af_sum_all, out)
 
 
 def sumByKey(keys, vals, dim=-1, nan_val=None):
@@ -127,7 +140,7 @@ def sumByKey(keys, vals, dim=-1, nan_val=None):
     else:
         return _rbk_dim(keys, vals, dim, backend.get().af_sum_by_key)
 
-def product(a, dim=None, nan_val=None):
+def product(a, dim=None, nan_val=None, out=None):
     """
     Calculate the product of all the elements along a specified dimension.
 
@@ -139,6 +152,8 @@ def product(a, dim=None, nan_val=None):
          Dimension along which the product is required.
     nan_val: optional: scalar. default: None
          The value that replaces NaN in the array
+    out: optional: af.Array. default: None
+         Array to store the result in when `dim` is specified, it is also returned.
 
     Returns
     -------
@@ -148,14 +163,14 @@ def product(a, dim=None, nan_val=None):
     """
     if (nan_val is not None):
         if dim is not None:
-            return _nan_parallel_dim(a, dim, backend.get().af_product_nan, nan_val)
+            return _nan_parallel_dim(a, dim, backend.get().af_product_nan, nan_val, out)
         else:
-            return _nan_reduce_all(a, backend.get().af_product_nan_all, nan_val)
+            return _nan_reduce_all(a, backend.get().af_product_nan_all, nan_val, out)
     else:
         if dim is not None:
-            return _parallel_dim(a, dim, backend.get().af_product)
+            return _parallel_dim(a, dim, backend.get().af_product, out)
         else:
-            return _reduce_all(a, backend.get().af_product_all)
+            return _reduce_all(a, backend.get().af_product_all, out)
 
 def productByKey(keys, vals, dim=-1, nan_val=None):
     """
@@ -184,7 +199,7 @@ def productByKey(keys, vals, dim=-1, nan_val=None):
     else:
         return _rbk_dim(keys, vals, dim, backend.get().af_product_by_key)
 
-def min(a, dim=None):
+def min(a, dim=None, out=None):
     """
     Find the minimum value of all the elements along a specified dimension.
 
@@ -194,6 +209,8 @@ def min(a, dim=None):
          Multi dimensional arrayfire array.
     dim: optional: int. default: None
          Dimension along which the minimum value is required.
+    out: optional: af.Array. default: None
+         Array to store the result in when `dim` is specified, it is also returned.
 
     Returns
     -------
@@ -202,9 +219,9 @@ def min(a, dim=None):
          If `dim` is `None`, minimum value of the entire Array is returned.
     """
     if dim is not None:
-        return _parallel_dim(a, dim, backend.get().af_min)
+        return _parallel_dim(a, dim, backend.get().af_min, out)
     else:
-        return _reduce_all(a, backend.get().af_min_all)
+        return _reduce_all(a, backend.get().af_min_all, out)
 
 def minByKey(keys, vals, dim=-1):
     """
@@ -228,7 +245,7 @@ def minByKey(keys, vals, dim=-1):
     """
     return _rbk_dim(keys, vals, dim, backend.get().af_min_by_key)
 
-def max(a, dim=None):
+def max(a, dim=None, out=None):
     """
     Find the maximum value of all the elements along a specified dimension.
 
@@ -238,6 +255,8 @@ def max(a, dim=None):
          Multi dimensional arrayfire array.
     dim: optional: int. default: None
          Dimension along which the maximum value is required.
+    out: optional: af.Array. default: None
+         Array to store the result in when `dim` is specified, it is also returned.
 
     Returns
     -------
@@ -246,9 +265,9 @@ def max(a, dim=None):
          If `dim` is `None`, maximum value of the entire Array is returned.
     """
     if dim is not None:
-        return _parallel_dim(a, dim, backend.get().af_max)
+        return _parallel_dim(a, dim, backend.get().af_max, out)
     else:
-        return _reduce_all(a, backend.get().af_max_all)
+        return _reduce_all(a, backend.get().af_max_all, out)
 
 def maxRagged(vals, lens, dim):
     """
@@ -300,7 +319,7 @@ def maxByKey(keys, vals, dim=-1):
     """
     return _rbk_dim(keys, vals, dim, backend.get().af_max_by_key)
 
-def all_true(a, dim=None):
+def all_true(a, dim=None, out=None):
     """
     Check if all the elements along a specified dimension are true.
 
@@ -310,6 +329,8 @@ def all_true(a, dim=None):
          Multi dimensional arrayfire array.
     dim: optional: int. default: None
          Dimension along which the product is required.
+    out: optional: af.Array. default: None
+         Array to store the result in when `dim` is specified, it is also returned.
 
     Returns
     -------
@@ -318,9 +339,9 @@ def all_true(a, dim=None):
          If `dim` is `None`, output is True if `a` does not have any zeros, else False.
     """
     if dim is not None:
-        return _parallel_dim(a, dim, backend.get().af_all_true)
+        return _parallel_dim(a, dim, backend.get().af_all_true, out)
     else:
-        return _reduce_all(a, backend.get().af_all_true_all)
+        return _reduce_all(a, backend.get().af_all_true_all, out)
 
 def allTrueByKey(keys, vals, dim=-1):
     """
@@ -344,7 +365,7 @@ def allTrueByKey(keys, vals, dim=-1):
     """
     return _rbk_dim(keys, vals, dim, backend.get().af_all_true_by_key)
 
-def any_true(a, dim=None):
+def any_true(a, dim=None, out=None):
     """
     Check if any the elements along a specified dimension are true.
 
@@ -354,6 +375,8 @@ def any_true(a, dim=None):
          Multi dimensional arrayfire array.
     dim: optional: int. default: None
          Dimension along which the product is required.
+    out: optional: af.Array. default: None
+         Array to store the result in when `dim` is specified, it is also returned.
 
     Returns
     -------
@@ -362,9 +385,9 @@ def any_true(a, dim=None):
          If `dim` is `None`, output is True if `a` does not have any zeros, else False.
     """
     if dim is not None:
-        return _parallel_dim(a, dim, backend.get().af_any_true)
+        return _parallel_dim(a, dim, backend.get().af_any_true, out)
     else:
-        return _reduce_all(a, backend.get().af_any_true_all)
+        return _reduce_all(a, backend.get().af_any_true_all, out)
 
 def anyTrueByKey(keys, vals, dim=-1):
     """
@@ -388,7 +411,7 @@ def anyTrueByKey(keys, vals, dim=-1):
     """
     return _rbk_dim(keys, vals, dim, backend.get().af_any_true_by_key)
 
-def count(a, dim=None):
+def count(a, dim=None, out=None):
     """
     Count the number of non zero elements in an array along a specified dimension.
 
@@ -398,6 +421,8 @@ def count(a, dim=None):
          Multi dimensional arrayfire array.
     dim: optional: int. default: None
          Dimension along which the the non zero elements are to be counted.
+    out: optional: af.Array. default: None
+         Array to store the result in when `dim` is specified, it is also returned.
 
     Returns
     -------
@@ -406,9 +431,9 @@ def count(a, dim=None):
          If `dim` is `None`, the total number of non zero elements in `a`.
     """
     if dim is not None:
-        return _parallel_dim(a, dim, backend.get().af_count)
+        return _parallel_dim(a, dim, backend.get().af_count, out)
     else:
-        return _reduce_all(a, backend.get().af_count_all)
+        return _reduce_all(a, backend.get().af_count_all, out)
 
 def countByKey(keys, vals, dim=-1):
     """
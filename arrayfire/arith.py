@@ -13,11 +13,14 @@ Math functions (sin, sqrt, exp, etc).
 
 from .library import *
 from .array import *
+from .array import _compute_operand, _scalar_array, _to_out, _track_pending
 from .bcast import _bcast_var
 from .util import _is_number
 
-def _arith_binary_func(lhs, rhs, c_func):
-    out = Array()
+def _arith_binary_func(lhs, rhs, c_func, out=None):
+    res = Array()
+    lhs = _compute_operand(lhs)
+    rhs = _compute_operand(rhs)
 
     is_left_array = isinstance(lhs, Array)
     is_right_array = isinstance(rhs, Array)
@@ -26,30 +29,29 @@ def _arith_binary_func(lhs, rhs, c_func):
         raise TypeError("Atleast one input needs to be of type arrayfire.array")
 
     elif (is_left_array and is_right_array):
-        safe_call(c_func(c_pointer(out.arr), lhs.arr, rhs.arr, _bcast_var.get()))
+        batch = _bcast_var.get()
 
     elif (_is_number(rhs)):
-        ldims = dim4_to_tuple(lhs.dims())
+        # 1 element constant, broadcast by arrayfire to the shape of lhs
         rty = implicit_dtype(rhs, lhs.type())
-        other = Array()
-        other.arr = constant_array(rhs, ldims[0], ldims[1], ldims[2], ldims[3], rty)
-        safe_call(c_func(c_pointer(out.arr), lhs.arr, other.arr, _bcast_var.get()))
+        rhs = _scalar_array(rhs, rty)
+        batch = True
 
     else:
-        rdims = dim4_to_tuple(rhs.dims())
         lty = implicit_dtype(lhs, rhs.type())
-        other = Array()
-        other.arr = constant_array(lhs, rdims[0], rdims[1], rdims[2], rdims[3], lty)
-        safe_call(c_func(c_pointer(out.arr), other.arr, rhs.arr, _bcast_var.get()))
+        lhs = _scalar_array(lhs, lty)
+        batch = True
 
-    return out
+    safe_call(c_func(c_pointer(res.arr), lhs.arr, rhs.arr, batch))
+    return _to_out(_track_pending(res, c_func, lhs, rhs, batch), out)
 
-def _arith_unary_func(a, c_func):
-    out = Array()
-    safe_call(c_func(c_pointer(out.arr), a.arr))
-    return out
+def _arith_unary_func(a, c_func, out=None):
+    res = Array()
+    a = _compute_operand(a)
+    safe_call(c_func(c_pointer(res.arr), a.arr))
+    return _to_out(_track_pending(res, c_func, a), out)
 
-def cast(a, dtype):
+def cast(a, dtype, out=None):
     """
     Cast an array to a specified type
 
@@ -69,16 +71,19 @@ def cast(a, dtype):
                - Dtype.u64 for unsigned 64 bit integer
                - Dtype.c32 for 32 bit complex number
                - Dtype.c64 for 64 bit complex number
+    out  : optional: af.Array. default: None.
+           Array to store the result in, it is also returned.
     Returns
     --------
     out  : af.Array
            array containing the values from `a` after converting to `dtype`.
     """
-    out=Array()
-    safe_call(backend.get().af_cast(c_pointer(out.arr), a.arr, dtype.value))
-    return out
+    res = Array()
+    c_func = backend.get().af_cast
+    safe_call(c_func(c_pointer(res.arr), a.arr, dtype.value))
+    return _to_out(_track_pending(res, c_func, a, dtype.value), out)
 
-def minof(lhs, rhs):
+def minof(lhs, rhs, out=None):
     """
     Find the minimum value of two inputs at each location.
 
@@ -90,6 +95,9 @@ def minof(lhs, rhs):
     rhs : af.Array or scalar
           Multi dimensional arrayfire array or a scalar number.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
@@ -100,9 +108,9 @@ def minof(lhs, rhs):
     - Atleast one of `lhs` and `rhs` needs to be af.Array.
     - If `lhs` and `rhs` are both af.Array, they must be of same size.
     """
-    return _arith_binary_func(lhs, rhs, backend.get().af_minof)
+    return _arith_binary_func(lhs, rhs, backend.get().af_minof, out)
 
-def maxof(lhs, rhs):
+def maxof(lhs, rhs, out=None):
     """
     Find the maximum value of two inputs at each location.
 
@@ -114,6 +122,9 @@ def maxof(lhs, rhs):
     rhs : af.Array or scalar
           Multi dimensional arrayfire array or a scalar number.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
@@ -124,9 +135,9 @@ def maxof(lhs, rhs):
     - Atleast one of `lhs` and `rhs` needs to be af.Array.
     - If `lhs` and `rhs` are both af.Array, they must be of same size.
     """
-    return _arith_binary_func(lhs, rhs, backend.get().af_maxof)
+    return _arith_binary_func(lhs, rhs, backend.get().af_maxof, out)
 
-def clamp(val, low, high):
+def clamp(val, low, high, out=None):
     """
     Clamp the input value between low and high
 
@@ -141,30 +152,31 @@ def clamp(val, low, high):
 
     high : af.Array or scalar
           Multi dimensional arrayfire array or a scalar number denoting the higher value(s).
+
+    out  : optional: af.Array. default: None.
+          Array to store the result in, it is also returned.
     """
-    out = Array()
+    res = Array()
 
     is_low_array = isinstance(low, Array)
     is_high_array = isinstance(high, Array)
 
     vdims = dim4_to_tuple(val.dims())
-    vty = val.type()
+    vty = val.dtype()
 
     if not is_low_array:
-        low_arr = constant_array(low, vdims[0], vdims[1], vdims[2], vdims[3], vty)
-    else:
-        low_arr = low.arr
+        low = _scalar_array(low, vty, vdims)
 
     if not is_high_array:
-        high_arr = constant_array(high, vdims[0], vdims[1], vdims[2], vdims[3], vty)
-    else:
-        high_arr = high.arr
+        high = _scalar_array(high, vty, vdims)
 
-    safe_call(backend.get().af_clamp(c_pointer(out.arr), val.arr, low_arr, high_arr, _bcast_var.get()))
+    c_func = backend.get().af_clamp
+    batch = _bcast_var.get()
+    safe_call(c_func(c_pointer(res.arr), val.arr, low.arr, high.arr, batch))
 
-    return out
+    return _to_out(_track_pending(res, c_func, val, low, high, batch), out)
 
-def mod(lhs, rhs):
+def mod(lhs, rhs, out=None):
     """
     Find the modulus.
     Parameters
@@ -173,6 +185,8 @@ def mod(lhs, rhs):
           Multi dimensional arrayfire array or a scalar number.
     rhs : af.Array or scalar
           Multi dimensional arrayfire array or a scalar number.
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
     Returns
     --------
     out : af.Array
@@ -182,9 +196,9 @@ def mod(lhs, rhs):
     - Atleast one of `lhs` and `rhs` needs to be af.Array.
     - If `lhs` and `rhs` are both af.Array, they must be of same size.
     """
-    return _arith_binary_func(lhs, rhs, backend.get().af_mod)
+    return _arith_binary_func(lhs, rhs, backend.get().af_mod, out)
 
-def rem(lhs, rhs):
+def rem(lhs, rhs, out=None):
     """
     Find the remainder.
 
@@ -196,6 +210,9 @@ def rem(lhs, rhs):
     rhs : af.Array or scalar
           Multi dimensional arrayfire array or a scalar number.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
@@ -206,9 +223,9 @@ def rem(lhs, rhs):
     - Atleast one of `lhs` and `rhs` needs to be af.Array.
     - If `lhs` and `rhs` are both af.Array, they must be of same size.
     """
-    return _arith_binary_func(lhs, rhs, backend.get().af_rem)
+    return _arith_binary_func(lhs, rhs, backend.get().af_rem, out)
 
-def abs(a):
+def abs(a, out=None):
     """
     Find the absolute values.
 
@@ -217,14 +234,17 @@ def abs(a):
     a : af.Array
         Multi dimensional arrayfire array.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
          Contains the absolute values of the inputs.
     """
-    return _arith_unary_func(a, backend.get().af_abs)
+    return _arith_unary_func(a, backend.get().af_abs, out)
 
-def arg(a):
+def arg(a, out=None):
     """
     Find the theta value of the inputs in polar co-ordinates.
 
@@ -233,14 +253,17 @@ def arg(a):
     a : af.Array
         Multi dimensional arrayfire array.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
          Contains the theta values.
     """
-    return _arith_unary_func(a, backend.get().af_arg)
+    return _arith_unary_func(a, backend.get().af_arg, out)
 
-def sign(a):
+def sign(a, out=None):
     """
     Find the sign of the inputs.
 
@@ -249,14 +272,17 @@ def sign(a):
     a : af.Array
         Multi dimensional arrayfire array.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
          array containing 1 for negative values, 0 otherwise.
     """
-    return _arith_unary_func(a, backend.get().af_sign)
+    return _arith_unary_func(a, backend.get().af_sign, out)
 
-def round(a):
+def round(a, out=None):
     """
     Round the values to nearest integer.
 
@@ -265,14 +291,17 @@ def round(a):
     a : af.Array
         Multi dimensional arrayfire array.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
          array containing the values rounded to nearest integer.
     """
-    return _arith_unary_func(a, backend.get().af_round)
+    return _arith_unary_func(a, backend.get().af_round, out)
 
-def trunc(a):
+def trunc(a, out=None):
     """
     Round the values towards zero.
 
@@ -281,14 +310,17 @@ def trunc(a):
     a : af.Array
         Multi dimensional arrayfire array.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
          array containing the truncated values.
     """
-    return _arith_unary_func(a, backend.get().af_trunc)
+    return _arith_unary_func(a, backend.get().af_trunc, out)
 
-def floor(a):
+def floor(a, out=None):
     """
     Round the values towards a smaller integer.
 
@@ -297,14 +329,17 @@ def floor(a):
     a : af.Array
         Multi dimensional arrayfire array.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
          array containing the floored values.
     """
-    return _arith_unary_func(a, backend.get().af_floor)
+    return _arith_unary_func(a, backend.get().af_floor, out)
 
-def ceil(a):
+def ceil(a, out=None):
     """
     Round the values towards a bigger integer.
 
@@ -313,14 +348,17 @@ def ceil(a):
     a : af.Array
         Multi dimensional arrayfire array.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
          array containing the ceiled values.
     """
-    return _arith_unary_func(a, backend.get().af_ceil)
+    return _arith_unary_func(a, backend.get().af_ceil, out)
 
-def hypot(lhs, rhs):
+def hypot(lhs, rhs, out=None):
     """
     Find the value of the hypotunese.
 
@@ -332,6 +370,9 @@ def hypot(lhs, rhs):
     rhs : af.Array or scalar
           Multi dimensional arrayfire array or a scalar number.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
@@ -342,9 +383,9 @@ def hypot(lhs, rhs):
     - Atleast one of `lhs` and `rhs` needs to be af.Array.
     - If `lhs` and `rhs` are both af.Array, they must be of same size.
     """
-    return _arith_binary_func(lhs, rhs, backend.get().af_hypot)
+    return _arith_binary_func(lhs, rhs, backend.get().af_hypot, out)
 
-def sin(a):
+def sin(a, out=None):
     """
     Sine of each element in the array.
 
@@ -353,6 +394,9 @@ def sin(a):
     a : af.Array
         Multi dimensional arrayfire array.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
@@ -362,9 +406,9 @@ def sin(a):
     -------
     `a` must not be complex.
     """
-    return _arith_unary_func(a, backend.get().af_sin)
+    return _arith_unary_func(a, backend.get().af_sin, out)
 
-def cos(a):
+def cos(a, out=None):
     """
     Cosine of each element in the array.
 
@@ -373,6 +417,9 @@ def cos(a):
     a : af.Array
         Multi dimensional arrayfire array.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
@@ -382,9 +429,9 @@ def cos(a):
     -------
     `a` must not be complex.
     """
-    return _arith_unary_func(a, backend.get().af_cos)
+    return _arith_unary_func(a, backend.get().af_cos, out)
 
-def tan(a):
+def tan(a, out=None):
     """
     Tangent of each element in the array.
 
@@ -393,6 +440,9 @@ def tan(a):
     a : af.Array
         Multi dimensional arrayfire array.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
@@ -402,9 +452,9 @@ def tan(a):
     -------
     `a` must not be complex.
     """
-    return _arith_unary_func(a, backend.get().af_tan)
+    return _arith_unary_func(a, backend.get().af_tan, out)
 
-def asin(a):
+def asin(a, out=None):
     """
     Arc Sine of each element in the array.
 
@@ -413,6 +463,9 @@ def asin(a):
     a : af.Array
         Multi dimensional arrayfire array.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
@@ -422,9 +475,9 @@ def asin(a):
     -------
     `a` must not be complex.
     """
-    return _arith_unary_func(a, backend.get().af_asin)
+    return _arith_unary_func(a, backend.get().af_asin, out)
 
-def acos(a):
+def acos(a, out=None):
     """
     Arc Cosine of each element in the array.
 
@@ -433,6 +486,9 @@ def acos(a):
     a : af.Array
         Multi dimensional arrayfire array.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
@@ -442,9 +498,9 @@ def acos(a):
     -------
     `a` must not be complex.
     """
-    return _arith_unary_func(a, backend.get().af_acos)
+    return _arith_unary_func(a, backend.get().af_acos, out)
 
-def atan(a):
+def atan(a, out=None):
     """
     Arc Tangent of each element in the array.
 
@@ -453,6 +509,9 @@ def atan(a):
     a : af.Array
         Multi dimensional arrayfire array.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
@@ -462,9 +521,9 @@ def atan(a):
     -------
     `a` must not be complex.
     """
-    return _arith_unary_func(a, backend.get().af_atan)
+    return _arith_unary_func(a, backend.get().af_atan, out)
 
-def atan2(lhs, rhs):
+def atan2(lhs, rhs, out=None):
     """
     Find the arc tan using two values.
 
@@ -476,6 +535,9 @@ def atan2(lhs, rhs):
     rhs : af.Array or scalar
           Multi dimensional arrayfire array or a scalar number.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
@@ -488,9 +550,9 @@ def atan2(lhs, rhs):
     - Atleast one of `lhs` and `rhs` needs to be af.Array.
     - If `lhs` and `rhs` are both af.Array, they must be of same size.
     """
-    return _arith_binary_func(lhs, rhs, backend.get().af_atan2)
+    return _arith_binary_func(lhs, rhs, backend.get().af_atan2, out)
 
-def cplx(lhs, rhs=None):
+def cplx(lhs, rhs=None, out=None):
     """
     Create a complex array from real inputs.
 
@@ -502,6 +564,9 @@ def cplx(lhs, rhs=None):
     rhs : optional: af.Array or scalar. default: None.
           Multi dimensional arrayfire array or a scalar number.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
@@ -515,11 +580,11 @@ def cplx(lhs, rhs=None):
     - If `lhs` and `rhs` are both af.Array, they must be of same size.
     """
     if rhs is None:
-        return _arith_unary_func(lhs, backend.get().af_cplx)
+        return _arith_unary_func(lhs, backend.get().af_cplx, out)
     else:
-        return _arith_binary_func(lhs, rhs, backend.get().af_cplx2)
+        return _arith_binary_func(lhs, rhs, backend.get().af_cplx2, out)
 
-def real(a):
+def real(a, out=None):
     """
     Find the real values of the input.
 
@@ -528,15 +593,18 @@ def real(a):
     a : af.Array
         Multi dimensional arrayfire array.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
          array containing the real values from `a`.
 
     """
-    return _arith_unary_func(a, backend.get().af_real)
+    return _arith_unary_func(a, backend.get().af_real, out)
 
-def imag(a):
+def imag(a, out=None):
     """
     Find the imaginary values of the input.
 
@@ -545,14 +613,17 @@ def imag(a):
     a : af.Array
         Multi dimensional arrayfire array.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
          array containing the imaginary values from `a`.
     """
-    return _arith_unary_func(a, backend.get().af_imag)
+    return _arith_unary_func(a, backend.get().af_imag, out)
 
-def conjg(a):
+def conjg(a, out=None):
     """
     Find the complex conjugate values of the input.
 
@@ -561,14 +632,17 @@ def conjg(a):
     a : af.Array
         Multi dimensional arrayfire array.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
          array containing copmplex conjugate values from `a`.
     """
-    return _arith_unary_func(a, backend.get().af_conjg)
+    return _arith_unary_func(a, backend.get().af_conjg, out)
 
-def sinh(a):
+def sinh(a, out=None):
     """
     Hyperbolic Sine of each element in the array.
 
@@ -577,6 +651,9 @@ def sinh(a):
     a : af.Array
         Multi dimensional arrayfire array.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
@@ -586,9 +663,9 @@ def sinh(a):
     -------
     `a` must not be complex.
     """
-    return _arith_unary_func(a, backend.get().af_sinh)
+    return _arith_unary_func(a, backend.get().af_sinh, out)
 
-def cosh(a):
+def cosh(a, out=None):
     """
     Hyperbolic Cosine of each element in the array.
 
@@ -597,6 +674,9 @@ def cosh(a):
     a : af.Array
         Multi dimensional arrayfire array.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
@@ -606,9 +686,9 @@ def cosh(a):
     -------
     `a` must not be complex.
     """
-    return _arith_unary_func(a, backend.get().af_cosh)
+    return _arith_unary_func(a, backend.get().af_cosh, out)
 
-def tanh(a):
+def tanh(a, out=None):
     """
     Hyperbolic Tangent of each element in the array.
 
@@ -617,6 +697,9 @@ def tanh(a):
     a : af.Array
         Multi dimensional arrayfire array.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
@@ -626,9 +709,9 @@ def tanh(a):
     -------
     `a` must not be complex.
     """
-    return _arith_unary_func(a, backend.get().af_tanh)
+    return _arith_unary_func(a, backend.get().af_tanh, out)
 
-def asinh(a):
+def asinh(a, out=None):
     """
     Arc Hyperbolic Sine of each element in the array.
 
@@ -637,6 +720,9 @@ def asinh(a):
     a : af.Array
         Multi dimensional arrayfire array.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
@@ -646,9 +732,9 @@ def asinh(a):
     -------
     `a` must not be complex.
     """
-    return _arith_unary_func(a, backend.get().af_asinh)
+    return _arith_unary_func(a, backend.get().af_asinh, out)
 
-def acosh(a):
+def acosh(a, out=None):
     """
     Arc Hyperbolic Cosine of each element in the array.
 
@@ -657,6 +743,9 @@ def acosh(a):
     a : af.Array
         Multi dimensional arrayfire array.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
@@ -666,9 +755,9 @@ def acosh(a):
     -------
     `a` must not be complex.
     """
-    return _arith_unary_func(a, backend.get().af_acosh)
+    return _arith_unary_func(a, backend.get().af_acosh, out)
 
-def atanh(a):
+def atanh(a, out=None):
     """
     Arc Hyperbolic Tangent of each element in the array.
 
@@ -677,6 +766,9 @@ def atanh(a):
     a : af.Array
         Multi dimensional arrayfire array.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
@@ -686,9 +778,9 @@ def atanh(a):
     -------
     `a` must not be complex.
     """
-    return _arith_unary_func(a, backend.get().af_atanh)
+    return _arith_unary_func(a, backend.get().af_atanh, out)
 
-def root(lhs, rhs):
+def root(lhs, rhs, out=None):
     """
     Find the root values of two inputs at each location.
 
@@ -700,6 +792,9 @@ def root(lhs, rhs):
     rhs : af.Array or scalar
           Multi dimensional arrayfire array or a scalar number.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
@@ -710,9 +805,9 @@ def root(lhs, rhs):
     - Atleast one of `lhs` and `rhs` needs to be af.Array.
     - If `lhs` and `rhs` are both af.Array, they must be of same size.
     """
-    return _arith_binary_func(lhs, rhs, backend.get().af_root)
+    return _arith_binary_func(lhs, rhs, backend.get().af_root, out)
 
-def pow(lhs, rhs):
+def pow(lhs, rhs, out=None):
     """
     Find the power of two inputs at each location.
 
@@ -724,6 +819,9 @@ def pow(lhs, rhs):
     rhs : af.Array or scalar
           Multi dimensional arrayfire array or a scalar number.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
@@ -734,9 +832,9 @@ def pow(lhs, rhs):
     - Atleast one of `lhs` and `rhs` needs to be af.Array.
     - If `lhs` and `rhs` are both af.Array, they must be of same size.
     """
-    return _arith_binary_func(lhs, rhs, backend.get().af_pow)
+    return _arith_binary_func(lhs, rhs, backend.get().af_pow, out)
 
-def pow2(a):
+def pow2(a, out=None):
     """
     Raise 2 to the power of each element in input.
 
@@ -745,6 +843,9 @@ def pow2(a):
     a : af.Array
         Multi dimensional arrayfire array.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
@@ -754,9 +855,9 @@ def pow2(a):
     -------
     `a` must not be complex.
     """
-    return _arith_unary_func(a, backend.get().af_pow2)
+    return _arith_unary_func(a, backend.get().af_pow2, out)
 
-def sigmoid(a):
+def sigmoid(a, out=None):
     """
     Raise 2 to the power of each element in input.
 
@@ -765,6 +866,9 @@ def sigmoid(a):
     a : af.Array
         Multi dimensional arrayfire array.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
@@ -774,9 +878,9 @@ def sigmoid(a):
     -------
     `a` must not be complex.
     """
-    return _arith_unary_func(a, backend.get().af_sigmoid)
+    return _arith_unary_func(a, backend.get().af_sigmoid, out)
 
-def exp(a):
+def exp(a, out=None):
     """
     Exponential of each element in the array.
 
@@ -785,6 +889,9 @@ def exp(a):
     a : af.Array
         Multi dimensional arrayfire array.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
@@ -794,9 +901,9 @@ def exp(a):
     -------
     `a` must not be complex.
     """
-    return _arith_unary_func(a, backend.get().af_exp)
+    return _arith_unary_func(a, backend.get().af_exp, out)
 
-def expm1(a):
+def expm1(a, out=None):
     """
     Exponential of each element in the array minus 1.
 
@@ -805,6 +912,9 @@ def expm1(a):
     a : af.Array
         Multi dimensional arrayfire array.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
@@ -815,9 +925,9 @@ def expm1(a):
     - `a` must not be complex.
     - This function provides a more stable result for small values of `a`.
     """
-    return _arith_unary_func(a, backend.get().af_expm1)
+    return _arith_unary_func(a, backend.get().af_expm1, out)
 
-def erf(a):
+def erf(a, out=None):
     """
     Error function of each element in the array.
 
@@ -826,6 +936,9 @@ def erf(a):
     a : af.Array
         Multi dimensional arrayfire array.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
@@ -835,9 +948,9 @@ def erf(a):
     -------
     `a` must not be complex.
     """
-    return _arith_unary_func(a, backend.get().af_erf)
+    return _arith_unary_func(a, backend.get().af_erf, out)
 
-def erfc(a):
+def erfc(a, out=None):
     """
     Complementary error function of each element in the array.
 
@@ -846,6 +959,9 @@ def erfc(a):
     a : af.Array
         Multi dimensional arrayfire array.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
@@ -855,9 +971,9 @@ def erfc(a):
     -------
     `a` must not be complex.
     """
-    return _arith_unary_func(a, backend.get().af_erfc)
+    return _arith_unary_func(a, backend.get().af_erfc, out)
 
-def log(a):
+def log(a, out=None):
     """
     Natural logarithm of each element in the array.
 
@@ -866,6 +982,9 @@ def log(a):
     a : af.Array
         Multi dimensional arrayfire array.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
@@ -875,9 +994,9 @@ def log(a):
     -------
     `a` must not be complex.
     """
-    return _arith_unary_func(a, backend.get().af_log)
+    return _arith_unary_func(a, backend.get().af_log, out)
 
-def log1p(a):
+def log1p(a, out=None):
     """
     Logarithm of each element in the array plus 1.
 
@@ -886,6 +1005,9 @@ def log1p(a):
     a : af.Array
         Multi dimensional arrayfire array.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
@@ -896,9 +1018,9 @@ def log1p(a):
     - `a` must not be complex.
     - This function provides a more stable result for small values of `a`.
     """
-    return _arith_unary_func(a, backend.get().af_log1p)
+    return _arith_unary_func(a, backend.get().af_log1p, out)
 
-def log10(a):
+def log10(a, out=None):
     """
     Logarithm base 10 of each element in the array.
 
@@ -907,6 +1029,9 @@ def log10(a):
     a : af.Array
         Multi dimensional arrayfire array.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
@@ -916,9 +1041,9 @@ def log10(a):
     -------
     `a` must not be complex.
     """
-    return _arith_unary_func(a, backend.get().af_log10)
+    return _arith_unary_func(a, backend.get().af_log10, out)
 
-def log2(a):
+def log2(a, out=None):
     """
     Logarithm base 2 of each element in the array.
 
@@ -927,6 +1052,9 @@ def log2(a):
     a : af.Array
         Multi dimensional arrayfire array.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
@@ -936,9 +1064,9 @@ def log2(a):
     -------
     `a` must not be complex.
     """
-    return _arith_unary_func(a, backend.get().af_log2)
+    return _arith_unary_func(a, backend.get().af_log2, out)
 
-def sqrt(a):
+def sqrt(a, out=None):
     """
     Square root of each element in the array.
 
@@ -947,6 +1075,9 @@ def sqrt(a):
     a : af.Array
         Multi dimensional arrayfire array.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
@@ -956,9 +1087,9 @@ def sqrt(a):
     -------
     `a` must not be complex.
     """
-    return _arith_unary_func(a, backend.get().af_sqrt)
+    return _arith_unary_func(a, backend.get().af_sqrt, out)
 
-def rsqrt(a):
+def rsqrt(a, out=None):
     """
     Reciprocal or inverse square root of each element in the array.
 
@@ -967,6 +1098,9 @@ def rsqrt(a):
     a : af.Array
         Multi dimensional arrayfire array.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
@@ -976,9 +1110,9 @@ def rsqrt(a):
     -------
     `a` must not be complex.
     """
-    return _arith_unary_func(a, backend.get().af_rsqrt)
+    return _arith_unary_func(a, backend.get().af_rsqrt, out)
 
-def cbrt(a):
+def cbrt(a, out=None):
     """
     Cube root of each element in the array.
 
@@ -987,6 +1121,9 @@ def cbrt(a):
     a : af.Array
         Multi dimensional arrayfire array.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
@@ -996,9 +1133,9 @@ def cbrt(a):
     -------
     `a` must not be complex.
     """
-    return _arith_unary_func(a, backend.get().af_cbrt)
+    return _arith_unary_func(a, backend.get().af_cbrt, out)
 
-def factorial(a):
+def factorial(a, out=None):
     """
     factorial of each element in the array.
 
@@ -1007,6 +1144,9 @@ def factorial(a):
     a : af.Array
         Multi dimensional arrayfire array.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
@@ -1016,9 +1156,9 @@ def factorial(a):
     -------
     `a` must not be complex.
     """
-    return _arith_unary_func(a, backend.get().af_factorial)
+    return _arith_unary_func(a, backend.get().af_factorial, out)
 
-def tgamma(a):
+def tgamma(a, out=None):
     """
     Performs the gamma function for each element in the array.
 
@@ -1027,6 +1167,9 @@ def tgamma(a):
     a : af.Array
         Multi dimensional arrayfire array.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
@@ -1036,9 +1179,9 @@ def tgamma(a):
     -------
     `a` must not be complex.
     """
-    return _arith_unary_func(a, backend.get().af_tgamma)
+    return _arith_unary_func(a, backend.get().af_tgamma, out)
 
-def lgamma(a):
+def lgamma(a, out=None):
     """
     Performs the logarithm of gamma function for each element in the array.
 
@@ -1047,6 +1190,9 @@ def lgamma(a):
     a : af.Array
         Multi dimensional arrayfire array.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
@@ -1056,9 +1202,9 @@ def lgamma(a):
     -------
     `a` must not be complex.
     """
-    return _arith_unary_func(a, backend.get().af_lgamma)
+    return _arith_unary_func(a, backend.get().af_lgamma, out)
 
-def iszero(a):
+def iszero(a, out=None):
     """
     Check if each element of the input is zero.
 
@@ -1067,6 +1213,9 @@ def iszero(a):
     a : af.Array
         Multi dimensional arrayfire array.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
@@ -1076,9 +1225,9 @@ def iszero(a):
     -------
     `a` must not be complex.
     """
-    return _arith_unary_func(a, backend.get().af_iszero)
+    return _arith_unary_func(a, backend.get().af_iszero, out)
 
-def isinf(a):
+def isinf(a, out=None):
     """
     Check if each element of the input is infinity.
 
@@ -1087,6 +1236,9 @@ def isinf(a):
     a : af.Array
         Multi dimensional arrayfire array.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
@@ -1096,9 +1248,9 @@ def isinf(a):
     -------
     `a` must not be complex.
     """
-    return _arith_unary_func(a, backend.get().af_isinf)
+    return _arith_unary_func(a, backend.get().af_isinf, out)
 
-def isnan(a):
+def isnan(a, out=None):
     """
     Check if each element of the input is NaN.
 
@@ -1107,6 +1259,9 @@ def isnan(a):
     a : af.Array
         Multi dimensional arrayfire array.
 
+    out : optional: af.Array. default: None.
+        Array to store the result in, it is also returned.
+
     Returns
     --------
     out : af.Array
@@ -1116,4 +1271,4 @@ def isnan(a):
     -------
     `a` must not be complex.
     """
-    return _arith_unary_func(a, backend.get().af_isnan)
+    return _arith_unary_func(a, backend.get().af_isnan, out)
@@ -11,15 +11,19 @@
 Array class and helper functions.
 """
 
-import inspect
 import os
+import struct
+import sys
+import threading
+import weakref
+from collections import OrderedDict
 from .library import *
 from .util import *
 from .util import _is_number
 from .bcast import _bcast_var
 from .base import *
 from .index import *
-from .index import _Index4
+from .index import _Index4, _cached_index_plan
 
 _is_running_in_py_charm = "PYCHARM_HOSTED" in os.environ
 
@@ -67,6 +71,127 @@ def get_display_dims_limit():
     """
     return _display_dims_limit
 
+_display_summary = (1000, 3, False)
+
+def set_display_summary(threshold=1000, edge_items=3, stats=False):
+    """
+    Sets when the result of str(arr) shows a summary instead of the whole array.
+
+    Arrays with more than `threshold` elements are summarized: only the first
+    and last `edge_items` entries along each dimension are copied to the host
+    and shown, the others are replaced by "...".
+
+    Parameters
+    ----------
+    threshold : optional: int. default: 1000.
+        Number of elements above which arrays are summarized, None to never summarize.
+
+    edge_items : optional: int. default: 3.
+        Number of entries shown at the beginning and end of each dimension.
+
+    stats : optional: bool. default: False.
+        Also show the minimum, maximum and mean of the whole array, computed on the device.
+
+    Example
+    -------
+    set_display_summary(100, 2, stats=True)
+
+    """
+    global _display_summary
+    if edge_items < 1:
+        raise RuntimeError("edge_items must be at least 1")
+    _display_summary = (threshold, int(edge_items), bool(stats))
+
+def get_display_summary():
+    """
+    Gets the settings used to summarize the result of str(arr).
+
+    Returns
+    -----------
+        - tuple of (threshold, edge_items, stats)
+
+    Example
+    -------
+    get_display_summary()
+    # (1000, 3, False)
+
+    """
+    return _display_summary
+
+_storage_policy = None
+
+def set_storage_dtype(dtype=None, compute_dtype=Dtype.f32, min_elements=1 << 16):
+    """
+    Sets the type large floating point arrays are stored in on the device.
+
+    Floating point numpy arrays with at least `min_elements` elements are converted
+    to `dtype` on the host before they are uploaded, halving the memory and the
+    transfer volume for Dtype.f16. Arrays of type `dtype` are cast to `compute_dtype`
+    when used in arithmetic, reductions and matmul, so that results are computed
+    and returned in `compute_dtype`.
+
+    Parameters
+    ----------
+    dtype : optional: af.Dtype. default: None.
+        Dtype.f16 or Dtype.f32. None disables the policy.
+
+    compute_dtype : optional: af.Dtype. default: Dtype.f32.
+        Dtype.f32 or Dtype.f64, must be wider than `dtype`.
+
+    min_elements : optional: int. default: 65536.
+        Smaller arrays are uploaded in their own type.
+
+    Example
+    -------
+    set_storage_dtype(Dtype.f16)
+    w = af.np_to_af_array(weights)    # Stored as f16
+    y = af.matmul(w, x)               # Computed as f32
+
+    Note
+    -----
+    - In place operators (a += b, ...) store the result in `compute_dtype`.
+    """
+    global _storage_policy
+    if dtype is None:
+        _storage_policy = None
+        return
+    if dtype not in (Dtype.f16, Dtype.f32):
+        raise TypeError("Storage dtype must be Dtype.f16 or Dtype.f32")
+    if compute_dtype not in (Dtype.f32, Dtype.f64) or compute_dtype == dtype:
+        raise TypeError("Compute dtype must be Dtype.f32 or Dtype.f64 and wider than the storage dtype")
+    _storage_policy = (dtype, compute_dtype, int(min_elements))
+
+def get_storage_dtype():
+    """
+    Gets the storage dtype policy.
+
+    Returns
+    -----------
+        - tuple of (dtype, compute_dtype, min_elements)
+        - None if there is no policy
+
+    """
+    return _storage_policy
+
+def _storage_dtype(dtype, elements):
+    """
+    Internal function returning the type floating point data of `dtype` is uploaded as, None to keep it.
+    """
+    policy = _storage_policy
+    if (policy is None or elements < policy[2] or dtype not in (Dtype.f32, Dtype.f64) or
+        ct.sizeof(to_c_type[dtype.value]) <= ct.sizeof(to_c_type[policy[0].value])):
+        return None
+    return policy[0]
+
+def _compute_operand(a):
+    """
+    Internal function casting arrays stored in the storage dtype to the compute dtype.
+    """
+    policy = _storage_policy
+    if policy is None or not isinstance(a, Array) or a.type() != policy[0].value:
+        return a
+    return cast(a, policy[1])
+
 def _in_display_dims_limit(dims):
     if _is_running_in_py_charm:
         return False
@@ -160,66 +285,368 @@ def constant_array(val, d0, d1=None, d2=None, d3=None, dtype=Dtype.f32):
     return out
 
 
+_scalar_cache = OrderedDict()
+_scalar_cache_size = 64
+_scalar_cache_lock = threading.Lock()
+
+def _scalar_array(val, dtype, dims=(1, 1, 1, 1)):
+    """
+    Internal function returning an af.Array of shape `dims` filled with `val`.
+
+    Single element arrays are shared through a small LRU cache keyed by (value, dtype)
+    and the backend and device active on the calling thread, so the result must never
+    be modified by the caller.
+    """
+    # 0 and -0.0 (and nan != nan) compare equal (unequal) but are different constants.
+    # Larger constants are not cached, they would keep their device memory alive.
+    if not val or val != val or dims[0] * dims[1] * dims[2] * dims[3] != 1:
+        out = Array()
+        out.arr = constant_array(val, dims[0], dims[1], dims[2], dims[3], dtype)
+    else:
+        # The active backend and device are per thread, the cache is shared by all threads
+        key = (val, dtype.value) + _thread_context()
+        with _scalar_cache_lock:
+            out = _scalar_cache.get(key)
+            if out is not None:
+                _scalar_cache.move_to_end(key)
+
+        if out is None:
+            out = Array()
+            out.arr = constant_array(val, dims[0], dims[1], dims[2], dims[3], dtype)
+            with _scalar_cache_lock:
+                _scalar_cache[key] = out
+                while len(_scalar_cache) > _scalar_cache_size:
+                    _scalar_cache.popitem(last=False)
+
+    if _pending_eval.trace is not None:
+        _pending_eval.trace.add_constant(out)
+    return out
+
+# Bumped whenever cached handles become stale
+_cache_generation = 0
+
+def _clear_scalar_cache():
+    """
+    Release the cached constants. Called when the active backend or device changes.
+    """
+    global _cache_generation
+    with _scalar_cache_lock:
+        _scalar_cache.clear()
+        _cache_generation += 1
+
+class _EvalState(threading.local):
+    """
+    Per thread state of the batched_eval contexts and fuse traces.
+    """
+    arrays = None
+    limit = 256
+    depth = 0
+    trace = None
+
+_pending_eval = _EvalState()
+
+def _track_pending(out, c_func=None, *args):
+    """
+    Internal function recording `out` for the active batched_eval context, if any.
+
+    `c_func` and `args` are the C function and the arguments after the output
+    pointer that produced `out`, recorded by the active fuse trace, if any.
+    """
+    if _pending_eval.trace is not None:
+        _pending_eval.trace.record(out, c_func, args)
+
+    pending = _pending_eval.arrays
+    if pending is not None:
+        pending.append(weakref.ref(out))
+        # Drop the temporaries that have already been collected
+        if len(pending) >= _pending_eval.limit:
+            pending[:] = [ref for ref in pending if ref() is not None]
+            _pending_eval.limit = max(256, 2 * len(pending))
+    return out
+
+def _replace_handle(out, res):
+    """
+    Internal function moving the af_array of `res` into `out`.
+
+    The previous af_array of `out` is released along with `res`.
+    """
+    if _pending_eval.trace is not None:
+        _pending_eval.trace.replace(out)
+
+    out.arr, res.arr = res.arr, out.arr
+    out._dims, res._dims = res._dims, out._dims
+    out._numdims, res._numdims = res._numdims, out._numdims
+    out._elements, res._elements = res._elements, out._elements
+    out._dtype, res._dtype = res._dtype, out._dtype
+
+    if _pending_eval.arrays is not None:
+        _pending_eval.arrays.append(weakref.ref(out))
+    return out
+
+def _shares_data(a):
+    """
+    Internal function checking if another af_array holds the memory of `a`.
+    """
+    count = c_int_t(0)
+    safe_call(backend.get().af_get_data_ref_count(c_pointer(count), a.arr))
+    return count.value > 1
+
+def _to_out(res, out):
+    """
+    Internal function storing the result `res` in the user provided array `out`, if any.
+
+    The af_array of `res` replaces the one of `out`, the memory of `out` is not reused.
+    """
+    if out is None or out is res:
+        return res
+
+    if not isinstance(out, Array):
+        raise TypeError("out must be of type arrayfire.Array")
+
+    if out.arr.value:
+        if out.type() != res.type():
+            raise TypeError("out is not the same type as the result")
+        if out.dims() != res.dims():
+            raise RuntimeError("out dims do not match those of the result")
+
+    return _replace_handle(out, res)
+
+def _eval_grouped(arrays):
+    """
+    Internal function evaluating `arrays` with one af_eval_multiple call per distinct shape.
+    """
+    groups = OrderedDict()
+    handles = set()
+    for arr in arrays:
+        if arr.arr.value and arr.arr.value not in handles:
+            handles.add(arr.arr.value)
+            groups.setdefault(arr.dims(), []).append(arr.arr)
+
+    for group in groups.values():
+        if len(group) == 1:
+            safe_call(backend.get().af_eval(group[0]))
+        else:
+            c_arrs = (c_void_ptr_t * len(group))(*group)
+            safe_call(backend.get().af_eval_multiple(c_int_t(len(group)), c_pointer(c_arrs)))
+
+def _flush_pending():
+    """
+    Internal function evaluating the live arrays recorded by the active batched_eval context.
+    """
+    if _pending_eval.trace is not None:
+        # Host reads can not be replayed
+        _pending_eval.trace.valid = False
+
+    pending = _pending_eval.arrays
+    if pending:
+        arrays = [ref() for ref in pending]
+        del pending[:]
+        _eval_grouped([arr for arr in arrays if arr is not None])
+
 def _binary_func(lhs, rhs, c_func):
     out = Array()
-    other = rhs
+    lhs = _compute_operand(lhs)
+    rhs = _compute_operand(rhs)
 
     if (_is_number(rhs)):
-        ldims = dim4_to_tuple(lhs.dims())
+        # 1 element constant, broadcast by arrayfire to the shape of lhs
         rty = implicit_dtype(rhs, lhs.type())
-        other = Array()
-        other.arr = constant_array(rhs, ldims[0], ldims[1], ldims[2], ldims[3], rty.value)
-    elif not isinstance(rhs, Array):
+        rhs = _scalar_array(rhs, rty)
+        batch = True
+    elif isinstance(rhs, Array):
+        batch = _bcast_var.get()
+    else:
         raise TypeError("Invalid parameter to binary function")
 
-    safe_call(c_func(c_pointer(out.arr), lhs.arr, other.arr, _bcast_var.get()))
-
-    return out
+    safe_call(c_func(c_pointer(out.arr), lhs.arr, rhs.arr, batch))
+    return _track_pending(out, c_func, lhs, rhs, batch)
 
 def _binary_funcr(lhs, rhs, c_func):
     out = Array()
-    other = lhs
+    lhs = _compute_operand(lhs)
+    rhs = _compute_operand(rhs)
 
     if (_is_number(lhs)):
-        rdims = dim4_to_tuple(rhs.dims())
+        # 1 element constant, broadcast by arrayfire to the shape of rhs
         lty = implicit_dtype(lhs, rhs.type())
-        other = Array()
-        other.arr = constant_array(lhs, rdims[0], rdims[1], rdims[2], rdims[3], lty.value)
-    elif not isinstance(lhs, Array):
+        lhs = _scalar_array(lhs, lty)
+        batch = True
+    elif isinstance(lhs, Array):
+        batch = _bcast_var.get()
+    else:
         raise TypeError("Invalid parameter to binary function")
 
-    c_func(c_pointer(out.arr), other.arr, rhs.arr, _bcast_var.get())
+    safe_call(c_func(c_pointer(out.arr), lhs.arr, rhs.arr, batch))
+    return _track_pending(out, c_func, lhs, rhs, batch)
+
+# Native struct formats of the host data, complex numbers are read as pairs
+_host_format = {Dtype.f32.value : 'f',
+                Dtype.f64.value : 'd',
+                Dtype.b8.value  : 'B',
+                Dtype.u8.value  : 'B',
+                Dtype.s16.value : 'h',
+                Dtype.u16.value : 'H',
+                Dtype.s32.value : 'i',
+                Dtype.u32.value : 'I',
+                Dtype.s64.value : 'q',
+                Dtype.u64.value : 'Q',
+                Dtype.c32.value : 'f',
+                Dtype.c64.value : 'd',
+                Dtype.f16.value : 'e'}
+
+def _get_host_data(arr, dtype, elements):
+    """
+    Internal function copying the data of an af_array to a new bytearray.
+    """
+    buf = bytearray(elements * ct.sizeof(to_c_type[dtype]))
+    if buf:
+        safe_call(backend.get().af_get_data_ptr((c_char_t * len(buf)).from_buffer(buf), arr))
+    return buf
 
-    return out
+def _new_host_array(dtype, elements):
+    """
+    Internal function creating a zero filled array.array to hold the data of an af_array.
+    """
+    host = __import__("array")
+    h_type = to_typecode[dtype]
 
-def _ctype_to_lists(ctype_arr, dim, shape, offset=0):
-    if (dim == 0):
-        return list(ctype_arr[offset : offset + shape[0]])
-    else:
-        dim_len = shape[dim]
-        res = [[]] * dim_len
-        for n in range(dim_len):
-            res[n] = _ctype_to_lists(ctype_arr, dim - 1, shape, offset)
-            offset += shape[0]
-        return res
+    # array.array('l') is only 32 bits wide on some platforms
+    if h_type in ('l', 'L') and host.array(h_type).itemsize != 8:
+        h_type = 'q' if h_type == 'l' else 'Q'
+
+    # array.array has no half type, f16 data is kept as the bits of the halves
+    if h_type == 'e':
+        h_type = 'H'
+
+    return host.array(h_type, [0]) * elements
+
+_async_transfer_limit = 4
+_async_transfer_lock = threading.Lock()
+_async_transfer_executor = None
+_async_transfer_slots = None
+
+def set_async_transfer_limit(limit):
+    """
+    Sets the maximum number of asynchronous device to host transfers in flight.
+
+    Calls to Array.to_host_async and Array.to_ndarray_async block once this
+    many transfers are queued or running, bounding the host memory in use.
+    Default is 4.
+
+    Parameters
+    ----------
+    limit : int
+        Number of transfers allowed in flight, must be at least 1.
+    """
+    global _async_transfer_limit, _async_transfer_slots
+
+    limit = int(limit)
+    if limit < 1:
+        raise RuntimeError("Async transfer limit must be at least 1")
+
+    with _async_transfer_lock:
+        _async_transfer_limit = limit
+        # Transfers already in flight release the semaphore they acquired
+        if _async_transfer_slots is not None:
+            _async_transfer_slots = threading.BoundedSemaphore(limit)
+
+def get_async_transfer_limit():
+    """
+    Gets the maximum number of asynchronous device to host transfers in flight.
+    """
+    return _async_transfer_limit
+
+def _thread_context():
+    """
+    Internal function returning the library, backend and device active on the calling thread.
+    """
+    clib = backend.get()
+    backend_id = None
+    if backend.is_unified():
+        backend_id = c_int_t(0)
+        safe_call(clib.af_get_active_backend(c_pointer(backend_id)))
+        backend_id = backend_id.value
+    device = c_int_t(0)
+    safe_call(clib.af_get_device(c_pointer(device)))
+    return clib, backend_id, device.value
+
+def _enter_thread_context(context):
+    """
+    Internal function activating a context from _thread_context on a worker thread.
+
+    Returns the library of the context.
+    """
+    # The active backend and device are per thread settings in ArrayFire
+    clib, backend_id, device = context
+    if backend_id is not None:
+        safe_call(clib.af_set_backend(backend_id))
+    safe_call(clib.af_set_device(device))
+    return clib
+
+def _run_transfer(context, arr, finish):
+    """
+    Internal function copying an af_array to pinned host memory on the transfer worker.
+    """
+    clib = _enter_thread_context(context)
 
-def _slice_to_length(key, dim):
-    tkey = [key.start, key.stop, key.step]
+    nbytes = arr.elements() * ct.sizeof(to_c_type[arr.type()])
+    if not nbytes:
+        return finish(None, 0)
 
-    if tkey[0] is None:
-        tkey[0] = 0
-    elif tkey[0] < 0:
-        tkey[0] = dim - tkey[0]
+    pool = pinned_pool()
+    ptr = pool.alloc(nbytes)
+    try:
+        safe_call(clib.af_get_data_ptr(c_void_ptr_t(ptr), arr.arr))
+        return finish(ptr, nbytes)
+    finally:
+        pool.free(ptr)
 
-    if tkey[1] is None:
-        tkey[1] = dim
-    elif tkey[1] < 0:
-        tkey[1] = dim - tkey[1]
+def _submit_transfer(arr, finish):
+    """
+    Internal function queueing a device to host copy of `arr`.
+
+    Returns a concurrent.futures.Future holding the result of finish(ptr, nbytes),
+    where ptr points to `nbytes` of pinned host memory valid only during the call.
+    """
+    global _async_transfer_executor, _async_transfer_slots
 
-    if tkey[2] is None:
-        tkey[2] = 1
+    with _async_transfer_lock:
+        if _async_transfer_executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            _async_transfer_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="arrayfire-transfer")
+            _async_transfer_slots = threading.BoundedSemaphore(_async_transfer_limit)
+        executor = _async_transfer_executor
+        slots = _async_transfer_slots
 
-    return int(((tkey[1] - tkey[0] - 1) / tkey[2]) + 1)
+    context = _thread_context()
+
+    slots.acquire()
+    try:
+        future = executor.submit(_run_transfer, context, arr, finish)
+    except:
+        slots.release()
+        raise
+    future.add_done_callback(lambda f: slots.release())
+    return future
+
+def _host_to_lists(buf, dtype, shape):
+    """
+    Internal function building nested lists from host data, `shape` is in row major order.
+    """
+    fmt = _host_format[dtype]
+
+    if dtype not in (Dtype.c32.value, Dtype.c64.value, Dtype.f16.value):
+        return memoryview(buf).cast(fmt, shape).tolist()
+
+    if fmt == 'e':
+        res = list(struct.unpack('%de' % (len(buf) // 2), buf))
+    else:
+        flat = memoryview(buf).cast(fmt).tolist()
+        res = [complex(re, im) for re, im in zip(flat[0::2], flat[1::2])]
+
+    for n in reversed(shape[1:]):
+        res = [res[i : i + n] for i in range(0, len(res), n)]
+    return res
 
 def _get_info(dims, buf_len):
     elements = 1
@@ -238,6 +665,103 @@ def _get_info(dims, buf_len):
 
     return numdims, idims
 
+class _py_buffer(ct.Structure):
+    """
+    Py_buffer struct filled by PyObject_GetBuffer. For internal use only.
+    """
+    _fields_ = [("buf", ct.c_void_p),
+                ("obj", ct.c_void_p),
+                ("len", ct.c_ssize_t),
+                ("itemsize", ct.c_ssize_t),
+                ("readonly", ct.c_int),
+                ("ndim", ct.c_int),
+                ("format", ct.c_char_p),
+                ("shape", ct.c_void_p),
+                ("strides", ct.c_void_p),
+                ("suboffsets", ct.c_void_p),
+                ("internal", ct.c_void_p)]
+
+_PyBUF_ANY_CONTIGUOUS = 0x0098
+_PyObject_GetBuffer = ct.PYFUNCTYPE(ct.c_int, ct.py_object, ct.c_void_p, ct.c_int)(("PyObject_GetBuffer", ct.pythonapi))
+_PyBuffer_Release = ct.PYFUNCTYPE(None, ct.c_void_p)(("PyBuffer_Release", ct.pythonapi))
+
+_buffer_format_to_dtype = {'?'  : Dtype.b8,
+                           'b'  : Dtype.b8,
+                           'B'  : Dtype.u8,
+                           'c'  : Dtype.u8,
+                           'e'  : Dtype.f16,
+                           'f'  : Dtype.f32,
+                           'd'  : Dtype.f64,
+                           'Zf' : Dtype.c32,
+                           'Zd' : Dtype.c64}
+
+_buffer_int_to_dtype = {(2, True)  : Dtype.s16,
+                        (2, False) : Dtype.u16,
+                        (4, True)  : Dtype.s32,
+                        (4, False) : Dtype.u32,
+                        (8, True)  : Dtype.s64,
+                        (8, False) : Dtype.u64}
+
+def _buffer_dtype(fmt, itemsize):
+    """
+    Map a PEP 3118 format string to an arrayfire.Dtype.
+    """
+    if fmt[:1] in ('@', '=', '<', '>', '!'):
+        if (fmt[0] in ('>', '!')) != (sys.byteorder == 'big') and fmt[0] not in ('@', '='):
+            raise TypeError("Buffers with non native byte order are not supported")
+        fmt = fmt[1:]
+
+    if fmt in _buffer_format_to_dtype:
+        return _buffer_format_to_dtype[fmt]
+
+    if len(fmt) == 1 and fmt in 'hHiIlLqQnN' and (itemsize, fmt.islower()) in _buffer_int_to_dtype:
+        return _buffer_int_to_dtype[(itemsize, fmt.islower())]
+
+    raise TypeError("Unsupported buffer format: %s" % fmt)
+
+class _host_buffer(object):
+    """
+    Host memory of an object exposing the buffer protocol (PEP 3118). For internal use only.
+
+    The memory of the object is used in place whenever it is contiguous. `ptr` stays
+    valid until `release()` is called.
+
+    Attributes
+    ----------
+    ptr      : int. Address of the first element.
+    length   : int. Number of elements.
+    dtype    : af.Dtype matching the buffer format.
+    shape    : tuple. Shape of the buffer, (length,) for 0 and 1 dimensional buffers.
+    row_major: bool. True if shape is in row major (C) order.
+    """
+
+    def __init__(self, obj):
+        self.__view = None
+        view = memoryview(obj)
+
+        self.dtype = _buffer_dtype(view.format, view.itemsize)
+        self.length = view.nbytes // view.itemsize
+        self.shape = view.shape if view.ndim > 1 else (self.length,)
+        self.row_major = view.ndim > 1 and not view.f_contiguous
+
+        if (len(self.shape) > 4):
+            raise RuntimeError("Buffers with more than 4 dimensions are not supported")
+
+        if not (view.c_contiguous or view.f_contiguous):
+            obj = view.tobytes()
+
+        self.__view = _py_buffer()
+        _PyObject_GetBuffer(obj, ct.addressof(self.__view), _PyBUF_ANY_CONTIGUOUS)
+        self.ptr = self.__view.buf
+
+    def release(self):
+        if self.__view is not None:
+            _PyBuffer_Release(ct.addressof(self.__view))
+            self.__view = None
+            self.ptr = None
+
+    def __del__(self):
+        self.release()
 
 def _get_indices(key):
     inds = _Index4()
@@ -250,52 +774,6 @@ def _get_indices(key):
 
     return inds
 
-def _get_assign_dims(key, idims):
-
-    dims = [1]*4
-
-    for n in range(len(idims)):
-        dims[n] = idims[n]
-
-    if _is_number(key):
-        dims[0] = 1
-        return dims
-    elif isinstance(key, slice):
-        dims[0] = _slice_to_length(key, idims[0])
-        return dims
-    elif isinstance(key, ParallelRange):
-        dims[0] = _slice_to_length(key.S, idims[0])
-        return dims
-    elif isinstance(key, BaseArray):
-        # If the array is boolean take only the number of nonzeros
-        if(key.dtype() is Dtype.b8):
-            dims[0] = int(sum(key))
-        else:
-            dims[0] = key.elements()
-        return dims
-    elif isinstance(key, tuple):
-        n_inds = len(key)
-
-        for n in range(n_inds):
-            if (_is_number(key[n])):
-                dims[n] = 1
-            elif (isinstance(key[n], BaseArray)):
-                # If the array is boolean take only the number of nonzeros
-                if(key[n].dtype() is Dtype.b8):
-                    dims[n] = int(sum(key[n]))
-                else:
-                    dims[n] = key[n].elements()
-            elif (isinstance(key[n], slice)):
-                dims[n] = _slice_to_length(key[n], idims[n])
-            elif (isinstance(key[n], ParallelRange)):
-                dims[n] = _slice_to_length(key[n].S, idims[n])
-            else:
-                raise IndexError("Invalid type while assigning to arrayfire.array")
-
-        return dims
-    else:
-        raise IndexError("Invalid type while assigning to arrayfire.array")
-
 def transpose(a, conj=False):
     """
     Perform the transpose on an input.
@@ -337,6 +815,7 @@ def transpose_inplace(a, conj=False):
 
     """
     safe_call(backend.get().af_transpose_inplace(a.arr, conj))
+    a._reset_meta()
 
 class Array(BaseArray):
 
@@ -345,8 +824,11 @@ class Array(BaseArray):
 
     Parameters
     ----------
-    src : optional: array.array, list or C buffer. default: None.
+    src : optional: array.array, list, buffer or C buffer. default: None.
          - When `src` is `array.array` or `list`, the data is copied to create the Array()
+         - When `src` supports the buffer protocol (bytes, bytearray, memoryview, mmap, ...),
+           the data is copied once, directly from its memory. The dtype is taken from the
+           buffer format and the dims from the buffer shape (row major shapes are reordered).
          - When `src` is None, an empty buffer is created.
 
     dims : optional: tuple of ints. default: (0,)
@@ -415,6 +897,13 @@ class Array(BaseArray):
         3.0000
         4.0000
 
+    Creating an af.Array() from a buffer
+
+    >>> import arrayfire as af
+    >>> b = af.Array(bytearray(b'\\x01\\x02\\x03\\x04'), (2,2))
+    >>> b.dtype()
+    <Dtype.u8: 7>
+
     Creating an af.Array() from numpy.array()
 
     >>> import numpy as np
@@ -443,16 +932,27 @@ class Array(BaseArray):
     # arrayfire's __radd__() instead of numpy's __add__()
     __array_priority__ = 30
 
+    # Metadata of the af_array handle in self.arr, read lazily and cached.
+    # A handle never changes shape or type, so these only need to be reset
+    # when self.arr is replaced or modified in place.
+    # _host_owner keeps alive the memory of other libraries wrapped by the handle, if any.
+    # Arrays derived from the handle (indexed views, lazy results) do not hold it.
+    __slots__ = ['_dims', '_numdims', '_elements', '_dtype', '_host_owner']
+
     def __init__(self, src=None, dims=None, dtype=None, is_device=False, offset=None, strides=None):
 
         super(Array, self).__init__()
+        self._reset_meta()
+        self._host_owner = None
 
         buf=None
         buf_len=0
+        host_buf=None
 
         if dtype is not None:
             if isinstance(dtype, str):
-                type_char = dtype
+                # 'hf' is the former type code of f16
+                type_char = 'e' if dtype == 'hf' else dtype
             else:
                 type_char = to_typecode[dtype.value]
         else:
@@ -464,6 +964,11 @@ class Array(BaseArray):
 
             if (isinstance(src, Array)):
                 safe_call(backend.get().af_retain_array(c_pointer(self.arr), src.arr))
+                self._dims = src._dims
+                self._numdims = src._numdims
+                self._elements = src._elements
+                self._dtype = src._dtype
+                self._host_owner = src._host_owner
                 return
 
             host = __import__("array")
@@ -473,9 +978,14 @@ class Array(BaseArray):
                 _type_char = src.typecode
                 numdims, idims = _get_info(dims, buf_len)
             elif isinstance(src, list):
-                tmp = host.array('f', src)
+                if type_char == 'e':
+                    # array.array has no half type, keep the bits of the halves as unsigned shorts
+                    tmp = host.array('H', struct.pack('%de' % len(src), *src))
+                    _type_char = 'e'
+                else:
+                    tmp = host.array('f', src)
+                    _type_char = tmp.typecode
                 buf,buf_len = tmp.buffer_info()
-                _type_char = tmp.typecode
                 numdims, idims = _get_info(dims, buf_len)
             elif isinstance(src, int) or isinstance(src, c_void_ptr_t):
                 buf = src if not isinstance(src, c_void_ptr_t) else src.value
@@ -495,17 +1005,45 @@ class Array(BaseArray):
                 _type_char = type_char
 
             else:
-                raise TypeError("src is an object of unsupported class")
+                # Any object exposing the buffer protocol (bytes, memoryview, mmap, ...)
+                try:
+                    memoryview(src)
+                except TypeError:
+                    raise TypeError("src is an object of unsupported class")
+
+                host_buf = _host_buffer(src)
+
+                buf = host_buf.ptr
+                buf_len = host_buf.length
+                _type_char = to_typecode[host_buf.dtype.value]
+                if dims:
+                    numdims, idims = _get_info(dims, buf_len)
+                    if idims[0] * idims[1] * idims[2] * idims[3] > buf_len:
+                        host_buf.release()
+                        raise RuntimeError("dims hold more elements than src")
+                else:
+                    shape = tuple(reversed(host_buf.shape)) if host_buf.row_major else host_buf.shape
+                    numdims, idims = _get_info(shape, buf_len)
 
             if (type_char is not None and
                 type_char != _type_char):
                 raise TypeError("Can not create array of requested type from input data type")
-            if(offset is None and strides is None):
-                self.arr = _create_array(buf, numdims, idims, to_dtype[_type_char], is_device)
-            else:
-                self.arr = _create_strided_array(buf, numdims, idims,
-                                                 to_dtype[_type_char],
-                                                 is_device, offset, strides)
+            try:
+                if(offset is None and strides is None):
+                    self.arr = _create_array(buf, numdims, idims, to_dtype[_type_char], is_device)
+                else:
+                    self.arr = _create_strided_array(buf, numdims, idims,
+                                                     to_dtype[_type_char],
+                                                     is_device, offset, strides)
+            finally:
+                if host_buf is not None:
+                    host_buf.release()
+
+            if host_buf is not None and host_buf.row_major and not dims:
+                # Swap in the column major copy, the original handle is released with tmp
+                tmp = self._reorder()
+                self.arr, tmp.arr = tmp.arr, self.arr
+                self._reset_meta()
 
         else:
 
@@ -520,6 +1058,15 @@ class Array(BaseArray):
 
             self.arr = _create_empty_array(numdims, idims, to_dtype[type_char])
 
+    def _reset_meta(self):
+        """
+        Forget the cached metadata. Must be called whenever self.arr is replaced.
+        """
+        self._dims = None
+        self._numdims = None
+        self._elements = None
+        self._dtype = None
+
     def as_type(self, ty):
         """
         Cast current array to a specified data type
@@ -628,9 +1175,11 @@ class Array(BaseArray):
         """
         Return the number of elements in the array.
         """
-        num = c_dim_t(0)
-        safe_call(backend.get().af_get_elements(c_pointer(num), self.arr))
-        return num.value
+        if self._elements is None:
+            num = c_dim_t(0)
+            safe_call(backend.get().af_get_elements(c_pointer(num), self.arr))
+            self._elements = num.value
+        return self._elements
 
     def __len__(self):
         return(self.elements())
@@ -647,9 +1196,11 @@ class Array(BaseArray):
         """
         Return the data type as a arrayfire.Dtype enum value.
         """
-        dty = c_int_t(Dtype.f32.value)
-        safe_call(backend.get().af_get_type(c_pointer(dty), self.arr))
-        return to_dtype[to_typecode[dty.value]]
+        if self._dtype is None:
+            dty = c_int_t(Dtype.f32.value)
+            safe_call(backend.get().af_get_type(c_pointer(dty), self.arr))
+            self._dtype = to_dtype[to_typecode[dty.value]]
+        return self._dtype
 
     def type(self):
         """
@@ -675,14 +1226,15 @@ class Array(BaseArray):
         """
         Return the shape of the array as a tuple.
         """
-        d0 = c_dim_t(0)
-        d1 = c_dim_t(0)
-        d2 = c_dim_t(0)
-        d3 = c_dim_t(0)
-        safe_call(backend.get().af_get_dims(c_pointer(d0), c_pointer(d1),
-                                   c_pointer(d2), c_pointer(d3), self.arr))
-        dims = (d0.value,d1.value,d2.value,d3.value)
-        return dims[:self.numdims()]
+        if self._dims is None:
+            d0 = c_dim_t(0)
+            d1 = c_dim_t(0)
+            d2 = c_dim_t(0)
+            d3 = c_dim_t(0)
+            safe_call(backend.get().af_get_dims(c_pointer(d0), c_pointer(d1),
+                                       c_pointer(d2), c_pointer(d3), self.arr))
+            self._dims = (d0.value,d1.value,d2.value,d3.value)
+        return self._dims[:self.numdims()]
 
     @property
     def shape(self):
@@ -695,9 +1247,11 @@ class Array(BaseArray):
         """
         Return the number of dimensions of the array.
         """
-        nd = c_uint_t(0)
-        safe_call(backend.get().af_get_numdims(c_pointer(nd), self.arr))
-        return nd.value
+        if self._numdims is None:
+            nd = c_uint_t(0)
+            safe_call(backend.get().af_get_numdims(c_pointer(nd), self.arr))
+            self._numdims = nd.value
+        return self._numdims
 
     def is_empty(self):
         """
@@ -849,8 +1403,7 @@ class Array(BaseArray):
         """
         Perform self += other.
         """
-        self = _binary_func(self, other, backend.get().af_add)
-        return self
+        return _replace_handle(self, _binary_func(self, other, backend.get().af_add))
 
     def __radd__(self, other):
         """
@@ -868,8 +1421,7 @@ class Array(BaseArray):
         """
         Perform self -= other.
         """
-        self = _binary_func(self, other, backend.get().af_sub)
-        return self
+        return _replace_handle(self, _binary_func(self, other, backend.get().af_sub))
 
     def __rsub__(self, other):
         """
@@ -887,8 +1439,7 @@ class Array(BaseArray):
         """
         Perform self *= other.
         """
-        self = _binary_func(self, other, backend.get().af_mul)
-        return self
+        return _replace_handle(self, _binary_func(self, other, backend.get().af_mul))
 
     def __rmul__(self, other):
         """
@@ -906,8 +1457,7 @@ class Array(BaseArray):
         """
         Perform self /= other.
         """
-        self =  _binary_func(self, other, backend.get().af_div)
-        return self
+        return _replace_handle(self, _binary_func(self, other, backend.get().af_div))
 
     def __rtruediv__(self, other):
         """
@@ -925,8 +1475,7 @@ class Array(BaseArray):
         """
         Perform other / self.
         """
-        self =  _binary_func(self, other, backend.get().af_div)
-        return self
+        return _replace_handle(self, _binary_func(self, other, backend.get().af_div))
 
     def __rdiv__(self, other):
         """
@@ -944,8 +1493,7 @@ class Array(BaseArray):
         """
         Perform self %= other.
         """
-        self =  _binary_func(self, other, backend.get().af_mod)
-        return self
+        return _replace_handle(self, _binary_func(self, other, backend.get().af_mod))
 
     def __rmod__(self, other):
         """
@@ -963,8 +1511,7 @@ class Array(BaseArray):
         """
         Perform self **= other.
         """
-        self =  _binary_func(self, other, backend.get().af_pow)
-        return self
+        return _replace_handle(self, _binary_func(self, other, backend.get().af_pow))
 
     def __rpow__(self, other):
         """
@@ -1018,8 +1565,7 @@ class Array(BaseArray):
         """
         Perform self &= other.
         """
-        self = _binary_func(self, other, backend.get().af_bitand)
-        return self
+        return _replace_handle(self, _binary_func(self, other, backend.get().af_bitand))
 
     def __or__(self, other):
         """
@@ -1031,8 +1577,7 @@ class Array(BaseArray):
         """
         Perform self |= other.
         """
-        self = _binary_func(self, other, backend.get().af_bitor)
-        return self
+        return _replace_handle(self, _binary_func(self, other, backend.get().af_bitor))
 
     def __xor__(self, other):
         """
@@ -1044,8 +1589,7 @@ class Array(BaseArray):
         """
         Perform self ^= other.
         """
-        self = _binary_func(self, other, backend.get().af_bitxor)
-        return self
+        return _replace_handle(self, _binary_func(self, other, backend.get().af_bitxor))
 
     def __lshift__(self, other):
         """
@@ -1057,8 +1601,7 @@ class Array(BaseArray):
         """
         Perform self <<= other.
         """
-        self = _binary_func(self, other, backend.get().af_bitshiftl)
-        return self
+        return _replace_handle(self, _binary_func(self, other, backend.get().af_bitshiftl))
 
     def __rshift__(self, other):
         """
@@ -1070,8 +1613,7 @@ class Array(BaseArray):
         """
         Perform self >>= other.
         """
-        self = _binary_func(self, other, backend.get().af_bitshiftr)
-        return self
+        return _replace_handle(self, _binary_func(self, other, backend.get().af_bitshiftr))
 
     def __neg__(self):
         """
@@ -1106,7 +1648,7 @@ class Array(BaseArray):
         Return self && other.
         """
         out = Array()
-        safe_call(backend.get().af_and(c_pointer(out.arr), self.arr, other.arr)) #TODO: bcast var?
+        safe_call(backend.get().af_and(c_pointer(out.arr), self.arr, other.arr, _bcast_var.get()))
         return out
 
     def logical_or(self, other):
@@ -1114,7 +1656,7 @@ class Array(BaseArray):
         Return self || other.
         """
         out = Array()
-        safe_call(backend.get().af_or(c_pointer(out.arr), self.arr, other.arr)) #TODO: bcast var?
+        safe_call(backend.get().af_or(c_pointer(out.arr), self.arr, other.arr, _bcast_var.get()))
         return out
 
     def __nonzero__(self):
@@ -1134,17 +1676,12 @@ class Array(BaseArray):
         """
         try:
             out = Array()
-            n_dims = self.numdims()
-
-            if (isinstance(key, Array) and key.type() == Dtype.b8.value):
-                n_dims = 1
-                if (count(key) == 0):
-                    return out
-
-            inds = _get_indices(key)
+            plan = self._index_plan(key)
+            if plan.empty:
+                return out
 
             safe_call(backend.get().af_index_gen(c_pointer(out.arr),
-                                    self.arr, c_dim_t(n_dims), inds.pointer))
+                                    self.arr, c_dim_t(plan.numdims), plan.pointer))
             return out
         except RuntimeError as e:
             raise IndexError(str(e))
@@ -1159,42 +1696,36 @@ class Array(BaseArray):
         Ellipsis not supported as key
         """
         try:
-            n_dims = self.numdims()
-
-            is_boolean_idx = isinstance(key, Array) and key.type() == Dtype.b8.value
-
-            if (is_boolean_idx):
-                n_dims = 1
-                num = count(key)
-                if (num == 0):
-                    return
+            plan = self._index_plan(key)
+            if plan.empty:
+                return
 
             if (_is_number(val)):
-                tdims = _get_assign_dims(key, self.dims())
-                if (is_boolean_idx):
-                    n_dims = 1
-                    other_arr = constant_array(val, int(num), dtype=self.type())
-                else:
-                    other_arr = constant_array(val, tdims[0] , tdims[1], tdims[2], tdims[3], self.type())
-                del_other = True
-            else:
-                other_arr = val.arr
-                del_other = False
+                val = _scalar_array(val, self.dtype(), plan.assign_dims)
 
             out_arr = c_void_ptr_t(0)
-            inds  = _get_indices(key)
 
             safe_call(backend.get().af_assign_gen(c_pointer(out_arr),
-                                                  self.arr, c_dim_t(n_dims), inds.pointer,
-                                                  other_arr))
+                                                  self.arr, c_dim_t(plan.numdims), plan.pointer,
+                                                  val.arr))
             safe_call(backend.get().af_release_array(self.arr))
-            if del_other:
-                safe_call(backend.get().af_release_array(other_arr))
             self.arr = out_arr
+            self._reset_meta()
 
         except RuntimeError as e:
             raise IndexError(str(e))
 
+    def _index_plan(self, key):
+        """
+        Returns the IndexPlan of `key` for this array.
+        """
+        if isinstance(key, IndexPlan):
+            if key.dims != self.dims():
+                raise IndexError("Index plan built for dims %s used on an array with dims %s" %
+                                 (key.dims, self.dims()))
+            return key
+        return _cached_index_plan(key, self.dims())
+
     def _reorder(self):
         """
         Returns a reordered array to help interoperate with row major formats.
@@ -1230,6 +1761,7 @@ class Array(BaseArray):
             (res, dims): tuple of the ctypes array and the shape of the array
 
         """
+        _flush_pending()
         if (self.arr.value == 0):
             raise RuntimeError("Can not call to_ctype on empty array")
 
@@ -1238,7 +1770,7 @@ class Array(BaseArray):
         ctype_type = to_c_type[self.type()] * self.elements()
         res = ctype_type()
 
-        safe_call(backend.get().af_get_data_ptr(c_pointer(res), self.arr))
+        safe_call(backend.get().af_get_data_ptr(c_pointer(res), tmp.arr))
         if (return_shape):
             return res, self.dims()
         else:
@@ -1266,18 +1798,20 @@ class Array(BaseArray):
             (res, dims): array.array and the shape of the array
 
         """
+        _flush_pending()
         if (self.arr.value == 0):
             raise RuntimeError("Can not call to_array on empty array")
 
-        res = self.to_ctype(row_major, return_shape)
-
-        host = __import__("array")
-        h_type = to_typecode[self.type()]
+        # Copy the data straight into the memory of the result
+        res = _new_host_array(self.type(), self.elements())
+        if len(res):
+            tmp = self._reorder() if (row_major) else self
+            safe_call(backend.get().af_get_data_ptr(res.buffer_info()[0], tmp.arr))
 
         if (return_shape):
-            return host.array(h_type, res[0]), res[1]
+            return res, self.dims()
         else:
-            return host.array(h_type, res)
+            return res
 
     def to_list(self, row_major=False):
         """
@@ -1300,14 +1834,28 @@ class Array(BaseArray):
         else :
             (res, dims): list and the shape of the array
 
+        Note
+        ----
+        Multi dimensional arrays are returned as nested lists. The innermost lists run along
+        the first dimension, or along the last dimension if `row_major` is True.
+
         """
-        ct_array, shape = self.to_ctype(row_major, True)
-        return _ctype_to_lists(ct_array, len(shape) - 1, shape)
+        _flush_pending()
+        if (self.elements() == 0):
+            return []
+
+        tmp = self._reorder() if (row_major) else self
+        dims = self.dims()
+        buf = _get_host_data(tmp.arr, self.type(), self.elements())
+
+        # Column major data nests the first dimension innermost
+        return _host_to_lists(buf, self.type(), dims if row_major else tuple(reversed(dims)))
 
     def scalar(self):
         """
         Return the first element of the array
         """
+        _flush_pending()
 
         if (self.arr.value == 0):
             raise RuntimeError("Can not call to_ctype on empty array")
@@ -1329,6 +1877,10 @@ class Array(BaseArray):
         if not _in_display_dims_limit(self.dims()):
             return self._get_metadata_str()
 
+        threshold, edge_items, stats = _display_summary
+        if threshold is not None and self.elements() > threshold:
+            return self._get_metadata_str() + '\n' + self._as_summary_str(edge_items, stats)
+
         return self._get_metadata_str(dims=False) + self._as_str()
 
     def __repr__(self):
@@ -1349,26 +1901,149 @@ class Array(BaseArray):
     def _as_str(self):
         arr_str = c_char_ptr_t(0)
         be = backend.get()
-        safe_call(be.af_array_to_string(c_pointer(arr_str), "", self.arr, 4, True))
+        safe_call(be.af_array_to_string(c_pointer(arr_str), b"", self.arr, 4, True))
         py_str = to_str(arr_str)
         safe_call(be.af_free_host(arr_str))
         return py_str
 
+    def _as_summary_str(self, edge_items, stats):
+        """
+        Formats the edge blocks of the array, copying only those to the host.
+        """
+        _flush_pending()
+        host = __import__("array")
+        dims = dim4_to_tuple(self.dims())
+
+        # Positions kept along each dimension, None where some are elided
+        kept = []
+        keys = []
+        for n in dims:
+            if n > 2 * edge_items:
+                pos = list(range(edge_items)) + list(range(n - edge_items, n))
+                keys.append(Array(host.array('i', pos)))
+                kept.append(pos)
+            else:
+                keys.append(slice(None))
+                kept.append(list(range(n)))
+
+        dtype = self.type()
+        sub = self[tuple(keys)]
+        sdims = [len(pos) for pos in kept]
+        vals = _host_to_lists(_get_host_data(sub.arr, dtype, sub.elements()), dtype, (sub.elements(),))
+
+        if dtype in (Dtype.c32.value, Dtype.c64.value):
+            fmt = lambda v: '({:.4f},{:.4f})'.format(v.real, v.imag)
+        elif dtype in (Dtype.f32.value, Dtype.f64.value, Dtype.f16.value):
+            fmt = lambda v: '{:.4f}'.format(v)
+        else:
+            fmt = lambda v: '{}'.format(int(v))
+        vals = [fmt(v) for v in vals]
+        width = max(len(v) for v in vals) + 4 if vals else 0
+
+        def elided(pos, n):
+            # Index in `pos` after which "..." goes, -1 if nothing is elided
+            return edge_items - 1 if len(pos) < n else -1
+
+        lines = []
+        for l in range(sdims[3]):
+            for k in range(sdims[2]):
+                if sdims[2] * sdims[3] > 1:
+                    lines.append('[:, :, {}, {}]'.format(kept[2][k], kept[3][l]))
+                for i in range(sdims[0]):
+                    row = []
+                    for j in range(sdims[1]):
+                        idx = i + sdims[0] * (j + sdims[1] * (k + sdims[2] * l))
+                        row.append(vals[idx].rjust(width))
+                        if j == elided(kept[1], dims[1]):
+                            row.append('...'.rjust(width))
+                    lines.append(''.join(row))
+                    if i == elided(kept[0], dims[0]):
+                        lines.append('...'.rjust(width))
+                lines.append('')
+                if k == elided(kept[2], dims[2]):
+                    lines.extend(['...', ''])
+            if l == elided(kept[3], dims[3]):
+                lines.extend(['...', ''])
+
+        while lines and not lines[-1]:
+            lines.pop()
+
+        if stats:
+            lines.append('')
+            vmin, vmax, vmean = self._summary_stats()
+            # The mean of integer arrays is not an integer, it is always shown as a float
+            mean_fmt = fmt if dtype in (Dtype.c32.value, Dtype.c64.value) else '{:.4f}'.format
+            lines.append('min: {}  max: {}  mean: {}'.format(fmt(vmin), fmt(vmax), mean_fmt(vmean)))
+        return '\n'.join(lines)
+
+    def _summary_stats(self):
+        """
+        Returns the minimum, maximum and mean of the array computed on the device.
+        """
+        res = []
+        for c_func in (backend.get().af_min_all, backend.get().af_max_all, backend.get().af_mean_all):
+            real = c_double_t(0)
+            imag = c_double_t(0)
+            safe_call(c_func(c_pointer(real), c_pointer(imag), self.arr))
+            res.append(real.value if imag.value == 0 else complex(real.value, imag.value))
+        return res
+
+    def __dlpack__(self, stream=None):
+        """
+        Returns a DLPack capsule sharing the memory of the array.
+
+        The array is copied first if it is not linear (e.g. a strided view from indexing).
+        The memory stays locked until the consumer of the capsule releases it.
+        """
+        from .dlpack import _to_dlpack
+        _flush_pending()
+        return _to_dlpack(self.arr)
+
+    def __dlpack_device__(self):
+        """
+        Returns the DLPack (device type, device id) tuple of the array.
+        """
+        from .dlpack import _dlpack_device
+        return _dlpack_device(self.arr)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        """
+        Runs numpy ufuncs with a matching arrayfire function on the device (NEP 13).
+
+        Other ufuncs run on a host copy, see af.numpy_fallbacks().
+        """
+        from .numpy_dispatch import _array_ufunc
+        return _array_ufunc(ufunc, method, inputs, kwargs)
+
+    def __array_function__(self, func, types, args, kwargs):
+        """
+        Runs numpy functions with a matching arrayfire function on the device (NEP 18).
+
+        Other functions run on a host copy, see af.numpy_fallbacks().
+        """
+        from .numpy_dispatch import _array_function
+        return _array_function(func, types, args, kwargs)
+
     def __array__(self):
         """
         Constructs a numpy.array from arrayfire.Array
         """
+        _flush_pending()
         import numpy as np
         res = np.empty(self.dims(), dtype=np.dtype(to_typecode[self.type()]), order='F')
         safe_call(backend.get().af_get_data_ptr(c_void_ptr_t(res.ctypes.data), self.arr))
         return res
 
-    def to_ndarray(self, output=None):
+    def to_ndarray(self, output=None, pinned=False):
         """
         Parameters
         -----------
         output: optional: numpy. default: None
 
+        pinned: optional: bool. default: False
+            When output is None, return an array backed by pinned memory
+            from af.pinned_pool(). The memory is reused once the array is collected.
+
         Returns
         ----------
         If output is None: Constructs a numpy.array from arrayfire.Array
@@ -1379,8 +2054,12 @@ class Array(BaseArray):
 
         - An exception is thrown when output is not None and it is not contiguous.
         - When output is None, The returned array is in fortran contiguous order.
+        - A C contiguous output needs the data to be reordered, af.RowMajorArray avoids it.
         """
-        if output is None:
+        _flush_pending()
+        if output is None and pinned:
+            output = pinned_pool().view(self.dims(), to_typecode[self.type()])
+        elif output is None:
             return self.__array__()
 
         if (output.dtype != to_typecode[self.type()]):
@@ -1401,6 +2080,186 @@ class Array(BaseArray):
         safe_call(backend.get().af_get_data_ptr(c_void_ptr_t(output.ctypes.data), tmp.arr))
         return output
 
+    def to_ndarray_tiled(self, output, row_major=False, slab_bytes=1 << 26):
+        """
+        Copies the array to host memory one slab at a time.
+
+        Parameters
+        -----------
+        output: numpy.ndarray or writable buffer
+            Destination with as many bytes as the array, typically a numpy.memmap
+            or an mmap.mmap. The order of numpy arrays is taken from their flags.
+
+        row_major: optional: bool. default: False.
+            Specifies if the data is written in row major order, only used when
+            output is not a numpy array.
+
+        slab_bytes: optional: int. default: 64 MB.
+            Upper bound of the size of each slab. Slabs are never thinner than one
+            entry along the dimension they are taken from.
+
+        Returns
+        ----------
+        output
+
+        Note
+        ------
+
+        - Column major copies are taken in slabs along the last dimension and
+          row major copies along the first one, so that each slab is contiguous in output.
+        - Only one slab at a time is reordered for row major copies,
+          the device memory used beyond the array itself is bounded by slab_bytes.
+        """
+        _flush_pending()
+        if (self.arr.value == 0):
+            raise RuntimeError("Can not call to_ndarray_tiled on empty array")
+
+        dtype = self.type()
+        dims = self.dims()
+        ndims = len(dims)
+        itemsize = ct.sizeof(to_c_type[dtype])
+        elements = self.elements()
+
+        if hasattr(output, 'flags') and hasattr(output, 'ctypes'):
+            if (output.dtype != to_typecode[dtype]):
+                raise TypeError("Output is not the same type as the array")
+            if (output.size != elements):
+                raise RuntimeError("Output size does not match that of input")
+            if not output.flags['WRITEABLE']:
+                raise RuntimeError("Output must be writable")
+            if not (output.flags['F_CONTIGUOUS'] or output.flags['C_CONTIGUOUS']):
+                raise RuntimeError("Output must be contiguous")
+            row_major = not output.flags['F_CONTIGUOUS']
+            address = output.ctypes.data
+        else:
+            view = memoryview(output)
+            if view.readonly:
+                raise RuntimeError("Output must be writable")
+            if (view.nbytes != elements * itemsize):
+                raise RuntimeError("Output size does not match that of input")
+            # Keeps the buffer exported while the slabs are written
+            host = (c_char_t * view.nbytes).from_buffer(output)
+            address = ct.addressof(host)
+
+        if (elements == 0):
+            return output
+
+        # Slabs are contiguous in the output along its slowest changing dimension
+        axis = 0 if (row_major and ndims > 1) else ndims - 1
+        slab_elements = elements // dims[axis]
+        step = max(1, slab_bytes // (slab_elements * itemsize))
+
+        for begin in range(0, dims[axis], step):
+            end = min(begin + step, dims[axis])
+            slab = self
+            if (end - begin) < dims[axis]:
+                key = [slice(None)] * ndims
+                key[axis] = slice(begin, end)
+                slab = self[tuple(key)]
+            if (row_major):
+                slab = slab._reorder()
+            offset = begin * slab_elements * itemsize
+            safe_call(backend.get().af_get_data_ptr(c_void_ptr_t(address + offset), slab.arr))
+
+        return output
+
+    def to_host_async(self, row_major=False, return_shape=False):
+        """
+        Asynchronous version of to_array.
+
+        Parameters
+        -----------
+
+        row_major: optional: bool. default: False.
+            Specifies if a transpose needs to occur before copying to host memory.
+
+        return_shape: optional: bool. default: False.
+            Specifies if the shape of the array needs to be returned.
+
+        Returns
+        -------
+
+        A concurrent.futures.Future whose result is the value to_array would return.
+
+        Note
+        ------
+
+        - The data is copied through a pinned staging buffer on a background worker.
+        - Blocks while the number of transfers in flight is at the limit set
+          by set_async_transfer_limit.
+        - Later changes to this array do not affect the result.
+        """
+        _flush_pending()
+        if (self.arr.value == 0):
+            raise RuntimeError("Can not call to_host_async on empty array")
+
+        dtype = self.type()
+        dims = self.dims()
+        tmp = Array(self._reorder() if (row_major) else self)
+
+        def finish(ptr, nbytes):
+            res = _new_host_array(dtype, tmp.elements())
+            if nbytes:
+                ct.memmove(res.buffer_info()[0], ptr, nbytes)
+            return (res, dims) if (return_shape) else res
+
+        return _submit_transfer(tmp, finish)
+
+    def to_ndarray_async(self, output=None):
+        """
+        Asynchronous version of to_ndarray.
+
+        Parameters
+        -----------
+        output: optional: numpy. default: None
+
+        Returns
+        ----------
+        A concurrent.futures.Future whose result is the value to_ndarray would return.
+
+        Note
+        ------
+
+        - The data is copied through a pinned staging buffer on a background worker.
+        - Blocks while the number of transfers in flight is at the limit set
+          by set_async_transfer_limit.
+        - output must not be used until the future is done.
+        - Later changes to this array do not affect the result.
+        """
+        _flush_pending()
+        if (self.arr.value == 0):
+            raise RuntimeError("Can not call to_ndarray_async on empty array")
+
+        import numpy as np
+
+        typecode = to_typecode[self.type()]
+        dims = self.dims()
+
+        if output is None:
+            tmp = Array(self)
+        else:
+            if (output.dtype != typecode):
+                raise TypeError("Output is not the same type as the array")
+
+            if (output.size != self.elements()):
+                raise RuntimeError("Output size does not match that of input")
+
+            flags = output.flags
+            if flags['F_CONTIGUOUS']:
+                tmp = Array(self)
+            elif flags['C_CONTIGUOUS']:
+                tmp = Array(self._reorder())
+            else:
+                raise RuntimeError("When output is not None, it must be contiguous")
+
+        def finish(ptr, nbytes):
+            res = np.empty(dims, dtype=np.dtype(typecode), order='F') if output is None else output
+            if nbytes:
+                ct.memmove(res.ctypes.data, ptr, nbytes)
+            return res
+
+        return _submit_transfer(tmp, finish)
+
 def display(a, precision=4):
     """
     Displays the contents of an array.
@@ -1412,6 +2271,7 @@ def display(a, precision=4):
     precision: int. optional.
         Specifies the number of precision bits to display
     """
+    import inspect
     expr = inspect.stack()[1][-2]
     name = ""
 
@@ -1493,3 +2353,4 @@ def read_array(filename, index=None, key=None):
 
 from .algorithm import (sum, count)
 from .arith import cast
+from .device import pinned_pool
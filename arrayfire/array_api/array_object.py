@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import array as py_array
 import ctypes
-import enum
 import warnings
 from dataclasses import dataclass
 from typing import Any, List, Optional, Tuple, Union
@@ -10,7 +9,8 @@ from typing import Any, List, Optional, Tuple, Union
 # TODO replace imports from original lib with refactored ones
 from arrayfire import backend, safe_call
 from arrayfire.algorithm import count
-from arrayfire.array import _get_indices, _in_display_dims_limit
+from arrayfire.array import _get_host_data, _get_indices, _host_buffer, _host_to_lists, _in_display_dims_limit
+from arrayfire.dlpack import _dlpack_device, _to_dlpack
 
 from .device import PointerSource
 from .dtypes import CShape, Dtype
@@ -18,10 +18,10 @@ from .dtypes import bool as af_bool
 from .dtypes import c_dim_t
 from .dtypes import complex64 as af_complex64
 from .dtypes import complex128 as af_complex128
+from .dtypes import dtypes_by_c_api_value, dtypes_by_str
 from .dtypes import float32 as af_float32
 from .dtypes import float64 as af_float64
 from .dtypes import int64 as af_int64
-from .dtypes import supported_dtypes
 from .dtypes import uint64 as af_uint64
 
 ShapeType = Tuple[int, ...]
@@ -37,9 +37,25 @@ class _ArrayBuffer:
     length: int = 0
 
 
+@dataclass
+class _Metadata:
+    handle: Optional[int]
+    shape: ShapeType
+    ndim: int
+    size: int
+    dtype: Dtype
+
+
+# Shape of the single element constants broadcast in binary operations
+_scalar_shape = CShape(1)
+
+
 class Array:
     def __init__(
-            self, x: Union[None, Array, py_array.array, int, ctypes.c_void_p, List[Union[int, float]]] = None,
+            self,
+            x: Union[
+                None, Array, py_array.array, int, ctypes.c_void_p, List[Union[int, float]], bytes, bytearray,
+                memoryview] = None,
             dtype: Union[None, Dtype, str] = None, shape: Optional[ShapeType] = None,
             pointer_source: PointerSource = PointerSource.host, offset: Optional[ctypes._SimpleCData[int]] = None,
             strides: Optional[ShapeType] = None) -> None:
@@ -51,6 +67,10 @@ class Array:
 
         # Initialise array object
         self.arr = ctypes.c_void_p(0)
+        self._metadata: Optional[_Metadata] = None
+        # Keeps alive the producer of memory imported with from_dlpack
+        self._dlpack_owner: Any = None
+        _row_major = False
 
         if isinstance(dtype, str):
             dtype = _str_to_dtype(dtype)  # type: ignore[arg-type]
@@ -95,7 +115,24 @@ class Array:
             _type_char = dtype.typecode  # type: ignore[assignment]  # FIXME
 
         else:
-            raise TypeError("Passed object x is an object of unsupported class.")
+            # Any object exposing the buffer protocol, used without intermediate copies.
+            # NOTE: the buffer is exported until host_buffer goes out of scope
+            try:
+                memoryview(x)
+            except TypeError:
+                raise TypeError("Passed object x is an object of unsupported class.")
+
+            host_buffer = _host_buffer(x)
+            _buffer_dtype = _c_api_value_to_dtype(host_buffer.dtype.value)
+            _type_char = _buffer_dtype.typecode  # type: ignore[assignment]
+            _array_buffer = _ArrayBuffer(host_buffer.ptr, host_buffer.length)
+
+            if _no_initial_dtype:
+                dtype = _buffer_dtype
+
+            if not shape:
+                _row_major = host_buffer.row_major and not (offset or strides)
+                shape = tuple(reversed(host_buffer.shape)) if _row_major else host_buffer.shape
 
         _cshape = _get_cshape(shape, _array_buffer.length)
 
@@ -107,6 +144,9 @@ class Array:
                 safe_call(backend.get().af_create_array(
                     ctypes.pointer(self.arr), ctypes.c_void_p(_array_buffer.address), _cshape.original_shape,
                     ctypes.pointer(_cshape.c_array), dtype.c_api_value))
+
+                if _row_major:
+                    self.arr = _reorder_row_major(self.arr, len(shape))  # type: ignore[arg-type]
                 return
 
             safe_call(backend.get().af_device_array(
@@ -129,6 +169,15 @@ class Array:
             ctypes.pointer(_cshape.c_array), ctypes.pointer(strides_cshape), dtype.c_api_value,
             pointer_source.value))
 
+    @classmethod
+    def _from_handle(cls, arr: Optional[ctypes.c_void_p] = None) -> Array:
+        # Internal constructor used by the creation functions, it neither warns nor allocates a placeholder handle
+        out = cls.__new__(cls)
+        out.arr = ctypes.c_void_p(0) if arr is None else arr
+        out._metadata = None
+        out._dlpack_owner = None
+        return out
+
     # Arithmetic Operators
 
     def __pos__(self) -> Array:
@@ -726,13 +775,35 @@ class Array:
         # TODO
         return NotImplemented
 
-    def __dlpack__(self, *, stream: Union[None, int, Any] = None):  # type: ignore[no-untyped-def]
-        # TODO implementation and expected return type -> PyCapsule
-        return NotImplemented
+    def __dlpack__(self, *, stream: Union[None, int, Any] = None) -> Any:
+        """
+        Exports the array for consumption by from_dlpack() as a DLPack capsule.
 
-    def __dlpack_device__(self) -> Tuple[enum.Enum, int]:
-        # TODO
-        return NotImplemented
+        Parameters
+        ----------
+        self : Array
+            Array instance.
+        stream : Union[None, int, Any]
+            Stream of the consumer. ArrayFire finishes its pending work before exporting, so any stream can be used.
+
+        Returns
+        -------
+        capsule : PyCapsule
+            DLPack capsule sharing the memory of the array. Non linear arrays are copied first.
+        """
+        return _to_dlpack(self.arr)
+
+    def __dlpack_device__(self) -> Tuple[int, int]:
+        """
+        Returns device type and device ID in DLPack format.
+
+        Returns
+        -------
+        device : Tuple[int, int]
+            A tuple (device_type, device_id) in DLPack format.
+        """
+        device_type, device_id = _dlpack_device(self.arr)
+        return int(device_type), int(device_id)
 
     def __float__(self) -> float:
         # TODO
@@ -817,9 +888,7 @@ class Array:
         out : Dtype
             Array data type.
         """
-        out = ctypes.c_int()
-        safe_call(backend.get().af_get_type(ctypes.pointer(out), self.arr))
-        return _c_api_value_to_dtype(out.value)
+        return _get_metadata(self).dtype
 
     @property
     def device(self) -> Any:
@@ -870,9 +939,7 @@ class Array:
         - This must equal the product of the array's dimensions.
         """
         # NOTE previously - elements()
-        out = c_dim_t(0)
-        safe_call(backend.get().af_get_elements(ctypes.pointer(out), self.arr))
-        return out.value
+        return _get_metadata(self).size
 
     @property
     def ndim(self) -> int:
@@ -882,9 +949,7 @@ class Array:
         out : int
             Number of array dimensions (axes).
         """
-        out = ctypes.c_uint(0)
-        safe_call(backend.get().af_get_numdims(ctypes.pointer(out), self.arr))
-        return out.value
+        return _get_metadata(self).ndim
 
     @property
     def shape(self) -> ShapeType:
@@ -896,14 +961,7 @@ class Array:
         out : tuple[int, ...]
             Array dimensions.
         """
-        # TODO refactor
-        d0 = c_dim_t(0)
-        d1 = c_dim_t(0)
-        d2 = c_dim_t(0)
-        d3 = c_dim_t(0)
-        safe_call(backend.get().af_get_dims(
-            ctypes.pointer(d0), ctypes.pointer(d1), ctypes.pointer(d2), ctypes.pointer(d3), self.arr))
-        return (d0.value, d1.value, d2.value, d3.value)[:self.ndim]  # Skip passing None values
+        return _get_metadata(self).shape
 
     def scalar(self) -> Union[None, int, float, bool, complex]:
         """
@@ -923,31 +981,21 @@ class Array:
         Check if the array is empty i.e. it has no elements.
         """
         # NOTE not a part of the array-api spec
-        out = ctypes.c_bool()
-        safe_call(backend.get().af_is_empty(ctypes.pointer(out), self.arr))
-        return out.value
+        return self.size == 0
 
     def to_list(self, row_major: bool = False) -> List[Union[None, int, float, bool, complex]]:
         # NOTE not a part of the array-api spec
         if self.is_empty():
             return []
 
+        # Single host copy, nested lists are built from it in bulk
         array = _reorder(self) if row_major else self
-        ctypes_array = _get_ctypes_array(array)
-
-        if array.ndim == 1:
-            return list(ctypes_array)
-
-        out = []
-        for i in range(array.size):
-            idx = i
-            sub_list = []
-            for j in range(array.ndim):
-                div = array.shape[j]
-                sub_list.append(idx % div)
-                idx //= div
-            out.append(ctypes_array[sub_list[::-1]])  # type: ignore[call-overload]  # FIXME
-        return out
+        shape = self.shape
+        host_data = _get_host_data(array.arr, self.dtype.c_api_value, self.size)
+
+        # Column major data nests the first dimension innermost
+        return _host_to_lists(  # type: ignore[no-any-return]
+            host_data, self.dtype.c_api_value, shape if row_major else shape[::-1])
 
     def to_ctype_array(self, row_major: bool = False) -> ctypes.Array:
         # NOTE not a part of the array-api spec
@@ -958,6 +1006,30 @@ class Array:
         return _get_ctypes_array(array)
 
 
+def _get_metadata(array: Array) -> _Metadata:
+    """
+    Returns the metadata of the array, read once per af_array handle.
+    """
+    # NOTE C functions writing an output into array.arr replace the handle in place
+    metadata = array._metadata
+    if metadata is not None and metadata.handle == array.arr.value:
+        return metadata
+
+    dims = (c_dim_t(0), c_dim_t(0), c_dim_t(0), c_dim_t(0))
+    ndim = ctypes.c_uint(0)
+    c_api_value = ctypes.c_int(0)
+    safe_call(backend.get().af_get_dims(*[ctypes.pointer(d) for d in dims], array.arr))
+    safe_call(backend.get().af_get_numdims(ctypes.pointer(ndim), array.arr))
+    safe_call(backend.get().af_get_type(ctypes.pointer(c_api_value), array.arr))
+
+    shape = tuple(d.value for d in dims)
+    metadata = _Metadata(
+        array.arr.value, shape[:ndim.value], ndim.value, shape[0] * shape[1] * shape[2] * shape[3],
+        _c_api_value_to_dtype(c_api_value.value))
+    array._metadata = metadata
+    return metadata
+
+
 def _get_ctypes_array(array: Array) -> ctypes.Array:
     c_shape = array.dtype.c_type * array.size
     ctypes_array = c_shape()
@@ -981,7 +1053,7 @@ def _reorder(array: Array) -> Array:
 def _array_as_str(array: Array) -> str:
     arr_str = ctypes.c_char_p(0)
     # FIXME add description to passed arguments
-    safe_call(backend.get().af_array_to_string(ctypes.pointer(arr_str), "", array.arr, 4, True))
+    safe_call(backend.get().af_array_to_string(ctypes.pointer(arr_str), b"", array.arr, 4, True))
     py_str = _to_str(arr_str)
     safe_call(backend.get().af_free_host(arr_str))
     return py_str
@@ -1004,12 +1076,19 @@ def _get_cshape(shape: Optional[ShapeType], buffer_length: int) -> CShape:
     raise RuntimeError("Shape and buffer length have invalid size to process them into C shape.")
 
 
-def _c_api_value_to_dtype(value: int) -> Dtype:
-    for dtype in supported_dtypes:
-        if value == dtype.c_api_value:
-            return dtype
+def _reorder_row_major(arr: ctypes.c_void_p, ndim: int) -> ctypes.c_void_p:
+    out = ctypes.c_void_p(0)
+    order = tuple(reversed(range(ndim))) + tuple(range(ndim, 4))
+    safe_call(backend.get().af_reorder(ctypes.pointer(out), arr, *order))
+    safe_call(backend.get().af_release_array(arr))
+    return out
+
 
-    raise TypeError("There is no supported dtype that matches passed dtype C API value.")
+def _c_api_value_to_dtype(value: int) -> Dtype:
+    try:
+        return dtypes_by_c_api_value[value]
+    except KeyError:
+        raise TypeError("There is no supported dtype that matches passed dtype C API value.")
 
 
 def _to_str(c_str: ctypes.c_char_p) -> str:
@@ -1017,32 +1096,35 @@ def _to_str(c_str: ctypes.c_char_p) -> str:
 
 
 def _str_to_dtype(value: int) -> Dtype:
-    for dtype in supported_dtypes:
-        if value == dtype.typecode or value == dtype.typename:
-            return dtype
-
-    raise TypeError("There is no supported dtype that matches passed dtype typecode.")
+    try:
+        return dtypes_by_str[value]  # type: ignore[index]
+    except KeyError:
+        raise TypeError("There is no supported dtype that matches passed dtype typecode.")
 
 
 def _process_c_function(
         lhs: Union[int, float, Array], rhs: Union[int, float, Array],
         c_function: Any) -> Array:
     out = Array()
+    batch = _bcast_var
 
     if isinstance(lhs, Array) and isinstance(rhs, Array):
         lhs_array = lhs.arr
         rhs_array = rhs.arr
 
     elif isinstance(lhs, Array) and isinstance(rhs, (int, float)):
+        # Single element constant broadcast by ArrayFire instead of a full size one
         rhs_dtype = _implicit_dtype(rhs, lhs.dtype)
-        rhs_constant_array = _constant_array(rhs, CShape(*lhs.shape), rhs_dtype)
+        rhs_constant_array = _constant_array(rhs, _scalar_shape, rhs_dtype)
+        batch = True
 
         lhs_array = lhs.arr
         rhs_array = rhs_constant_array.arr
 
     elif isinstance(lhs, (int, float)) and isinstance(rhs, Array):
         lhs_dtype = _implicit_dtype(lhs, rhs.dtype)
-        lhs_constant_array = _constant_array(lhs, CShape(*rhs.shape), lhs_dtype)
+        lhs_constant_array = _constant_array(lhs, _scalar_shape, lhs_dtype)
+        batch = True
 
         lhs_array = lhs_constant_array.arr
         rhs_array = rhs.arr
@@ -1050,7 +1132,7 @@ def _process_c_function(
     else:
         raise TypeError(f"{type(rhs)} is not supported and can not be passed to C binary function.")
 
-    safe_call(c_function(ctypes.pointer(out.arr), lhs_array, rhs_array, _bcast_var))
+    safe_call(c_function(ctypes.pointer(out.arr), lhs_array, rhs_array, batch))
 
     return out
 
@@ -1079,8 +1161,8 @@ def _implicit_dtype(value: Union[int, float], array_dtype: Dtype) -> Dtype:
     return value_dtype
 
 
-def _constant_array(value: Union[int, float], shape: CShape, dtype: Dtype) -> Array:
-    out = Array()
+def _constant_array(value: Union[bool, int, float, complex], shape: CShape, dtype: Dtype) -> Array:
+    out = Array._from_handle()
 
     if isinstance(value, complex):
         if dtype != af_complex64 and dtype != af_complex128:
@@ -0,0 +1,561 @@
+from __future__ import annotations
+
+import array as py_array
+import ctypes
+import math
+from typing import Any, Iterator, List, Optional, Tuple, Union
+
+from arrayfire import backend, safe_call
+from arrayfire.array import _host_buffer
+from arrayfire.dlpack import _from_dlpack
+
+from .array_object import Array, ShapeType, _c_api_value_to_dtype, _constant_array, _reorder_row_major
+from .dtypes import CShape, Dtype
+from .dtypes import bool as af_bool
+from .dtypes import complex64 as af_complex64
+from .dtypes import complex128 as af_complex128
+from .dtypes import float32 as af_float32
+from .dtypes import float64 as af_float64
+from .dtypes import int16 as af_int16
+from .dtypes import int32 as af_int32
+from .dtypes import int64 as af_int64
+from .dtypes import uint8 as af_uint8
+from .dtypes import uint16 as af_uint16
+from .dtypes import uint32 as af_uint32
+from .dtypes import uint64 as af_uint64
+
+# NOTE the default floating-point data type of arrayfire is float32
+_default_float = af_float32
+_default_complex = af_complex64
+
+# Fixed size typecodes of the array module for each dtype, complex numbers are stored as (real, imag) pairs
+_host_typecodes = {
+    af_int16.c_api_value: "h", af_int32.c_api_value: "i", af_int64.c_api_value: "q", af_uint8.c_api_value: "B",
+    af_uint16.c_api_value: "H", af_uint32.c_api_value: "I", af_uint64.c_api_value: "Q",
+    af_float32.c_api_value: "f", af_float64.c_api_value: "d", af_complex64.c_api_value: "f",
+    af_complex128.c_api_value: "d", af_bool.c_api_value: "B"}
+
+_floating_dtypes = (af_float32, af_float64, af_complex64, af_complex128)
+
+
+def asarray(
+        obj: Union[Array, bool, int, float, complex, List[Any], Tuple[Any, ...], Any], /, *,
+        dtype: Optional[Dtype] = None, device: Any = None, copy: Optional[bool] = None) -> Array:
+    """
+    Convert the input to an array.
+
+    Parameters
+    ----------
+    obj : Union[Array, bool, int, float, complex, NestedSequence, SupportsBufferProtocol]
+        Object to be converted to an array. May be a Python scalar, a (possibly nested) sequence of Python scalars,
+        or an object supporting the Python buffer protocol. Nested sequences are in row major order.
+    dtype : Optional[Dtype]
+        Output array data type. If None, it is inferred from obj: bool, int64, float32 or complex64 for Python
+        scalars and sequences, the format of the buffer for buffers, the data type of obj for arrays.
+    device : Any
+        Device on which to place the created array. Only the active device is supported.
+    copy : Optional[bool]
+        Whether or not to make a copy of the input. If False, obj must be an array of the requested data type.
+
+    Returns
+    -------
+    out : Array
+        An array containing the data from obj.
+
+    Note
+    ----
+    - Sequences are written straight into a typed host buffer, uploaded with a single af_create_array call.
+    - Python scalars become arrays of shape (1,), since arrayfire has no zero-dimensional arrays.
+    """
+    if isinstance(obj, Array):
+        if dtype is None or dtype == obj.dtype:
+            if not copy:
+                return obj
+            out = Array._from_handle()
+            safe_call(backend.get().af_copy_array(ctypes.pointer(out.arr), obj.arr))
+            return out
+
+        if copy is False:
+            raise ValueError("Can not convert the data type of an array without a copy.")
+        return _cast(obj, dtype)
+
+    if copy is False:
+        raise ValueError("Only arrays can be used without a copy.")
+
+    if isinstance(obj, (bool, int, float, complex)):
+        return _constant_array(obj, CShape(1), dtype or _scalar_dtype(iter((obj,))))
+
+    if isinstance(obj, (list, tuple)):
+        shape = _nested_shape(obj)
+        if dtype is None:
+            dtype = _scalar_dtype(_flatten(obj, shape))
+        if 0 in shape:
+            return _empty(shape, dtype)
+
+        host_array = py_array.array(_host_typecodes[dtype.c_api_value], _host_values(_flatten(obj, shape), dtype))
+        return _upload(host_array.buffer_info()[0], shape, True, dtype)
+
+    try:
+        memoryview(obj)
+    except TypeError:
+        raise TypeError(f"{type(obj)} is not supported and can not be converted to an array.")
+
+    host_buffer = _host_buffer(obj)
+    try:
+        buffer_dtype = _c_api_value_to_dtype(host_buffer.dtype.value)
+        out = _upload(host_buffer.ptr, host_buffer.shape, host_buffer.row_major, buffer_dtype)
+    finally:
+        host_buffer.release()
+
+    if dtype is not None and dtype != buffer_dtype:
+        return _cast(out, dtype)
+    return out
+
+
+def arange(
+        start: Union[int, float], /, stop: Union[int, float, None] = None, step: Union[int, float] = 1, *,
+        dtype: Optional[Dtype] = None, device: Any = None) -> Array:
+    """
+    Returns evenly spaced values within the half-open interval [start, stop) as a one-dimensional array.
+
+    Parameters
+    ----------
+    start : Union[int, float]
+        If stop is specified, the start of interval (inclusive); otherwise, the end of the interval (exclusive).
+    stop : Union[int, float, None]
+        The end of the interval.
+    step : Union[int, float]
+        The distance between two adjacent elements. Must not be 0.
+    dtype : Optional[Dtype]
+        Output array data type. If None, int64 if start, stop and step are integers, float32 otherwise.
+    device : Any
+        Device on which to place the created array. Only the active device is supported.
+
+    Returns
+    -------
+    out : Array
+        A one-dimensional array containing evenly spaced values, generated on the device with af_range.
+    """
+    if stop is None:
+        start, stop = 0, start
+
+    if step == 0:
+        raise ValueError("Step of arange must not be 0.")
+
+    if all(isinstance(value, int) for value in (start, stop, step)):
+        size = int(-((start - stop) // step))  # type: ignore[operator]
+        dtype = dtype or af_int64
+    else:
+        size = int(math.ceil((stop - start) / step))  # type: ignore[operator]
+        dtype = dtype or _default_float
+
+    if size <= 0:
+        return _empty((0,), dtype)
+
+    out = _range((size,), 0, dtype)
+    if step != 1:
+        out = _scalar_function(out, step, dtype, backend.get().af_mul)
+    if start != 0:
+        out = _scalar_function(out, start, dtype, backend.get().af_add)
+    return out
+
+
+def empty(shape: Union[int, ShapeType], *, dtype: Optional[Dtype] = None, device: Any = None) -> Array:
+    """
+    Returns an uninitialized array having a specified shape.
+
+    Parameters
+    ----------
+    shape : Union[int, Tuple[int, ...]]
+        Output array shape.
+    dtype : Optional[Dtype]
+        Output array data type. If None, float32.
+    device : Any
+        Device on which to place the created array. Only the active device is supported.
+
+    Returns
+    -------
+    out : Array
+        An array containing uninitialized data.
+    """
+    return _empty(_shape(shape), dtype or _default_float)
+
+
+def empty_like(x: Array, /, *, dtype: Optional[Dtype] = None, device: Any = None) -> Array:
+    """
+    Returns an uninitialized array with the same shape as an input array x.
+
+    Parameters
+    ----------
+    x : Array
+        Input array from which to derive the output array shape.
+    dtype : Optional[Dtype]
+        Output array data type. If None, the data type of x.
+    device : Any
+        Device on which to place the created array. Only the active device is supported.
+
+    Returns
+    -------
+    out : Array
+        An array having the same shape as x and containing uninitialized data.
+    """
+    return _empty(x.shape or (0,), dtype or x.dtype)
+
+
+def eye(
+        n_rows: int, n_cols: Optional[int] = None, /, *, k: int = 0, dtype: Optional[Dtype] = None,
+        device: Any = None) -> Array:
+    """
+    Returns a two-dimensional array with ones on the kth diagonal and zeros elsewhere.
+
+    Parameters
+    ----------
+    n_rows : int
+        Number of rows in the output array.
+    n_cols : Optional[int]
+        Number of columns in the output array. If None, n_rows.
+    k : int
+        Index of the diagonal. A positive value refers to an upper diagonal, a negative value to a lower diagonal,
+        and 0 to the main diagonal.
+    dtype : Optional[Dtype]
+        Output array data type. If None, float32.
+    device : Any
+        Device on which to place the created array. Only the active device is supported.
+
+    Returns
+    -------
+    out : Array
+        An array where all elements are equal to zero, except for the kth diagonal, whose values are equal to one.
+    """
+    shape = (n_rows, n_rows if n_cols is None else n_cols)
+    dtype = dtype or _default_float
+
+    if 0 in shape:
+        return _empty(shape, dtype)
+
+    if k == 0:
+        out = Array._from_handle()
+        safe_call(backend.get().af_identity(
+            ctypes.pointer(out.arr), len(shape), ctypes.pointer(CShape(*shape).c_array), dtype.c_api_value))
+        return out
+
+    # Elements of the kth diagonal are the ones where column - row == k
+    diagonal = Array._from_handle()
+    safe_call(backend.get().af_sub(
+        ctypes.pointer(diagonal.arr), _range(shape, 1, af_int32).arr, _range(shape, 0, af_int32).arr, False))
+    return _cast(_scalar_function(diagonal, k, af_int32, backend.get().af_eq), dtype)
+
+
+def full(
+        shape: Union[int, ShapeType], fill_value: Union[bool, int, float, complex], *,
+        dtype: Optional[Dtype] = None, device: Any = None) -> Array:
+    """
+    Returns a new array having a specified shape and filled with fill_value.
+
+    Parameters
+    ----------
+    shape : Union[int, Tuple[int, ...]]
+        Output array shape.
+    fill_value : Union[bool, int, float, complex]
+        Fill value.
+    dtype : Optional[Dtype]
+        Output array data type. If None, inferred from fill_value: bool, int64, float32 or complex64.
+    device : Any
+        Device on which to place the created array. Only the active device is supported.
+
+    Returns
+    -------
+    out : Array
+        An array where every element is equal to fill_value, generated on the device with af_constant.
+    """
+    return _full(_shape(shape), fill_value, dtype or _scalar_dtype(iter((fill_value,))))
+
+
+def full_like(
+        x: Array, /, fill_value: Union[bool, int, float, complex], *, dtype: Optional[Dtype] = None,
+        device: Any = None) -> Array:
+    """
+    Returns a new array filled with fill_value and having the same shape as an input array x.
+
+    Parameters
+    ----------
+    x : Array
+        Input array from which to derive the output array shape.
+    fill_value : Union[bool, int, float, complex]
+        Fill value.
+    dtype : Optional[Dtype]
+        Output array data type. If None, the data type of x.
+    device : Any
+        Device on which to place the created array. Only the active device is supported.
+
+    Returns
+    -------
+    out : Array
+        An array having the same shape as x and where every element is equal to fill_value.
+    """
+    return _full(x.shape or (0,), fill_value, dtype or x.dtype)
+
+
+def linspace(
+        start: Union[int, float, complex], stop: Union[int, float, complex], /, num: int, *,
+        dtype: Optional[Dtype] = None, device: Any = None, endpoint: bool = True) -> Array:
+    """
+    Returns evenly spaced numbers over a specified interval.
+
+    Parameters
+    ----------
+    start : Union[int, float, complex]
+        The start of the interval.
+    stop : Union[int, float, complex]
+        The end of the interval.
+    num : int
+        Number of samples. Must be a nonnegative integer value.
+    dtype : Optional[Dtype]
+        Output array data type, must be a floating-point data type. If None, complex64 if start or stop is complex,
+        float32 otherwise.
+    device : Any
+        Device on which to place the created array. Only the active device is supported.
+    endpoint : bool
+        Boolean indicating whether to include stop in the interval.
+
+    Returns
+    -------
+    out : Array
+        A one-dimensional array containing evenly spaced values, generated on the device with af_range.
+    """
+    if num < 0:
+        raise ValueError("Number of samples of linspace must be nonnegative.")
+
+    if dtype is None:
+        dtype = _default_complex if isinstance(start, complex) or isinstance(stop, complex) else _default_float
+    if dtype not in _floating_dtypes:
+        raise TypeError("Data type of linspace must be a floating-point data type.")
+
+    if num == 0:
+        return _empty((0,), dtype)
+
+    divisor = num - 1 if endpoint else num
+    step = (stop - start) / divisor if divisor else 0
+
+    # Complex samples are computed from a real range of the same precision
+    range_dtype = af_float64 if dtype in (af_float64, af_complex128) else af_float32
+    out = _scalar_function(_range((num,), 0, range_dtype), step, dtype, backend.get().af_mul)
+    return _scalar_function(out, start, dtype, backend.get().af_add)
+
+
+def ones(shape: Union[int, ShapeType], *, dtype: Optional[Dtype] = None, device: Any = None) -> Array:
+    """
+    Returns a new array having a specified shape and filled with ones.
+
+    Parameters
+    ----------
+    shape : Union[int, Tuple[int, ...]]
+        Output array shape.
+    dtype : Optional[Dtype]
+        Output array data type. If None, float32.
+    device : Any
+        Device on which to place the created array. Only the active device is supported.
+
+    Returns
+    -------
+    out : Array
+        An array containing ones.
+    """
+    return _full(_shape(shape), 1, dtype or _default_float)
+
+
+def ones_like(x: Array, /, *, dtype: Optional[Dtype] = None, device: Any = None) -> Array:
+    """
+    Returns a new array filled with ones and having the same shape as an input array x.
+
+    Parameters
+    ----------
+    x : Array
+        Input array from which to derive the output array shape.
+    dtype : Optional[Dtype]
+        Output array data type. If None, the data type of x.
+    device : Any
+        Device on which to place the created array. Only the active device is supported.
+
+    Returns
+    -------
+    out : Array
+        An array having the same shape as x and filled with ones.
+    """
+    return _full(x.shape or (0,), 1, dtype or x.dtype)
+
+
+def zeros(shape: Union[int, ShapeType], *, dtype: Optional[Dtype] = None, device: Any = None) -> Array:
+    """
+    Returns a new array having a specified shape and filled with zeros.
+
+    Parameters
+    ----------
+    shape : Union[int, Tuple[int, ...]]
+        Output array shape.
+    dtype : Optional[Dtype]
+        Output array data type. If None, float32.
+    device : Any
+        Device on which to place the created array. Only the active device is supported.
+
+    Returns
+    -------
+    out : Array
+        An array containing zeros.
+    """
+    return _full(_shape(shape), 0, dtype or _default_float)
+
+
+def zeros_like(x: Array, /, *, dtype: Optional[Dtype] = None, device: Any = None) -> Array:
+    """
+    Returns a new array filled with zeros and having the same shape as an input array x.
+
+    Parameters
+    ----------
+    x : Array
+        Input array from which to derive the output array shape.
+    dtype : Optional[Dtype]
+        Output array data type. If None, the data type of x.
+    device : Any
+        Device on which to place the created array. Only the active device is supported.
+
+    Returns
+    -------
+    out : Array
+        An array having the same shape as x and filled with zeros.
+    """
+    return _full(x.shape or (0,), 0, dtype or x.dtype)
+
+
+def from_dlpack(x: Any, /) -> Array:
+    """
+    Returns a new array containing the data from another (array) object with a __dlpack__ method.
+
+    Parameters
+    ----------
+    x : object
+        Input (array) object, or a DLPack capsule.
+
+    Returns
+    -------
+    out : Array
+        An array containing the data in x. Memory on the device of the active backend is shared, host memory used
+        with other backends is copied.
+    """
+    arr, owner = _from_dlpack(x)
+    out = Array._from_handle(arr)
+    out._dlpack_owner = owner
+    return out
+
+
+def _shape(shape: Union[int, ShapeType]) -> ShapeType:
+    shape = (shape,) if isinstance(shape, int) else tuple(shape)
+
+    if len(shape) > 4:
+        raise ValueError("Arrays with more than 4 dimensions are not supported.")
+
+    # NOTE arrayfire has no zero-dimensional arrays
+    return shape or (1,)
+
+
+def _empty(shape: ShapeType, dtype: Dtype) -> Array:
+    out = Array._from_handle()
+    safe_call(backend.get().af_create_handle(
+        ctypes.pointer(out.arr), len(shape), ctypes.pointer(CShape(*shape).c_array), dtype.c_api_value))
+    return out
+
+
+def _full(shape: ShapeType, fill_value: Union[bool, int, float, complex], dtype: Dtype) -> Array:
+    if 0 in shape:
+        return _empty(shape, dtype)
+
+    return _constant_array(fill_value, CShape(*shape), dtype)
+
+
+def _range(shape: ShapeType, seq_dim: int, dtype: Dtype) -> Array:
+    out = Array._from_handle()
+    safe_call(backend.get().af_range(
+        ctypes.pointer(out.arr), len(shape), ctypes.pointer(CShape(*shape).c_array), seq_dim, dtype.c_api_value))
+    return out
+
+
+def _scalar_function(array: Array, value: Union[int, float, complex], dtype: Dtype, c_function: Any) -> Array:
+    # Single element constant of the output data type, broadcast by arrayfire
+    out = Array._from_handle()
+    constant = _constant_array(value, CShape(1), dtype)
+    safe_call(c_function(ctypes.pointer(out.arr), array.arr, constant.arr, True))
+    return out
+
+
+def _cast(array: Array, dtype: Dtype) -> Array:
+    out = Array._from_handle()
+    safe_call(backend.get().af_cast(ctypes.pointer(out.arr), array.arr, dtype.c_api_value))
+    return out
+
+
+def _upload(address: int, shape: ShapeType, row_major: bool, dtype: Dtype) -> Array:
+    # Row major data is the column major data of the array with reversed dimensions
+    dims = tuple(reversed(shape)) if row_major else shape
+    out = Array._from_handle()
+    safe_call(backend.get().af_create_array(
+        ctypes.pointer(out.arr), ctypes.c_void_p(address), len(dims), ctypes.pointer(CShape(*dims).c_array),
+        dtype.c_api_value))
+
+    if row_major and len(shape) > 1:
+        out.arr = _reorder_row_major(out.arr, len(shape))
+    return out
+
+
+def _nested_shape(obj: Union[List[Any], Tuple[Any, ...]]) -> ShapeType:
+    shape = []
+    while isinstance(obj, (list, tuple)):
+        shape.append(len(obj))
+        if not obj:
+            break
+        obj = obj[0]
+
+    if len(shape) > 4:
+        raise ValueError("Sequences nested more than 4 levels deep are not supported.")
+    return tuple(shape)
+
+
+def _flatten(obj: Union[List[Any], Tuple[Any, ...]], shape: ShapeType, depth: int = 0) -> Iterator[Any]:
+    if len(obj) != shape[depth]:
+        raise ValueError(f"Nested sequence is ragged, expected a length of {shape[depth]} and got {len(obj)}.")
+
+    if depth == len(shape) - 1:
+        for item in obj:
+            if isinstance(item, (list, tuple)):
+                raise ValueError("Nested sequence is ragged, got a sequence in place of a scalar.")
+            yield item
+        return
+
+    for item in obj:
+        if not isinstance(item, (list, tuple)):
+            raise ValueError("Nested sequence is ragged, got a scalar in place of a sequence.")
+        yield from _flatten(item, shape, depth + 1)
+
+
+def _scalar_dtype(values: Iterator[Any]) -> Dtype:
+    # complex > float > int > bool, float32 for an empty sequence
+    has_values = has_int = has_float = False
+    for value in values:
+        if isinstance(value, complex):
+            return _default_complex
+        if isinstance(value, float):
+            has_float = True
+        elif isinstance(value, int):
+            has_int = has_int or not isinstance(value, bool)
+        else:
+            raise TypeError(f"{type(value)} is not supported and can not be converted to an array.")
+        has_values = True
+
+    if has_float or not has_values:
+        return _default_float
+    return af_int64 if has_int else af_bool
+
+
+def _host_values(values: Iterator[Any], dtype: Dtype) -> Iterator[Any]:
+    if dtype not in (af_complex64, af_complex128):
+        return values
+    return (part for value in values for part in (complex(value).real, complex(value).imag))
@@ -2,14 +2,15 @@ from __future__ import annotations
 
 import ctypes
 from dataclasses import dataclass
-from typing import Type
+from typing import Optional, Type
 
 from .config import is_arch_x86
 
 c_dim_t = ctypes.c_int if is_arch_x86() else ctypes.c_longlong
 
 
-@dataclass
+# NOTE dtypes are interned singletons, compared and hashed by identity
+@dataclass(frozen=True, eq=False)
 class Dtype:
     typecode: str
     c_type: Type[ctypes._SimpleCData]
@@ -36,22 +37,35 @@ supported_dtypes = [
     int16, int32, int64, uint8, uint16, uint32, uint64, float32, float64, complex64, complex128, bool
 ]
 
+# Lookup tables of the interned dtypes
+dtypes_by_c_api_value = {dtype.c_api_value: dtype for dtype in supported_dtypes}
+dtypes_by_str = {**{dtype.typename: dtype for dtype in supported_dtypes},
+                 **{dtype.typecode: dtype for dtype in supported_dtypes}}
+
+_c_dim4 = c_dim_t * 4  # ctypes.c_int | ctypes.c_longlong * 4
+
 
 class CShape(tuple):
+    original_shape: int
+
     def __new__(cls, *args: int) -> CShape:
-        cls.original_shape = len(args)
-        return tuple.__new__(cls, args)
+        self = tuple.__new__(cls, args)
+        self.original_shape = len(args)
+        return self
 
     def __init__(self, x1: int = 1, x2: int = 1, x3: int = 1, x4: int = 1) -> None:
         self.x1 = x1
         self.x2 = x2
         self.x3 = x3
         self.x4 = x4
+        self._c_array: Optional[ctypes.Array] = None
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}{self.x1, self.x2, self.x3, self.x4}"
 
     @property
     def c_array(self):  # type: ignore[no-untyped-def]
-        c_shape = c_dim_t * 4  # ctypes.c_int | ctypes.c_longlong * 4
-        return c_shape(c_dim_t(self.x1), c_dim_t(self.x2), c_dim_t(self.x3), c_dim_t(self.x4))
+        # Built once, C functions only read the dimensions
+        if self._c_array is None:
+            self._c_array = _c_dim4(self.x1, self.x2, self.x3, self.x4)
+        return self._c_array
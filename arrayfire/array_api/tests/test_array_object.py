@@ -5,7 +5,8 @@ from typing import Any
 import pytest
 
 from arrayfire.array_api.array_object import Array
-from arrayfire.array_api.dtypes import float32, int16, supported_dtypes
+from arrayfire.array_api.creation_functions import from_dlpack
+from arrayfire.array_api.dtypes import float32, int16, int32, supported_dtypes, uint8
 
 # TODO change separated methods with setup and teardown to avoid code duplication
 # TODO add tests for array arguments: device, offset, strides
@@ -94,6 +95,26 @@ def test_create_array_from_pyarray() -> None:
     assert len(array) == 3
 
 
+def test_create_array_from_bytes() -> None:
+    array = Array(bytes(range(6)))
+
+    assert array.dtype == uint8
+    assert array.ndim == 1
+    assert array.shape == (6,)
+    assert array.to_list() == [0, 1, 2, 3, 4, 5]
+
+
+def test_create_array_from_2d_memoryview() -> None:
+    buffer = memoryview(pyarray.array("i", range(6))).cast("B").cast("i", (2, 3))
+    array = Array(buffer)
+
+    assert array.dtype == int32
+    assert array.shape == (2, 3)
+    assert array.size == 6
+    assert array.to_list(row_major=True) == [[0, 1, 2], [3, 4, 5]]
+    assert array.to_list() == [[0, 3], [1, 4], [2, 5]]
+
+
 def test_array_from_list_with_unsupported_dtype() -> None:
     for dtype in supported_dtypes:
         if dtype == float32:
@@ -140,6 +161,18 @@ def test_array_from_unsupported_type() -> None:
         Array({1: 2, 3: 4})  # type: ignore[arg-type]
 
 
+def test_array_metadata_follows_handle() -> None:
+    array = Array([1, 2, 3])
+    assert array.shape == (3,)
+    assert array.dtype is float32
+
+    array.arr = Array(shape=(2, 3), dtype=int16).arr
+    assert array.shape == (2, 3)
+    assert array.ndim == 2
+    assert array.size == 6
+    assert array.dtype is int16
+
+
 def test_array_getitem() -> None:
     array = Array([1, 2, 3, 4, 5])
 
@@ -170,6 +203,24 @@ def test_array_to_list_is_empty() -> None:
     assert array.to_list() == []
 
 
+def test_array_dlpack() -> None:
+    array = Array([1, 2, 3])
+    res = from_dlpack(array)
+
+    assert isinstance(array.__dlpack_device__(), tuple)
+    assert res.dtype == array.dtype
+    assert res.shape == array.shape
+    assert res.to_list() == [1, 2, 3]
+
+
+def test_array_dlpack_capsule_is_consumed_once() -> None:
+    capsule = Array([1, 2, 3]).__dlpack__()
+    assert from_dlpack(capsule).to_list() == [1, 2, 3]
+
+    with pytest.raises(TypeError):
+        from_dlpack(capsule)
+
+
 class TestArithmeticOperators:
     def setup_method(self, method: Any) -> None:
         self.list = [1, 2, 3]
@@ -0,0 +1,124 @@
+import array as pyarray
+import warnings
+
+import pytest
+
+from arrayfire.array_api.creation_functions import (
+    arange, asarray, empty, empty_like, eye, full, full_like, linspace, ones, ones_like, zeros, zeros_like)
+from arrayfire.array_api.dtypes import bool, complex64, float32, float64, int16, int32, int64, uint8
+
+
+def test_asarray_from_nested_list() -> None:
+    array = asarray([[1, 2, 3], [4, 5, 6]])
+
+    assert array.dtype == int64
+    assert array.shape == (2, 3)
+    assert array.to_list(row_major=True) == [[1, 2, 3], [4, 5, 6]]
+
+
+def test_asarray_infers_dtype() -> None:
+    assert asarray([True, False]).dtype == bool
+    assert asarray([1, True]).dtype == int64
+    assert asarray([1, 2.5]).dtype == float32
+    assert asarray([1, 2j]).dtype == complex64
+    assert asarray([]).dtype == float32
+    assert asarray(2.5).to_list() == [2.5]
+
+
+def test_asarray_with_dtype() -> None:
+    array = asarray((1, 2, 3), dtype=int16)
+
+    assert array.dtype == int16
+    assert array.to_list() == [1, 2, 3]
+
+
+def test_asarray_from_buffer() -> None:
+    array = asarray(pyarray.array("d", [1, 2, 3]))
+    assert array.dtype == float64
+
+    array = asarray(bytes(range(4)), dtype=int32)
+    assert array.dtype == int32
+    assert array.to_list() == [0, 1, 2, 3]
+
+
+def test_asarray_from_array() -> None:
+    array = asarray([1, 2, 3])
+
+    assert asarray(array) is array
+    assert asarray(array, copy=True) is not array
+    assert asarray(array, dtype=float32).to_list() == [1, 2, 3]
+
+    with pytest.raises(ValueError):
+        asarray(array, dtype=float32, copy=False)
+
+
+def test_asarray_from_ragged_list() -> None:
+    with pytest.raises(ValueError):
+        asarray([[1, 2], [3]])
+
+    with pytest.raises(TypeError):
+        asarray(["a"])
+
+
+def test_zeros_ones_full() -> None:
+    assert zeros((2, 3)).shape == (2, 3)
+    assert zeros(3).to_list() == [0, 0, 0]
+    assert ones(3, dtype=uint8).to_list() == [1, 1, 1]
+    assert full(2, 7).dtype == int64
+    assert full(2, 7.5).to_list() == [7.5, 7.5]
+    assert full(2, True).dtype == bool
+
+
+def test_like_functions() -> None:
+    array = asarray([[1, 2, 3], [4, 5, 6]], dtype=int32)
+
+    for out in (zeros_like(array), ones_like(array), full_like(array, 3), empty_like(array)):
+        assert out.shape == (2, 3)
+        assert out.dtype == int32
+    assert full_like(array, 3).to_list(row_major=True) == [[3, 3, 3], [3, 3, 3]]
+    assert empty_like(array, dtype=float32).dtype == float32
+
+
+def test_empty() -> None:
+    array = empty((2, 2), dtype=int16)
+
+    assert array.shape == (2, 2)
+    assert array.dtype == int16
+    assert empty(0).size == 0
+
+
+def test_arange() -> None:
+    assert arange(4).to_list() == [0, 1, 2, 3]
+    assert arange(4).dtype == int64
+    assert arange(1, 10, 3).to_list() == [1, 4, 7]
+    assert arange(10, 0, -4).to_list() == [10, 6, 2]
+    assert arange(0.0, 1.0, 0.25).to_list() == [0.0, 0.25, 0.5, 0.75]
+    assert arange(3, 1).size == 0
+
+    with pytest.raises(ValueError):
+        arange(0, 1, 0)
+
+
+def test_linspace() -> None:
+    assert linspace(0, 1, 5).to_list() == [0.0, 0.25, 0.5, 0.75, 1.0]
+    assert linspace(0, 1, 4, endpoint=False).to_list() == [0.0, 0.25, 0.5, 0.75]
+    assert linspace(0, 1, 3, dtype=float64).dtype == float64
+    assert linspace(0, 1, 0).size == 0
+
+    with pytest.raises(TypeError):
+        linspace(0, 1, 3, dtype=int32)
+
+
+def test_eye() -> None:
+    assert eye(2).to_list(row_major=True) == [[1, 0], [0, 1]]
+    assert eye(2, 3, k=1).to_list(row_major=True) == [[0, 1, 0], [0, 0, 1]]
+    assert eye(3, 2, k=-1, dtype=int32).to_list(row_major=True) == [[0, 0], [1, 0], [0, 1]]
+
+
+def test_creation_functions_do_not_warn() -> None:
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        asarray([1, 2, 3])
+        full((2, 2), 1.5)
+        arange(3)
+        eye(2, k=1)
@@ -18,5 +18,7 @@ class BaseArray(object):
     """
     Base array class for arrayfire. For internal use only.
     """
+    __slots__ = ['arr', '__weakref__']
+
     def __init__(self):
         self.arr = c_void_ptr_t(0)
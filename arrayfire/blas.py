@@ -13,8 +13,22 @@ BLAS functions (matmul, dot, etc)
 
 from .library import *
 from .array import *
+from .array import _compute_operand, _replace_handle, _shares_data, _to_out
 
-def matmul(lhs, rhs, lhs_opts=MATPROP.NONE, rhs_opts=MATPROP.NONE):
+# Types supported by gemm, whose output can be written in place
+_gemm_types = (Dtype.f32, Dtype.c32, Dtype.f64, Dtype.c64)
+
+def _gemm_dims(lhs, rhs, lhs_opts, rhs_opts):
+    """
+    Internal function returning the dims of the product of two matrices.
+    """
+    ldims = lhs.dims() + (1,)
+    rdims = rhs.dims() + (1,)
+    rows = ldims[0] if lhs_opts == MATPROP.NONE else ldims[1]
+    cols = rdims[1] if rhs_opts == MATPROP.NONE else rdims[0]
+    return (rows,) if cols == 1 else (rows, cols)
+
+def matmul(lhs, rhs, lhs_opts=MATPROP.NONE, rhs_opts=MATPROP.NONE, out=None):
     """
     Generalized matrix multiplication for two matrices.
 
@@ -39,6 +53,11 @@ def matmul(lhs, rhs, lhs_opts=MATPROP.NONE, rhs_opts=MATPROP.NONE):
                - af.MATPROP.TRANS  - If `rhs` has to be transposed before multiplying.
                - af.MATPROP.CTRANS - If `rhs` has to be hermitian transposed before multiplying.
 
+    out : optional: af.Array. default: None.
+          Array to store the result in, it is also returned.
+          For floating point matrices the result is written into its memory by gemm,
+          as long as no other array shares that memory. Otherwise `out` is given a new array.
+
     Returns
     -------
 
@@ -52,10 +71,16 @@ def matmul(lhs, rhs, lhs_opts=MATPROP.NONE, rhs_opts=MATPROP.NONE):
     - Batches are not supported.
 
     """
-    out = Array()
-    safe_call(backend.get().af_matmul(c_pointer(out.arr), lhs.arr, rhs.arr,
+    lhs = _compute_operand(lhs)
+    rhs = _compute_operand(rhs)
+    if (isinstance(out, Array) and out.arr.value and lhs.dtype() in _gemm_types and
+        lhs.numdims() <= 2 and rhs.numdims() <= 2 and not _shares_data(out)):
+        return gemm(lhs, rhs, 1.0, 0.0, lhs_opts, rhs_opts, C=out)
+
+    res = Array()
+    safe_call(backend.get().af_matmul(c_pointer(res.arr), lhs.arr, rhs.arr,
                                       lhs_opts.value, rhs_opts.value))
-    return out
+    return _to_out(res, out)
 
 def matmulTN(lhs, rhs):
     """
@@ -83,6 +108,8 @@ def matmulTN(lhs, rhs):
     - Batches are not supported.
 
     """
+    lhs = _compute_operand(lhs)
+    rhs = _compute_operand(rhs)
     out = Array()
     safe_call(backend.get().af_matmul(c_pointer(out.arr), lhs.arr, rhs.arr,
                                       MATPROP.TRANS.value, MATPROP.NONE.value))
@@ -114,6 +141,8 @@ def matmulNT(lhs, rhs):
     - Batches are not supported.
 
     """
+    lhs = _compute_operand(lhs)
+    rhs = _compute_operand(rhs)
     out = Array()
     safe_call(backend.get().af_matmul(c_pointer(out.arr), lhs.arr, rhs.arr,
                                       MATPROP.NONE.value, MATPROP.TRANS.value))
@@ -145,6 +174,8 @@ def matmulTT(lhs, rhs):
     - Batches are not supported.
 
     """
+    lhs = _compute_operand(lhs)
+    rhs = _compute_operand(rhs)
     out = Array()
     safe_call(backend.get().af_matmul(c_pointer(out.arr), lhs.arr, rhs.arr,
                                       MATPROP.TRANS.value, MATPROP.TRANS.value))
@@ -189,6 +220,8 @@ def dot(lhs, rhs, lhs_opts=MATPROP.NONE, rhs_opts=MATPROP.NONE, return_scalar =
     - Batches are not supported.
 
     """
+    lhs = _compute_operand(lhs)
+    rhs = _compute_operand(rhs)
     if return_scalar:
         real = c_double_t(0)
         imag = c_double_t(0)
@@ -243,6 +276,11 @@ def gemm(lhs, rhs, alpha=1.0, beta=0.0, lhs_opts=MATPROP.NONE, rhs_opts=MATPROP.
                - af.MATPROP.TRANS  - If `rhs` has to be transposed before multiplying.
                - af.MATPROP.CTRANS - If `rhs` has to be hermitian transposed before multiplying.
 
+    C : optional: af.Array. default: None.
+          Array holding C, the result is written into its memory and it is also returned.
+          When other arrays share the memory of C, C is given a new array and they keep their values.
+          A new array is created when it is None.
+
     Returns
     -------
 
@@ -256,13 +294,24 @@ def gemm(lhs, rhs, alpha=1.0, beta=0.0, lhs_opts=MATPROP.NONE, rhs_opts=MATPROP.
     - Batches are not supported.
 
     """
-    if C is None:
-        out = Array()
-    else:
-        out = C
-
+    lhs = _compute_operand(lhs)
+    rhs = _compute_operand(rhs)
     ltype = lhs.dtype()
 
+    if C is None or not C.arr.value:
+        out = Array() if C is None else C
+    else:
+        if C.dtype() != ltype:
+            raise TypeError("C is not the same type as lhs")
+        if lhs.numdims() <= 2 and rhs.numdims() <= 2 and C.dims() != _gemm_dims(lhs, rhs, lhs_opts, rhs_opts):
+            raise RuntimeError("C dims do not match those of the result")
+        if not _shares_data(C):
+            out = C
+        elif beta == 0:
+            out = Array()
+        else:
+            out = C.copy()
+
     if ltype == Dtype.f32:
         aptr = c_cast(c_pointer(c_float_t(alpha)),c_void_ptr_t)
         bptr = c_cast(c_pointer(c_float_t(beta)), c_void_ptr_t)
@@ -307,4 +356,9 @@ def gemm(lhs, rhs, alpha=1.0, beta=0.0, lhs_opts=MATPROP.NONE, rhs_opts=MATPROP.
     safe_call(backend.get().af_gemm(c_pointer(out.arr),
                                     lhs_opts.value, rhs_opts.value,
                                     aptr, lhs.arr, rhs.arr, bptr))
-    return out
+    if C is None:
+        return out
+    if out is not C:
+        return _replace_handle(C, out)
+    C._reset_meta()
+    return C
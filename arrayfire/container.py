@@ -0,0 +1,407 @@
+#######################################################
+# Copyright (c) 2015, ArrayFire
+# All rights reserved.
+#
+# This file is distributed under 3-clause BSD license.
+# The complete license agreement can be obtained at:
+# http://arrayfire.com/licenses/BSD-3-Clause
+########################################################
+
+"""
+Indexed container files holding many arrays.
+
+Layout of a container file:
+
+    magic                 8 bytes, b"AFCNTR01"
+    chunks                data of every array, column major, split along the last dimension
+    index                 utf-8 JSON: key -> {dtype, dims, compression, chunks}
+    index offset          8 bytes, little endian
+    magic                 8 bytes
+
+Each chunk holds whole slabs of the last dimension, so a read only touches
+the chunks overlapping the slabs it asks for.
+"""
+
+import itertools
+import json
+import mmap
+import os
+import struct
+import zlib
+from collections import deque
+from .library import *
+from .array import *
+from .array import _create_array, _create_empty_array, _get_host_data, _host_buffer
+from .array import _enter_thread_context, _thread_context
+from .device import pinned_pool, sync
+
+_magic = b"AFCNTR01"
+_footer = struct.Struct("<Q8s")
+
+def save_container(filename, arrays, compression=None, chunk_bytes=1 << 24):
+    """
+    Save several arrays to an indexed container file.
+
+    Parameters
+    ----------
+    filename : str
+        Location of the container file, overwritten if it exists.
+
+    arrays : dict
+        Maps each key (str) to the af.Array stored under it.
+
+    compression : optional: None or "zlib". default: None.
+        Compression applied to each chunk. Uncompressed chunks are read
+        straight from the memory mapped file.
+
+    chunk_bytes : optional: int. default: 16 MB.
+        Upper bound of the size of each chunk before compression. Chunks are
+        never thinner than one slab of the last dimension.
+
+    Examples
+    --------
+    >>> af.save_container("state.afc", {"weights": w, "bias": b}, compression="zlib")
+    >>> with af.ArrayContainer("state.afc") as f:
+    ...     w = f.read("weights", (slice(None), slice(0, 10)))
+    """
+    if compression not in (None, "zlib"):
+        raise RuntimeError("Unsupported compression: %s" % compression)
+
+    index = {}
+    with open(filename, "wb") as f:
+        f.write(_magic)
+        for key, a in arrays.items():
+            dtype = a.type()
+            dims = a.dims()
+            axis = len(dims) - 1
+            # Arrays whose last dimension is 0 are stored without chunks
+            slab_bytes = (a.elements() // dims[axis]) * ct.sizeof(to_c_type[dtype]) if dims[axis] else 0
+            step = max(1, chunk_bytes // max(1, slab_bytes))
+
+            chunks = []
+            for begin in range(0, dims[axis], step):
+                end = min(begin + step, dims[axis])
+                slab = a
+                if (end - begin) < dims[axis]:
+                    slab_key = [slice(None)] * len(dims)
+                    slab_key[axis] = slice(begin, end)
+                    slab = a[tuple(slab_key)]
+                data = _get_host_data(slab.arr, dtype, slab.elements())
+                size = len(data)
+                if compression == "zlib":
+                    data = zlib.compress(data)
+                chunks.append([f.tell(), len(data), size, begin, end])
+                f.write(data)
+
+            index[str(key)] = {"dtype" : dtype, "dims" : list(dims),
+                               "compression" : compression, "chunks" : chunks}
+
+        offset = f.tell()
+        f.write(json.dumps(index).encode("utf-8"))
+        f.write(_footer.pack(offset, _magic))
+
+class ArrayContainer(object):
+    """
+    Reader of the container files written by af.save_container.
+
+    The index is loaded once when the file is opened, and the file is memory
+    mapped so that only the chunks needed by each read are paged in.
+
+    Parameters
+    ----------
+    filename : str
+        Location of the container file.
+
+    Examples
+    --------
+    >>> with af.ArrayContainer("state.afc") as f:
+    ...     print(f.keys())
+    ...     w = f["weights"]
+    ...     rows = f.read("weights", (slice(0, 100),))
+    ...     last = f.read("weights", (slice(None), -1))
+    """
+
+    def __init__(self, filename):
+        # Set first so that close() works when open() fails
+        self._file = None
+        self._map = None
+        self._file = open(filename, "rb")
+        try:
+            size = os.fstat(self._file.fileno()).st_size
+            if size < len(_magic) + _footer.size:
+                raise RuntimeError("%s is not an arrayfire container" % filename)
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            offset, magic = _footer.unpack(self._map[size - _footer.size:])
+            if magic != _magic or self._map[:len(_magic)] != _magic:
+                raise RuntimeError("%s is not an arrayfire container" % filename)
+            self._index = json.loads(self._map[offset:size - _footer.size].decode("utf-8"))
+        except:
+            self.close()
+            raise
+
+    def close(self):
+        """
+        Close the file. Arrays already read stay valid.
+        """
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+    def keys(self):
+        """
+        Returns the keys of the arrays in the container.
+        """
+        return list(self._index.keys())
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def __getitem__(self, key):
+        return self.read(key)
+
+    def info(self, key):
+        """
+        Returns the type (af.Dtype) and dims (tuple) of the array stored under `key`.
+        """
+        entry = self._entry(key)
+        return Dtype(entry["dtype"]), tuple(entry["dims"])
+
+    def _entry(self, key):
+        try:
+            return self._index[key]
+        except KeyError:
+            raise KeyError("No array stored under key %r" % key)
+
+    def read(self, key, index=None):
+        """
+        Read an array, or a part of it, from the container.
+
+        Parameters
+        ----------
+        key : str
+            Key the array is stored under.
+
+        index : optional: tuple of int and slice. default: None.
+            Part of the array to read, as used with af.Array.__getitem__.
+            Only the slabs of the last dimension selected by it are read from the file.
+
+        Returns
+        -------
+        out : af.Array
+        """
+        entry = self._entry(key)
+        dims = list(entry["dims"])
+        axis = len(dims) - 1
+
+        if index is None:
+            index = ()
+        elif not isinstance(index, tuple):
+            index = (index,)
+        if len(index) > len(dims):
+            raise IndexError("Too many indices for an array with dims %s" % (tuple(dims),))
+
+        # Range of slabs to read along the last dimension, and the key left for the device
+        begin, end = 0, dims[axis]
+        index = list(index)
+        if len(index) > axis:
+            sel = index[axis]
+            if isinstance(sel, slice):
+                positions = range(*sel.indices(dims[axis]))
+                if len(positions) == 0:
+                    raise IndexError("Empty selection along the last dimension")
+                begin, end = min(positions), max(positions) + 1
+                if positions.step == 1:
+                    index[axis] = slice(None)
+                else:
+                    stop = positions.stop - begin
+                    index[axis] = slice(positions.start - begin, stop if stop >= 0 else None, positions.step)
+            else:
+                sel = int(sel)
+                begin = sel + dims[axis] if sel < 0 else sel
+                if not 0 <= begin < dims[axis]:
+                    raise IndexError("Index %d out of range for dimension of size %d" % (sel, dims[axis]))
+                end = begin + 1
+                index[axis] = slice(None)
+
+        out = self._read_slabs(entry, begin, end)
+        if any(not (isinstance(sel, slice) and sel == slice(None)) for sel in index):
+            out = out[tuple(index)]
+        return out
+
+    def _stage_slabs(self, entry, begin, end):
+        """
+        Returns a memoryview of the data of slabs [begin, end) of the last dimension.
+        """
+        dims = entry["dims"]
+        slab_bytes = ct.sizeof(to_c_type[entry["dtype"]])
+        for n in dims[:-1]:
+            slab_bytes *= n
+
+        chunks = [c for c in entry["chunks"] if c[3] < end and c[4] > begin]
+        if entry["compression"] is None:
+            # Chunks are stored back to back, use the mapped file as the staging buffer
+            start = chunks[0][0] + (begin - chunks[0][3]) * slab_bytes if chunks else 0
+            return memoryview(self._map)[start : start + (end - begin) * slab_bytes]
+
+        staging = bytearray()
+        for offset, size, raw_size, first, last in chunks:
+            data = zlib.decompress(self._map[offset : offset + size])
+            lo = (max(begin, first) - first) * slab_bytes
+            hi = (min(end, last) - first) * slab_bytes
+            staging += memoryview(data)[lo:hi]
+        return memoryview(staging)
+
+    def _read_slabs(self, entry, begin, end):
+        dims = list(entry["dims"])
+        dims[-1] = end - begin
+        view = self._stage_slabs(entry, begin, end)
+        buf = _host_buffer(view)
+        try:
+            return _upload(buf.ptr, dims, entry["dtype"])
+        finally:
+            buf.release()
+            view.release()
+
+def _upload(ptr, dims, dtype):
+    idims = list(dims) + [1] * (4 - len(dims))
+    out = Array()
+    if 0 in idims:
+        # Empty arrays have no data to copy
+        out.arr = _create_empty_array(len(dims), idims, Dtype(dtype))
+    else:
+        out.arr = _create_array(ptr, len(dims), idims, Dtype(dtype), False)
+    return out
+
+def _read_native(context, filename, item):
+    _enter_thread_context(context)
+    if isinstance(item, str):
+        return read_array(filename, key=item)
+    return read_array(filename, index=item)
+
+def _read_staged(context, container, entry):
+    """
+    Copies an array of a container to pinned memory, returns the pointer or None if it is empty.
+    """
+    _enter_thread_context(context)
+    view = container._stage_slabs(entry, 0, entry["dims"][-1])
+    try:
+        if not view.nbytes:
+            return None
+        buf = _host_buffer(view)
+        try:
+            ptr = pinned_pool().alloc(view.nbytes)
+            ct.memmove(ptr, buf.ptr, view.nbytes)
+            return ptr
+        finally:
+            buf.release()
+    finally:
+        view.release()
+
+def _is_container(filename):
+    with open(filename, "rb") as f:
+        return f.read(len(_magic)) == _magic
+
+def read_arrays(sources, workers=4):
+    """
+    Read many arrays from disk in parallel.
+
+    Files are read and decoded by a pool of worker threads while the arrays
+    already read are uploaded to the device, in order.
+
+    Parameters
+    ----------
+    sources : list
+        Each item is either
+        - a filename: the first array of an ArrayFire file, or the only array of a container file.
+        - a tuple (filename, key): key is the name (str) or index (int) of the array in the file.
+        Container files written by af.save_container and files written by af.save_array
+        can be mixed.
+
+    workers : optional: int. default: 4.
+        Number of worker threads reading files.
+
+    Returns
+    -------
+    out : list of af.Array
+        The arrays in the order of `sources`, all resident on the current device.
+
+    Examples
+    --------
+    >>> weights = af.read_arrays([("model.afc", "w%d" % i) for i in range(48)], workers=8)
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    if workers < 1:
+        raise RuntimeError("Number of workers must be at least 1")
+
+    context = _thread_context()
+
+    containers = {}
+    jobs = []
+    try:
+        # Opening the files up front reports missing files and keys before any work starts
+        for item in sources:
+            filename, key = (item, None) if isinstance(item, str) else item
+            if filename not in containers:
+                containers[filename] = ArrayContainer(filename) if _is_container(filename) else None
+            container = containers[filename]
+            if container is None:
+                jobs.append((_read_native, (context, filename, 0 if key is None else key), None))
+                continue
+            if key is None:
+                if len(container.keys()) != 1:
+                    raise RuntimeError("A key is needed to read from %s" % filename)
+                key = container.keys()[0]
+            elif isinstance(key, int):
+                key = container.keys()[key]
+            entry = container._entry(key)
+            jobs.append((_read_staged, (context, container, entry), entry))
+
+        out = []
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="arrayfire-read") as executor:
+            try:
+                # Two reads per worker are kept queued, bounding the staged memory
+                queued = iter(jobs)
+                for func, args, entry in itertools.islice(queued, 2 * workers):
+                    pending.append((executor.submit(func, *args), entry))
+                while pending:
+                    future, entry = pending.popleft()
+                    for func, args, next_entry in itertools.islice(queued, 1):
+                        pending.append((executor.submit(func, *args), next_entry))
+                    out.append(_finish_read(future.result(), entry))
+            except:
+                for future, entry in pending:
+                    if future.cancel() or entry is None or future.exception() is not None:
+                        continue
+                    if future.result() is not None:
+                        pinned_pool().free(future.result())
+                raise
+    finally:
+        for container in containers.values():
+            if container is not None:
+                container.close()
+
+    sync()
+    return out
+
+def _finish_read(result, entry):
+    if entry is None:
+        return result
+    try:
+        return _upload(result, entry["dims"], entry["dtype"])
+    finally:
+        if result is not None:
+            pinned_pool().free(result)
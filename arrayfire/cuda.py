@@ -79,11 +79,13 @@ def set_native_id(idx):
     import ctypes as ct
     from .util import safe_call as safe_call
     from .library import backend as backend
+    from .array import _clear_scalar_cache
 
     if (backend.name() != "cuda"):
         raise RuntimeError("Invalid backend loaded")
 
     safe_call(backend.get().afcu_set_native_id(idx))
+    _clear_scalar_cache()
     return
 
 def set_cublas_mode(mode=CUBLAS_MATH_MODE.DEFAULT):
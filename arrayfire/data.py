@@ -635,7 +635,7 @@ def flip(a, dim=0):
 
     """
     out = Array()
-    safe_call(backend.get().af_flip(c_pointer(out.arr), a.arr, c_int_t(dim)))
+    safe_call(backend.get().af_flip(c_pointer(out.arr), a.arr, c_uint_t(dim)))
     return out
 
 def lower(a, is_unit_diag=False):
@@ -895,5 +895,5 @@ def lookup(a, idx, dim=0):
         2.0000
     """
     out = Array()
-    safe_call(backend.get().af_lookup(c_pointer(out.arr), a.arr, idx.arr, c_int_t(dim)))
+    safe_call(backend.get().af_lookup(c_pointer(out.arr), a.arr, idx.arr, c_uint_t(dim)))
     return out
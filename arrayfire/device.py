@@ -10,6 +10,8 @@
 Functions to handle the available devices in the backend.
 """
 
+import threading
+from collections import OrderedDict
 from .library import *
 from .util import (safe_call, to_str, get_version)
 
@@ -81,6 +83,7 @@ def set_device(num):
          id of the desired device.
     """
     safe_call(backend.get().af_set_device(num))
+    _clear_scalar_cache()
 
 def info_str(verbose = False):
     """
@@ -181,18 +184,6 @@ def sync(device=None):
     dev = device if device is not None else get_device()
     safe_call(backend.get().af_sync(dev))
 
-def __eval(*args):
-    nargs = len(args)
-    if (nargs == 1):
-        safe_call(backend.get().af_eval(args[0].arr))
-    else:
-        c_void_p_n = c_void_ptr_t * nargs
-        arrs = c_void_p_n()
-        for n in range(nargs):
-            arrs[n] = args[n].arr
-        safe_call(backend.get().af_eval_multiple(c_int_t(nargs), c_pointer(arrs)))
-    return
-
 def eval(*args):
     """
     Evaluate one or more inputs together
@@ -204,7 +195,8 @@ def eval(*args):
     Note
     -----
 
-    All the input arrays to this function should be of the same size.
+    Arrays of the same shape are evaluated together, a separate
+    evaluation is made for each distinct shape.
 
     Examples
     --------
@@ -234,7 +226,55 @@ def eval(*args):
         if not isinstance(arg, Array):
             raise RuntimeError("All inputs to eval must be of type arrayfire.Array")
 
-    __eval(*args)
+    _eval_grouped(args)
+
+class batched_eval(object):
+    """
+    Context manager deferring the evaluation of arithmetic results.
+
+    Arrays produced by arithmetic operations inside the context are recorded.
+    When the outermost context exits, or before any of them is copied to the host,
+    the recorded arrays still alive are evaluated together with one
+    af_eval_multiple call per distinct shape.
+
+    Examples
+    --------
+
+    >>> a = af.randu(3, 3)
+    >>> with af.batched_eval():
+    ...     c = a + 1
+    ...     d = af.sin(a) * 2
+    ...     e = af.sum(a, 0) + 1
+    >>> # c and d are evaluated by a single kernel, e by another one
+
+    Note
+    -----
+
+    The context is local to the current thread and nested contexts join the outermost one.
+    """
+
+    def __enter__(self):
+        if _pending_eval.depth == 0:
+            _pending_eval.arrays = []
+            _pending_eval.limit = 256
+        _pending_eval.depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _pending_eval.depth -= 1
+        if _pending_eval.depth == 0:
+            try:
+                if exc_type is None:
+                    _flush_pending()
+            finally:
+                _pending_eval.arrays = None
+        return False
+
+    def flush(self):
+        """
+        Evaluate the arrays recorded so far.
+        """
+        _flush_pending()
 
 def set_manual_eval_flag(flag):
     """
@@ -475,4 +515,156 @@ def free_pinned(ptr):
     cptr = c_void_ptr_t(ptr)
     safe_call(backend.get().af_free_pinned(cptr))
 
-from .array import Array
+class _PinnedBlock(object):
+    """
+    Pinned buffer handed out by PinnedMemoryPool.view, returned to the pool when collected.
+    """
+    def __init__(self, pool, ptr, num_bytes):
+        self.pool = pool
+        self.ptr = ptr
+        self.__array_interface__ = {'shape' : (num_bytes,), 'typestr' : '|u1',
+                                    'data' : (ptr, False), 'version' : 3}
+
+    def __del__(self):
+        if self.ptr:
+            self.pool.free(self.ptr)
+            self.ptr = None
+
+class PinnedMemoryPool(object):
+    """
+    A cache of pinned (page locked) host buffers.
+
+    Requests are rounded up to a power of two size class. Freed buffers are kept
+    for reuse by later requests of the same class, the least recently freed ones
+    are released once the cached bytes exceed the limit.
+
+    Parameters
+    ----------
+    max_bytes : optional: int. default: 256 MB.
+        Maximum number of bytes held by free buffers in the pool.
+
+    Examples
+    --------
+    >>> pool = af.PinnedMemoryPool()
+    >>> ptr = pool.alloc(1000)   # 1024 bytes of pinned memory
+    >>> pool.free(ptr)           # kept for the next request
+    >>> host = pool.view((10, 10), "float32")
+    """
+
+    _min_bytes = 4096
+
+    def __init__(self, max_bytes=256 << 20):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # ptr -> (size class, library) of every buffer owned by the pool
+        self._owned = {}
+        # size class -> free pointers, least recently freed first
+        self._free = {}
+        # free pointer -> size class, least recently freed first
+        self._lru = OrderedDict()
+        self._cached_bytes = 0
+
+    def _size_class(self, num_bytes):
+        return max(self._min_bytes, 1 << (int(num_bytes) - 1).bit_length())
+
+    def alloc(self, num_bytes):
+        """
+        Returns a pointer to at least num_bytes of pinned host memory.
+        """
+        size = self._size_class(num_bytes)
+        with self._lock:
+            ptrs = self._free.get(size)
+            if ptrs:
+                ptr = ptrs.pop()
+                del self._lru[ptr]
+                self._cached_bytes -= size
+                return ptr
+
+        clib = backend.get()
+        cptr = c_void_ptr_t(0)
+        try:
+            safe_call(clib.af_alloc_pinned(c_pointer(cptr), c_dim_t(size)))
+        except RuntimeError:
+            # Out of page locked memory, release the cache and retry
+            self.clear()
+            safe_call(clib.af_alloc_pinned(c_pointer(cptr), c_dim_t(size)))
+
+        with self._lock:
+            self._owned[cptr.value] = (size, clib)
+        return cptr.value
+
+    def free(self, ptr):
+        """
+        Returns a pointer obtained from alloc to the pool.
+        """
+        with self._lock:
+            if ptr not in self._owned or ptr in self._lru:
+                raise RuntimeError("Pointer is not in use from this pool")
+            size = self._owned[ptr][0]
+            self._free.setdefault(size, []).append(ptr)
+            self._lru[ptr] = size
+            self._cached_bytes += size
+            evicted = self._evict(self.max_bytes)
+        self._release(evicted)
+
+    def view(self, shape, dtype, order='F'):
+        """
+        Returns an empty numpy.ndarray backed by pinned memory from the pool.
+
+        The memory goes back to the pool once the array and all views of it are collected.
+        """
+        import numpy as np
+        dtype = np.dtype(dtype)
+        count = 1
+        for dim in shape:
+            count *= dim
+        num_bytes = count * dtype.itemsize
+        if num_bytes == 0:
+            return np.empty(shape, dtype=dtype, order=order)
+
+        block = _PinnedBlock(self, self.alloc(num_bytes), num_bytes)
+        return np.asarray(block).view(dtype).reshape(shape, order=order)
+
+    def clear(self):
+        """
+        Releases all the free buffers held by the pool.
+        """
+        with self._lock:
+            evicted = self._evict(0)
+        self._release(evicted)
+
+    def cached_bytes(self):
+        """
+        Returns the number of bytes held by free buffers in the pool.
+        """
+        return self._cached_bytes
+
+    def _evict(self, limit):
+        evicted = []
+        while self._cached_bytes > limit:
+            ptr, size = self._lru.popitem(last=False)
+            # The least recently freed buffer is also the oldest of its size class
+            self._free[size].pop(0)
+            self._cached_bytes -= size
+            evicted.append((ptr, self._owned.pop(ptr)[1]))
+        return evicted
+
+    def _release(self, evicted):
+        for ptr, clib in evicted:
+            safe_call(clib.af_free_pinned(c_void_ptr_t(ptr)))
+
+_pinned_pool = None
+_pinned_pool_lock = threading.Lock()
+
+def pinned_pool():
+    """
+    Returns the PinnedMemoryPool used for staging host transfers.
+    """
+    global _pinned_pool
+    if _pinned_pool is None:
+        with _pinned_pool_lock:
+            if _pinned_pool is None:
+                _pinned_pool = PinnedMemoryPool()
+    return _pinned_pool
+
+from .array import Array, _clear_scalar_cache, _eval_grouped, _flush_pending, _pending_eval
@@ -0,0 +1,330 @@
+#######################################################
+# Copyright (c) 2015, ArrayFire
+# All rights reserved.
+#
+# This file is distributed under 3-clause BSD license.
+# The complete license agreement can be obtained at:
+# http://arrayfire.com/licenses/BSD-3-Clause
+########################################################
+
+"""
+Exchange of arrays with other libraries through DLPack.
+"""
+
+import threading
+from .library import *
+from .array import *
+from .array import _create_array, _create_strided_array
+
+# DLDeviceType values
+_kDLCPU = 1
+_kDLCUDA = 2
+_kDLCUDAHost = 3
+_kDLOpenCL = 4
+_kDLOneAPI = 14
+
+_backend_device_type = {'cpu' : _kDLCPU, 'cuda' : _kDLCUDA, 'opencl' : _kDLOpenCL, 'oneapi' : _kDLOneAPI}
+
+# DLDataTypeCode values
+_kDLInt = 0
+_kDLUInt = 1
+_kDLFloat = 2
+_kDLComplex = 5
+_kDLBool = 6
+
+_dtype_to_dl = {Dtype.f32.value : (_kDLFloat, 32),
+                Dtype.c32.value : (_kDLComplex, 64),
+                Dtype.f64.value : (_kDLFloat, 64),
+                Dtype.c64.value : (_kDLComplex, 128),
+                Dtype.b8.value  : (_kDLBool, 8),
+                Dtype.s32.value : (_kDLInt, 32),
+                Dtype.u32.value : (_kDLUInt, 32),
+                Dtype.u8.value  : (_kDLUInt, 8),
+                Dtype.s64.value : (_kDLInt, 64),
+                Dtype.u64.value : (_kDLUInt, 64),
+                Dtype.s16.value : (_kDLInt, 16),
+                Dtype.u16.value : (_kDLUInt, 16),
+                Dtype.f16.value : (_kDLFloat, 16)}
+
+_dl_to_dtype = dict((v, Dtype(k)) for k, v in _dtype_to_dl.items())
+
+class _DLDevice(ct.Structure):
+    _fields_ = [("device_type", ct.c_int32),
+                ("device_id", ct.c_int32)]
+
+class _DLDataType(ct.Structure):
+    _fields_ = [("code", ct.c_uint8),
+                ("bits", ct.c_uint8),
+                ("lanes", ct.c_uint16)]
+
+class _DLTensor(ct.Structure):
+    _fields_ = [("data", ct.c_void_p),
+                ("device", _DLDevice),
+                ("ndim", ct.c_int32),
+                ("dtype", _DLDataType),
+                ("shape", ct.POINTER(ct.c_int64)),
+                ("strides", ct.POINTER(ct.c_int64)),
+                ("byte_offset", ct.c_uint64)]
+
+_DLDeleter = ct.CFUNCTYPE(None, ct.c_void_p)
+
+class _DLManagedTensor(ct.Structure):
+    _fields_ = [("dl_tensor", _DLTensor),
+                ("manager_ctx", ct.c_void_p),
+                ("deleter", _DLDeleter)]
+
+_dltensor_name = b"dltensor"
+_used_dltensor_name = b"used_dltensor"
+
+_PyCapsule_Destructor = ct.CFUNCTYPE(None, ct.c_void_p)
+
+_PyCapsule_New = ct.PYFUNCTYPE(ct.py_object, ct.c_void_p, ct.c_char_p,
+                               _PyCapsule_Destructor)(("PyCapsule_New", ct.pythonapi))
+_PyCapsule_GetPointer = ct.PYFUNCTYPE(ct.c_void_p, ct.py_object, ct.c_char_p)(("PyCapsule_GetPointer", ct.pythonapi))
+_PyCapsule_SetName = ct.PYFUNCTYPE(ct.c_int, ct.py_object, ct.c_char_p)(("PyCapsule_SetName", ct.pythonapi))
+# The capsule destructor gets an object being deallocated, it must not be used as a py_object
+_PyCapsule_IsValid = ct.PYFUNCTYPE(ct.c_int, ct.c_void_p, ct.c_char_p)(("PyCapsule_IsValid", ct.pythonapi))
+_PyCapsule_GetPointerRaw = ct.PYFUNCTYPE(ct.c_void_p, ct.c_void_p, ct.c_char_p)(("PyCapsule_GetPointer", ct.pythonapi))
+
+# Exported tensors, keyed by the address of their DLManagedTensor, until the consumer deletes them
+_exports = {}
+_exports_lock = threading.Lock()
+
+class _Export(object):
+    """
+    Keeps the DLManagedTensor of an exported array and the af_array holding its memory.
+    """
+    def __init__(self, clib, handle, ndim):
+        self.clib = clib
+        self.handle = handle
+        self.shape = (ct.c_int64 * ndim)()
+        self.strides = (ct.c_int64 * ndim)()
+        self.managed = _DLManagedTensor()
+
+def _delete_export(managed_ptr):
+    with _exports_lock:
+        export = _exports.pop(managed_ptr, None)
+    if export is not None:
+        safe_call(export.clib.af_unlock_array(export.handle))
+        safe_call(export.clib.af_release_array(export.handle))
+
+def _destroy_capsule(capsule):
+    # Capsules never consumed still own their tensor
+    if _PyCapsule_IsValid(capsule, _dltensor_name):
+        managed_ptr = _PyCapsule_GetPointerRaw(capsule, _dltensor_name)
+        managed = _DLManagedTensor.from_address(managed_ptr)
+        if managed.deleter:
+            managed.deleter(managed_ptr)
+
+# C callbacks must stay alive as long as any capsule using them
+_delete_export_func = _DLDeleter(_delete_export)
+_destroy_capsule_func = _PyCapsule_Destructor(_destroy_capsule)
+
+def _active_backend_name():
+    name = backend.name()
+    return get_active_backend() if name == 'unified' else name
+
+def _dlpack_device(arr):
+    """
+    Returns the (device type, device id) tuple of the active backend and device.
+    """
+    name = _active_backend_name()
+    if name not in _backend_device_type:
+        raise RuntimeError("DLPack is not supported on the %s backend" % name)
+    device_type = _backend_device_type[name]
+    if device_type == _kDLCPU:
+        return (device_type, 0)
+    device = c_int_t(0)
+    safe_call(backend.get().af_get_device(c_pointer(device)))
+    return (device_type, device.value)
+
+def _to_dlpack(arr):
+    """
+    Returns a DLPack capsule sharing the memory of the af_array handle `arr`.
+
+    The memory is locked and a reference to it is held until the consumer deletes the tensor.
+    """
+    clib = backend.get()
+    device_type, device_id = _dlpack_device(arr)
+
+    # Only linear arrays have a plain device pointer, others are exported as a copy
+    linear = c_bool_t(False)
+    safe_call(clib.af_is_linear(c_pointer(linear), arr))
+    handle = c_void_ptr_t(0)
+    if linear.value:
+        safe_call(clib.af_retain_array(c_pointer(handle), arr))
+    else:
+        safe_call(clib.af_copy_array(c_pointer(handle), arr))
+
+    try:
+        ptr = c_void_ptr_t(0)
+        safe_call(clib.af_get_device_ptr(c_pointer(ptr), handle))
+
+        ndim = c_uint_t(0)
+        safe_call(clib.af_get_numdims(c_pointer(ndim), handle))
+        dims = [c_dim_t(0) for _ in range(4)]
+        safe_call(clib.af_get_dims(*([c_pointer(d) for d in dims] + [handle])))
+        dtype = c_int_t(0)
+        safe_call(clib.af_get_type(c_pointer(dtype), handle))
+        # The consumer reads the data on its own queue, finish pending work first
+        safe_call(clib.af_sync(c_int_t(-1)))
+    except:
+        safe_call(clib.af_release_array(handle))
+        raise
+
+    export = _Export(clib, handle, ndim.value)
+    stride = 1
+    for n in range(ndim.value):
+        export.shape[n] = dims[n].value
+        export.strides[n] = stride
+        stride *= dims[n].value
+
+    tensor = export.managed.dl_tensor
+    tensor.data = ptr.value
+    tensor.device = _DLDevice(device_type, device_id)
+    tensor.ndim = ndim.value
+    code, bits = _dtype_to_dl[dtype.value]
+    tensor.dtype = _DLDataType(code, bits, 1)
+    tensor.shape = ct.cast(export.shape, ct.POINTER(ct.c_int64))
+    tensor.strides = ct.cast(export.strides, ct.POINTER(ct.c_int64))
+    tensor.byte_offset = 0
+    export.managed.deleter = _delete_export_func
+
+    managed_ptr = ct.addressof(export.managed)
+    with _exports_lock:
+        _exports[managed_ptr] = export
+    return _PyCapsule_New(managed_ptr, _dltensor_name, _destroy_capsule_func)
+
+class _Import(object):
+    """
+    Owner of a consumed DLManagedTensor, calls its deleter once collected.
+    """
+    def __init__(self, managed_ptr):
+        self.managed_ptr = managed_ptr
+
+    def __del__(self):
+        if self.managed_ptr:
+            managed = _DLManagedTensor.from_address(self.managed_ptr)
+            if managed.deleter:
+                managed.deleter(self.managed_ptr)
+            self.managed_ptr = None
+
+def _from_dlpack(x):
+    """
+    Returns an af_array handle for a DLPack capsule or an object with __dlpack__,
+    along with the object that must be kept alive as long as the handle.
+    """
+    capsule = x.__dlpack__() if hasattr(x, "__dlpack__") else x
+    try:
+        managed_ptr = _PyCapsule_GetPointer(capsule, _dltensor_name)
+    except ValueError:
+        raise TypeError("Expected an unused DLPack capsule or an object implementing __dlpack__")
+    _PyCapsule_SetName(capsule, _used_dltensor_name)
+    owner = _Import(managed_ptr)
+
+    tensor = _DLManagedTensor.from_address(managed_ptr).dl_tensor
+    key = (tensor.dtype.code, tensor.dtype.bits)
+    if key not in _dl_to_dtype or tensor.dtype.lanes != 1:
+        raise TypeError("Unsupported DLPack data type (code %d, bits %d, lanes %d)" %
+                        (tensor.dtype.code, tensor.dtype.bits, tensor.dtype.lanes))
+    dtype = _dl_to_dtype[key]
+
+    ndim = tensor.ndim
+    if ndim > 4:
+        raise RuntimeError("Arrays with more than 4 dimensions are not supported")
+    shape = [tensor.shape[n] for n in range(ndim)] or [1]
+    if tensor.strides and ndim:
+        strides = [tensor.strides[n] for n in range(ndim)]
+    else:
+        # No strides means a compact row major tensor
+        strides = [1] * len(shape)
+        for n in reversed(range(len(shape) - 1)):
+            strides[n] = strides[n + 1] * shape[n + 1]
+
+    itemsize = tensor.dtype.bits // 8
+    if tensor.byte_offset % itemsize:
+        raise RuntimeError("DLPack byte offset is not a multiple of the element size")
+    offset = tensor.byte_offset // itemsize
+
+    device_type = tensor.device.device_type
+    local_type = _backend_device_type.get(_active_backend_name())
+    if device_type == local_type:
+        is_device = True
+    elif device_type in (_kDLCPU, _kDLCUDAHost):
+        # Host memory used on a device backend is copied
+        is_device = False
+    else:
+        raise RuntimeError("Can not use DLPack device type %d on the %s backend" %
+                           (device_type, _active_backend_name()))
+
+    # Strides of dimensions of size 1 are meaningless
+    strides = [s if d > 1 else 1 for s, d in zip(strides, shape)]
+    # ArrayFire needs a unit stride on the first dimension. Row major tensors are
+    # wrapped as their transpose, with reversed dims, and reordered afterwards.
+    reverse = strides[0] != 1 and strides[-1] == 1
+    if reverse:
+        shape.reverse()
+        strides.reverse()
+    if strides[0] != 1 or any(s <= 0 for s in strides):
+        raise RuntimeError("DLPack tensors need a unit stride on their first or last dimension")
+
+    idims = shape + [1] * (4 - len(shape))
+    compact = [1] * len(shape)
+    for n in range(1, len(shape)):
+        compact[n] = compact[n - 1] * shape[n - 1]
+    if offset == 0 and all(s == c or d == 1 for s, c, d in zip(strides, compact, shape)):
+        handle = _create_array(tensor.data, len(shape), idims, dtype, is_device)
+    else:
+        handle = _create_strided_array(tensor.data, len(shape), idims, dtype, is_device, offset, tuple(strides))
+
+    if is_device:
+        # Memory of the producer is never freed by the memory manager
+        safe_call(backend.get().af_lock_array(handle))
+
+    if reverse:
+        order = tuple(reversed(range(len(shape)))) + tuple(range(len(shape), 4))
+        out = c_void_ptr_t(0)
+        try:
+            safe_call(backend.get().af_reorder(c_pointer(out), handle, *order))
+        finally:
+            safe_call(backend.get().af_release_array(handle))
+        handle = out
+
+    return handle, (owner if is_device else None)
+
+def from_dlpack(x):
+    """
+    Create an af.Array sharing the memory of a DLPack tensor.
+
+    Parameters
+    ----------
+    x : object
+        Any object implementing __dlpack__ (numpy.ndarray, torch.Tensor, af.Array, ...),
+        or a DLPack capsule.
+
+    Returns
+    -------
+    out : af.Array
+        Array with the dims of the shape of `x`.
+
+    Examples
+    --------
+    >>> n = np.asfortranarray(np.random.random((3, 4)))
+    >>> a = af.from_dlpack(n)        # No copy on the cpu backend
+    >>> m = np.from_dlpack(a)        # No copy on the cpu backend
+    >>> c = af.from_dlpack(np.random.random((3, 4)))    # Row major, reordered on the device
+
+    Note
+    -----
+    - Tensors on the device of the active backend are used in place. Host tensors used
+      with other backends are copied to the device.
+    - Row major tensors (the default of numpy and torch) are reordered into a new
+      column major array, on the device.
+    - The tensor is released once the returned array, and all copies of it, are collected.
+      Lazy results computed from the array must be evaluated before that.
+    """
+    handle, owner = _from_dlpack(x)
+    out = Array()
+    out.arr = handle
+    out._host_owner = owner
+    return out
@@ -0,0 +1,261 @@
+#######################################################
+# Copyright (c) 2015, ArrayFire
+# All rights reserved.
+#
+# This file is distributed under 3-clause BSD license.
+# The complete license agreement can be obtained at:
+# http://arrayfire.com/licenses/BSD-3-Clause
+########################################################
+
+"""
+Trace and replay of element wise functions.
+"""
+
+import functools
+import threading
+from collections import OrderedDict
+from .library import *
+from .array import *
+from .array import _eval_grouped, _pending_eval, _track_pending
+from . import array as _array
+from .bcast import _bcast_var
+
+class _Trace(object):
+    """
+    Sequence of C calls recorded while running a function on its inputs.
+
+    Every af_array is identified by a slot, the inputs take the first slots
+    and every recorded call adds one for its result.
+    """
+
+    def __init__(self, inputs):
+        self.nargs = len(inputs)
+        self.slots = {}
+        self.constants = {}
+        self.steps = []
+        self.outputs = None
+        self.valid = True
+        # Keeps the recorded results alive so their handles are not reused during the trace
+        self.results = []
+        for idx, arr in enumerate(inputs):
+            self.slots.setdefault(arr.arr.value, idx)
+
+    def add_constant(self, arr):
+        self.constants.setdefault(arr.arr.value, arr)
+
+    def replace(self, out):
+        # Replaying can not modify the arrays passed in
+        if self.valid and self.slots.get(out.arr.value, self.nargs) < self.nargs:
+            self.valid = False
+
+    def record(self, out, c_func, args):
+        if not self.valid:
+            return
+
+        if c_func is None:
+            self.valid = False
+            return
+
+        template = []
+        positions = []
+        for pos, arg in enumerate(args):
+            if isinstance(arg, Array):
+                handle = arg.arr.value
+                if handle in self.slots:
+                    template.append(None)
+                    positions.append((pos, self.slots[handle]))
+                elif handle in self.constants:
+                    template.append(self.constants[handle].arr)
+                else:
+                    # Array computed by an operation that was not recorded
+                    self.valid = False
+                    return
+            else:
+                template.append(arg)
+
+        self.slots[out.arr.value] = self.nargs + len(self.steps)
+        self.steps.append((c_func, tuple(template), tuple(positions)))
+        self.results.append(out)
+
+    def finish(self, res):
+        """
+        Record the outputs of the traced function, returns False if `res` can not be replayed.
+        """
+        single = isinstance(res, Array)
+        outputs = [res] if single else res
+        if type(outputs) not in (tuple, list):
+            return False
+
+        slots = []
+        for arr in outputs:
+            if not isinstance(arr, Array) or arr.arr.value not in self.slots:
+                return False
+            slots.append(self.slots[arr.arr.value])
+
+        self.outputs = (tuple(slots), single, type(res))
+        # Only the handles of the constants are needed from now on
+        self.constants = list(self.constants.values())
+        self.slots = None
+        self.results = None
+        return self.valid
+
+    def replay(self, inputs):
+        handles = [arr.arr for arr in inputs]
+        try:
+            for c_func, template, positions in self.steps:
+                args = list(template)
+                for pos, slot in positions:
+                    args[pos] = handles[slot]
+                out = c_void_ptr_t(0)
+                safe_call(c_func(c_pointer(out), *args))
+                handles.append(out)
+
+            slots, single, res_type = self.outputs
+            outputs = []
+            for slot in slots:
+                arr = Array()
+                safe_call(backend.get().af_retain_array(c_pointer(arr.arr), handles[slot]))
+                outputs.append(arr)
+        finally:
+            for handle in handles[self.nargs:]:
+                safe_call(backend.get().af_release_array(handle))
+
+        _eval_grouped(outputs)
+        for arr in outputs:
+            _track_pending(arr)
+
+        if single:
+            return outputs[0]
+        return tuple(outputs) if res_type is tuple else outputs
+
+class fuse(object):
+    """
+    Decorator replaying the arithmetic of a function from a recorded trace.
+
+    The first call for a given signature (the shapes and types of the arrays
+    and the values of the other arguments) runs the function while recording
+    its arithmetic calls. Later calls with the same signature replay the
+    recorded calls directly and evaluate all the outputs together.
+
+    Parameters
+    ----------
+    func : function
+        Function taking and returning arrayfire arrays.
+
+    maxsize : optional: int. default: 32.
+        Number of signatures whose trace is kept, least recently used first out.
+
+    Examples
+    --------
+
+    >>> @af.fuse
+    ... def cnd(x):
+    ...     temp = (x > 0)
+    ...     return temp * (0.5 + af.erf(x / 1.4142) / 2) + (1 - temp) * (0.5 - af.erf((-x) / 1.4142) / 2)
+    >>> a = af.randu(3, 3)
+    >>> b = cnd(a)  # traced
+    >>> c = cnd(a)  # replayed
+
+    >>> @af.fuse(maxsize=4)
+    ... def axpy(alpha, x, y):
+    ...     return alpha * x + y
+
+    Note
+    -----
+
+    - Only element wise arithmetic (operators, arith functions, cast and clamp) is recorded.
+      Functions calling anything else, reading data on the host or returning values other
+      than arrays always run directly.
+    - Arrays used by the function must be passed as arguments, non array arguments
+      and any global state are assumed not to change for a given signature.
+    """
+
+    def __new__(cls, func=None, maxsize=32):
+        if func is None:
+            return functools.partial(cls, maxsize=maxsize)
+        return super(fuse, cls).__new__(cls)
+
+    def __init__(self, func=None, maxsize=32):
+        functools.update_wrapper(self, func)
+        self.func = func
+        self.maxsize = maxsize
+        self._traces = OrderedDict()
+        self._generation = _array._cache_generation
+        self._lock = threading.Lock()
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return functools.partial(self, obj)
+
+    def _signature(self, args, kwargs):
+        # Traces hold handles of the backend and device active on the calling thread
+        key = [_bcast_var.get(), _array._thread_context()]
+        inputs = []
+        # Inputs sharing a handle use one slot of the trace, the aliasing is part of the key
+        first = {}
+        for arg in list(args) + [kwargs[name] for name in sorted(kwargs)]:
+            if isinstance(arg, Array):
+                alias = first.setdefault(arg.arr.value, len(inputs))
+                key.append((arg.dims(), arg.type(), alias))
+                inputs.append(arg)
+            else:
+                key.append((type(arg), arg))
+        key.append(tuple(sorted(kwargs)))
+        return tuple(key), inputs
+
+    def __call__(self, *args, **kwargs):
+        # Nested calls are recorded into the enclosing trace
+        if _pending_eval.trace is not None:
+            return self.func(*args, **kwargs)
+
+        try:
+            key, inputs = self._signature(args, kwargs)
+            hash(key)
+        except TypeError:
+            return self.func(*args, **kwargs)
+
+        with self._lock:
+            if self._generation != _array._cache_generation:
+                self._traces.clear()
+                self._generation = _array._cache_generation
+            trace = self._traces.get(key, False)
+            if trace is not False:
+                self._traces.move_to_end(key)
+
+        if trace is None:
+            return self.func(*args, **kwargs)
+        if trace is not False:
+            return trace.replay(inputs)
+
+        trace = _Trace(inputs)
+        pending = _pending_eval.arrays
+        _pending_eval.trace = trace
+        _pending_eval.arrays = None
+        try:
+            res = self.func(*args, **kwargs)
+        finally:
+            _pending_eval.trace = None
+            _pending_eval.arrays = pending
+
+        if not trace.finish(res):
+            trace = None
+        else:
+            outputs = [res] if isinstance(res, Array) else res
+            _eval_grouped(outputs)
+            for arr in outputs:
+                _track_pending(arr)
+
+        with self._lock:
+            # Signatures that can not be replayed are remembered as None
+            self._traces[key] = trace
+            while len(self._traces) > self.maxsize:
+                self._traces.popitem(last=False)
+        return res
+
+    def cache_clear(self):
+        """
+        Drop all the recorded traces.
+        """
+        with self._lock:
+            self._traces.clear()
@@ -81,7 +81,7 @@ class Window(object):
             Pixel offset from top
 
         """
-        safe_call(backend.get().af_set_position(self._wnd, c_int_t(x), c_int_t(y)))
+        safe_call(backend.get().af_set_position(self._wnd, c_uint_t(x), c_uint_t(y)))
 
     def set_title(self, title):
         """
@@ -94,7 +94,7 @@ class Window(object):
             Title used for the current window.
 
         """
-        safe_call(backend.get().af_set_title(self._wnd, title))
+        safe_call(backend.get().af_set_title(self._wnd, title.encode('utf-8')))
 
     def set_colormap(self, cmap):
         """
@@ -353,12 +353,12 @@ class Window(object):
                                                                 xdirs.arr, ydirs.arr,
                                                                 c_pointer(_cell)))
             else:
-                safe_call(backend.get().af_draw_vector_field_2d(self._wnd,
+                safe_call(backend.get().af_draw_vector_field_3d(self._wnd,
                                                                 xpoints.arr, ypoints.arr, zpoints.arr,
                                                                 xdirs.arr, ydirs.arr, zdirs.arr,
                                                                 c_pointer(_cell)))
         else:
-            safe_call(backend.get().af_draw_plot_nd(self._wnd, points.arr, dirs.arr, c_pointer(_cell)))
+            safe_call(backend.get().af_draw_vector_field_nd(self._wnd, points.arr, dirs.arr, c_pointer(_cell)))
 
     def surface(self, x_vals, y_vals, z_vals, title=None):
         """
@@ -490,7 +490,7 @@ class Window(object):
                                                           c_float_t(ymin), c_float_t(ymax),
                                                           exact, c_pointer(_cell)))
         else:
-            safe_call(backend.get().af_set_axes_limits_2d(self._wnd,
+            safe_call(backend.get().af_set_axes_limits_3d(self._wnd,
                                                           c_float_t(xmin), c_float_t(xmax),
                                                           c_float_t(ymin), c_float_t(ymax),
                                                           c_float_t(zmin), c_float_t(zmax),
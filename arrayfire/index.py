@@ -16,6 +16,8 @@ from .util import _is_number
 from .base import *
 from .bcast import _bcast_var
 import math
+import threading
+from collections import OrderedDict
 
 class Seq(ct.Structure):
     """
@@ -249,3 +251,161 @@ class _Index4(object):
     def __setitem__(self, idx, value):
         self.array[idx] = value
         self.idxs[idx] = value
+
+def _slice_to_length(key, dim):
+    tkey = [key.start, key.stop, key.step]
+
+    if tkey[0] is None:
+        tkey[0] = 0
+    elif tkey[0] < 0:
+        tkey[0] = dim - tkey[0]
+
+    if tkey[1] is None:
+        tkey[1] = dim
+    elif tkey[1] < 0:
+        tkey[1] = dim - tkey[1]
+
+    if tkey[2] is None:
+        tkey[2] = 1
+
+    return int(((tkey[1] - tkey[0] - 1) / tkey[2]) + 1)
+
+class IndexPlan(object):
+    """
+    Indices of a subscript, resolved once for arrays of a given shape.
+
+    Boolean arrays are converted to the locations of their true values when
+    the plan is built, so reusing a plan does not reduce the mask again.
+
+    Attributes
+    ----------
+
+    dims: tuple
+          Dimensions of the arrays the plan applies to.
+
+    assign_dims: tuple
+          Dimensions of the selected region.
+
+    Parameters
+    ----------
+
+    key: index
+         Any subscript accepted by af.Array.__getitem__.
+
+    dims: tuple
+          Dimensions of the arrays that will be indexed, as returned by af.Array.dims().
+
+    Note
+    ----
+
+    The contents of arrays used in `key` are captured when the plan is built.
+    """
+
+    def __init__(self, key, dims):
+        self.dims = tuple(dims)
+        self.numdims = len(self.dims)
+        idims = list(self.dims) + [1] * (4 - self.numdims)
+
+        keys = key if isinstance(key, tuple) else (key,)
+        if len(keys) > 4:
+            raise IndexError("Can not index more than 4 dimensions")
+
+        self._inds = _Index4()
+        assign = list(idims)
+        for n, k in enumerate(keys):
+            idx = Index(k)
+            self._inds[n] = idx
+            if isinstance(k, ParallelRange):
+                assign[n] = _slice_to_length(k.S, idims[n])
+            elif isinstance(k, slice):
+                assign[n] = _slice_to_length(k, idims[n])
+            elif isinstance(k, BaseArray):
+                # Number of locations after the af_where conversion of boolean arrays
+                c_elems = c_dim_t(0)
+                safe_call(backend.get().af_get_elements(c_pointer(c_elems), c_void_ptr_t(idx.idx.arr)))
+                assign[n] = c_elems.value
+            else:
+                assign[n] = 1
+
+        # A single boolean array indexes the linearized array
+        self.empty = False
+        if isinstance(key, BaseArray) and key.type() == Dtype.b8.value:
+            self.numdims = 1
+            self.empty = assign[0] == 0
+            assign = [assign[0], 1, 1, 1]
+
+        self.assign_dims = tuple(assign)
+
+    @property
+    def pointer(self):
+        return self._inds.pointer
+
+_index_plan_cache = OrderedDict()
+_index_plan_cache_size = 128
+_index_plan_cache_lock = threading.Lock()
+
+def _index_plan_key(key):
+    """
+    Hashable form of subscripts made of numbers and slices, None for any other subscript.
+    """
+    parts = []
+    for k in (key if isinstance(key, tuple) else (key,)):
+        if isinstance(k, slice):
+            parts.append((k.start, k.stop, k.step))
+        elif _is_number(k):
+            parts.append(k)
+        else:
+            return None
+    return (isinstance(key, tuple), tuple(parts))
+
+def index_plan(key, dims):
+    """
+    Resolve a subscript once for reuse on arrays of the same shape.
+
+    Parameters
+    ----------
+
+    key: index
+         Any subscript accepted by af.Array.__getitem__.
+
+    dims: tuple
+          Dimensions of the arrays that will be indexed, as returned by af.Array.dims().
+
+    Returns
+    -------
+
+    plan: af.IndexPlan
+          Can be used in place of `key` to index or assign to arrays of shape `dims`.
+
+    Examples
+    --------
+
+    >>> a = af.randu(5, 5)
+    >>> plan = af.index_plan((a[:, 0] > 0.5, slice(1, 3)), a.dims())
+    >>> for i in range(10):
+    ...     b = a[plan]
+    ...     a[plan] = i
+    """
+    return IndexPlan(key, dims)
+
+def _cached_index_plan(key, dims):
+    """
+    Internal function returning an IndexPlan, shared between calls for number and slice subscripts.
+    """
+    hkey = _index_plan_key(key)
+    if hkey is None:
+        return IndexPlan(key, dims)
+
+    hkey = (hkey, dims)
+    with _index_plan_cache_lock:
+        plan = _index_plan_cache.get(hkey)
+        if plan is not None:
+            _index_plan_cache.move_to_end(hkey)
+            return plan
+
+    plan = IndexPlan(key, dims)
+    with _index_plan_cache_lock:
+        _index_plan_cache[hkey] = plan
+        while len(_index_plan_cache) > _index_plan_cache_size:
+            _index_plan_cache.popitem(last=False)
+    return plan
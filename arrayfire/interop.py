@@ -20,7 +20,9 @@ This module provides helper functions to copy data to arrayfire from the followi
 """
 
 from .array import *
+from .array import _storage_dtype
 from .device import *
+from .layout import RowMajorArray
 
 
 def _fc_to_af_array(in_ptr, in_shape, in_dtype, is_device=False, copy = True):
@@ -35,10 +37,14 @@ def _fc_to_af_array(in_ptr, in_shape, in_dtype, is_device=False, copy = True):
     lock_array(res)
     return res.copy() if copy else res
 
-def _cc_to_af_array(in_ptr, ndim, in_shape, in_dtype, is_device=False, copy = True):
+def _cc_to_af_array(in_ptr, ndim, in_shape, in_dtype, is_device=False, copy = True, row_major = False):
     """
     C Contiguous to af array
     """
+    if row_major:
+        # The data is already laid out as the transpose, keep it as is
+        res = _fc_to_af_array(in_ptr, tuple(reversed(in_shape)), in_dtype, is_device, copy)
+        return RowMajorArray(res, ndim)
     if ndim == 1:
         return _fc_to_af_array(in_ptr, in_shape, in_dtype, is_device, copy)
     else:
@@ -47,12 +53,25 @@ def _cc_to_af_array(in_ptr, ndim, in_shape, in_dtype, is_device=False, copy = Tr
         if is_device: lock_array(res)
         return res._reorder()
 
+def _strided_to_af_array(in_ptr, in_shape, in_strides, in_dtype, is_device=False, copy = True):
+    """
+    Strided to af array, in_strides are in elements
+    """
+    res = Array(in_ptr, in_shape, in_dtype, is_device=is_device, offset=0, strides=in_strides)
+
+    if not is_device:
+        return res
+
+    lock_array(res)
+    return res.copy() if copy else res
+
 _nptype_to_aftype = {'b1' : Dtype.b8,
 		     'u1' : Dtype.u8,
 		     'u2' : Dtype.u16,
 		     'i2' : Dtype.s16,
 		     's4' : Dtype.u32,
 		     'i4' : Dtype.s32,
+		     'f2' : Dtype.f16,
 		     'f4' : Dtype.f32,
 		     'c8' : Dtype.c32,
 		     's8' : Dtype.u64,
@@ -70,7 +89,7 @@ else:
 
     AF_NUMPY_FOUND=True
 
-    def np_to_af_array(np_arr, copy=True):
+    def np_to_af_array(np_arr, copy=True, row_major=False):
         """
         Convert numpy.ndarray to arrayfire.Array.
 
@@ -80,30 +99,170 @@ else:
 
         copy : Bool specifying if array is to be copied.
                Default is true.
-               Can only be False if array is fortran contiguous.
+               Can only be False on the cpu backend, the memory of np_arr is then used
+               in place and must not be modified while the array is in use.
+               np_arr is only kept alive by the returned array and its copies made with
+               af.Array(src). Indexed views and lazy results computed from the array share
+               its memory without keeping np_arr alive: they must be evaluated, or copied
+               with .copy(), before both the returned array and np_arr are collected.
+
+        row_major : Bool specifying if an af.RowMajorArray is returned.
+                    C contiguous arrays are then copied without reordering the data.
+                    Default is False.
 
         Returns
         ---------
-        af_arr  : arrayfire.Array()
+        af_arr  : arrayfire.Array() or arrayfire.RowMajorArray() if row_major is True.
+
+        Note
+        -----
+        - numpy.float16 arrays are copied as Dtype.f16 arrays.
+        - When copying, floating point arrays are converted to the type set by
+          af.set_storage_dtype on the host, before the upload.
         """
 
+        if copy:
+            storage = _storage_dtype(_nptype_to_aftype[np_arr.dtype.str[1:]], np_arr.size)
+            if storage is not None:
+                np_arr = np_arr.astype(to_typecode[storage.value], order='K')
+
         in_shape = np_arr.shape
         in_ptr = np_arr.ctypes.data_as(c_void_ptr_t)
         in_dtype = _nptype_to_aftype[np_arr.dtype.str[1:]]
+        # Shape and strides of the view in the order of the dims of the arrayfire array
+        af_shape = tuple(reversed(in_shape)) if row_major else in_shape
+        af_strides = _np_strides(np_arr, row_major)
+        # C ordered data is kept as is when a RowMajorArray is requested
+        c_order = np_arr.flags['C_CONTIGUOUS'] and (row_major or not np_arr.flags['F_CONTIGUOUS'])
 
         if not copy:
-            raise RuntimeError("Copy can not be False for numpy arrays")
-
-        if (np_arr.flags['F_CONTIGUOUS']):
-            return _fc_to_af_array(in_ptr, in_shape, in_dtype)
-        elif (np_arr.flags['C_CONTIGUOUS']):
-            return _cc_to_af_array(in_ptr, np_arr.ndim, in_shape, in_dtype)
+            if get_active_backend() != 'cpu':
+                raise RuntimeError("Copy can only be False for numpy arrays on the cpu backend")
+            if (c_order and row_major):
+                res = _fc_to_af_array(in_ptr, tuple(reversed(in_shape)), in_dtype, True, False)
+            elif (np_arr.flags['F_CONTIGUOUS']):
+                res = _fc_to_af_array(in_ptr, in_shape, in_dtype, True, False)
+            elif af_strides is not None:
+                res = _strided_to_af_array(in_ptr, af_shape, af_strides, in_dtype, True, False)
+            else:
+                raise RuntimeError("Copy can not be False for numpy views whose innermost dimension "
+                                   "is not contiguous, or with negative strides")
+            # The memory is used in place, keep the ndarray alive along with the array
+            res._host_owner = np_arr
+            if row_major:
+                in_place = c_order or not np_arr.flags['F_CONTIGUOUS']
+                return RowMajorArray(res, np_arr.ndim) if in_place else RowMajorArray.from_array(res)
+            return res
+
+        if c_order:
+            return _cc_to_af_array(in_ptr, np_arr.ndim, in_shape, in_dtype, row_major=row_major)
+        elif (np_arr.flags['F_CONTIGUOUS']):
+            res = _fc_to_af_array(in_ptr, in_shape, in_dtype)
+        elif af_strides is not None:
+            # Strided views are read in place, without a contiguous copy on the host
+            res = _strided_to_af_array(in_ptr, af_shape, af_strides, in_dtype)
+            return RowMajorArray(res, np_arr.ndim) if row_major else res
         else:
-            return np_to_af_array(np_arr.copy())
+            return np_to_af_array(np.ascontiguousarray(np_arr) if row_major else np_arr.copy(),
+                                  row_major=row_major)
+
+        return RowMajorArray.from_array(res) if row_major else res
+
+    def _np_strides(np_arr, row_major=False):
+        """
+        Strides of np_arr in elements, in reverse order if row_major is True.
+
+        None if they can not be used by af_create_strided_array, which needs
+        positive strides and a contiguous first dimension.
+        """
+        itemsize = np_arr.itemsize
+        strides = []
+        for dim, stride in zip(np_arr.shape, np_arr.strides):
+            if dim > 1 and (stride <= 0 or stride % itemsize):
+                return None
+            strides.append(stride // itemsize if dim > 1 else 1)
+        if row_major:
+            strides.reverse()
+        return tuple(strides) if strides and strides[0] == 1 else None
 
     from_ndarray = np_to_af_array
 
+    def stack_from_host(arrays, axis=-1):
+        """
+        Stack numpy arrays along a new axis into one arrayfire.Array with a single upload.
+
+        The items are written in place into one pinned staging buffer from
+        af.pinned_pool(), already laid out as the output, which is then
+        copied to the device at once.
+
+        Parameters
+        ----------
+        arrays : sequence of numpy.ndarray (or objects numpy.asarray accepts)
+                 Items of the same shape, with at most 3 dimensions.
+
+        axis : int. default: -1.
+               Position of the new axis in the dimensions of the output, as in numpy.stack.
+               The default puts the items along the last dimension, each one contiguous.
+
+        Returns
+        ---------
+        af_arr  : arrayfire.Array() with the dims of numpy.stack(arrays, axis).
+
+        Examples
+        --------
+        >>> images = [np.random.random((28, 28)).astype(np.float32) for _ in range(64)]
+        >>> batch = af.stack_from_host(images)   # dims (28, 28, 64)
+        """
+        arrays = [np.asarray(item) for item in arrays]
+        if not arrays:
+            raise RuntimeError("Need at least one array to stack")
+
+        shape = arrays[0].shape
+        for item in arrays:
+            if item.shape != shape:
+                raise RuntimeError("All arrays must have the same shape, got %s and %s" % (shape, item.shape))
+        if len(shape) > 3:
+            raise RuntimeError("Arrays with more than 3 dimensions can not be stacked")
+
+        ndim = len(shape) + 1
+        if not -ndim <= axis < ndim:
+            raise IndexError("axis %d is out of bounds for %d dimensions" % (axis, ndim))
+        axis %= ndim
+
+        dtype = np.result_type(*arrays)
+        out_shape = shape[:axis] + (len(arrays),) + shape[axis:]
+        in_dtype = _nptype_to_aftype[dtype.str[1:]]
+
+        elements = len(arrays)
+        for dim in shape:
+            elements *= dim
+        storage = _storage_dtype(in_dtype, elements)
+        if storage is not None:
+            # The items are converted while they are written to the staging buffer
+            in_dtype = storage
+            dtype = np.dtype(to_typecode[storage.value])
+
+        nbytes = dtype.itemsize * elements
+        if not nbytes:
+            return Array(None, out_shape, in_dtype)
+
+        pool = pinned_pool()
+        ptr = pool.alloc(nbytes)
+        try:
+            staging = np.ndarray(out_shape, dtype=dtype, order='F',
+                                 buffer=(ct.c_char * nbytes).from_address(ptr))
+            index = [slice(None)] * ndim
+            for i, item in enumerate(arrays):
+                index[axis] = i
+                staging[tuple(index)] = item
+            del staging
+            return _fc_to_af_array(c_void_ptr_t(ptr), out_shape, in_dtype)
+        finally:
+            pool.free(ptr)
+
 try:
+    # Creates the CUDA context used by pycuda, only once interop is loaded
+    import pycuda.autoinit
     import pycuda.gpuarray
 except ImportError:
     AF_PYCUDA_FOUND=False
@@ -258,7 +417,7 @@ else:
         else:
             return numba_to_af_array(nb_arr.copy())
 
-def to_array(in_array, copy = True):
+def to_array(in_array, copy = True, row_major = False):
     """
     Helper function to convert input from a different module to af.Array
 
@@ -277,11 +436,20 @@ def to_array(in_array, copy = True):
           Default is true.
           Can only be False if array is fortran contiguous.
 
+    row_major : Bool specifying if an af.RowMajorArray is returned.
+          Default is False.
+          Only C contiguous numpy arrays avoid reordering the data.
+
     Returns
     --------------
-    af.Array of same dimensions as input after copying the data from the input
+    af.Array of same dimensions as input after copying the data from the input,
+    or af.RowMajorArray of same shape if row_major is True.
 
     """
+    if row_major:
+        if AF_NUMPY_FOUND and isinstance(in_array, NumpyArray):
+            return np_to_af_array(in_array, copy, row_major=True)
+        return RowMajorArray.from_array(to_array(in_array, copy))
     if AF_NUMPY_FOUND and isinstance(in_array, NumpyArray):
         return np_to_af_array(in_array, copy)
     if AF_PYCUDA_FOUND and isinstance(in_array, CudaArray):
@@ -0,0 +1,286 @@
+#######################################################
+# Copyright (c) 2015, ArrayFire
+# All rights reserved.
+#
+# This file is distributed under 3-clause BSD license.
+# The complete license agreement can be obtained at:
+# http://arrayfire.com/licenses/BSD-3-Clause
+########################################################
+
+"""
+Row major views of arrayfire arrays.
+"""
+
+import operator
+from .library import *
+from .array import *
+from .array import _flush_pending, _get_host_data, _host_to_lists
+from .algorithm import sum, product, min, max, all_true, any_true, count
+from .statistics import mean
+
+class RowMajorArray(object):
+    """
+    An array in row major (C) order, stored as the column major af.Array of its transpose.
+
+    Data in row major order is the column major data of the array with its
+    dimensions reversed. RowMajorArray keeps such an array as is, instead of
+    reordering it, and reverses the dimensions in its shape, index keys and
+    reduction axes. Copies to and from row major host memory need no reorder.
+
+    Parameters
+    ----------
+    base : af.Array
+        Column major array whose dimensions are the reverse of the row major shape.
+
+    ndim : optional: int. default: None.
+        Number of dimensions of the row major array, needed when the last
+        dimensions of `base` have size 1. Defaults to base.numdims().
+
+    Examples
+    --------
+    >>> a = af.np_to_af_array(np.ones((3, 4), dtype=np.float32), row_major=True)
+    >>> a.shape
+    (3, 4)
+    >>> b = (2 * a[1:, :]).sum(axis=1)    # No reorder of the data
+    >>> b.to_ndarray()                    # C contiguous numpy array of shape (2, 1)
+    >>> c = a.to_array()                  # af.Array with dims (3, 4), reordered once
+
+    Note
+    -----
+    - Reductions keep the reduced axes with a size of 1, like the rest of arrayfire.
+    - Functions of arrayfire taking an af.Array can be used through apply,
+      as long as they work element wise.
+    """
+
+    __slots__ = ['base', 'ndim']
+
+    def __init__(self, base, ndim=None):
+        if not isinstance(base, Array):
+            raise TypeError("base must be an af.Array")
+        self.base = base
+        self.ndim = base.numdims() if ndim is None else ndim
+        if self.ndim < base.numdims() or self.ndim > 4:
+            raise RuntimeError("Invalid number of dimensions %d for an array with dims %s" %
+                               (self.ndim, base.dims()))
+
+    @classmethod
+    def from_array(cls, a):
+        """
+        Returns the row major array with the same shape and contents as af.Array `a`.
+        """
+        ndim = a.numdims()
+        return cls(_reverse_dims(a, ndim), ndim)
+
+    def to_array(self):
+        """
+        Returns an af.Array with the same shape and contents, reordering the data.
+        """
+        return _reverse_dims(self.base, self.ndim)
+
+    @property
+    def shape(self):
+        dims = self.base.dims() + (1,) * (self.ndim - self.base.numdims())
+        return tuple(reversed(dims[:self.ndim]))
+
+    def type(self):
+        """
+        Return the data type as an int.
+        """
+        return self.base.type()
+
+    def dtype(self):
+        """
+        Return the data type as an arrayfire.Dtype enum value.
+        """
+        return self.base.dtype()
+
+    def elements(self):
+        """
+        Return the number of elements in the array.
+        """
+        return self.base.elements()
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __repr__(self):
+        return "RowMajorArray(shape=%s, dtype=%s)" % (self.shape, self.dtype().name)
+
+    def __str__(self):
+        return self.__repr__() + "\n" + str(self.base)
+
+    def _af_key(self, key):
+        if not isinstance(key, tuple):
+            key = (key,)
+        if len(key) > self.ndim:
+            raise IndexError("Too many indices for an array of shape %s" % (self.shape,))
+        key = tuple(k.base if isinstance(k, RowMajorArray) else k for k in key)
+        return tuple(reversed(key + (slice(None),) * (self.ndim - len(key))))
+
+    def _af_dim(self, axis):
+        if not -self.ndim <= axis < self.ndim:
+            raise IndexError("Axis %d out of range for an array of shape %s" % (axis, self.shape))
+        return self.ndim - 1 - (axis % self.ndim)
+
+    def _operand(self, other):
+        if isinstance(other, RowMajorArray):
+            if other.shape != self.shape:
+                raise RuntimeError("Shapes %s and %s do not match" % (self.shape, other.shape))
+            return other.base
+        if isinstance(other, Array):
+            # Mixing layouts would silently transpose one of the operands
+            raise TypeError("Can not combine RowMajorArray and af.Array, convert one of them first")
+        return other
+
+    def __getitem__(self, key):
+        return RowMajorArray(self.base[self._af_key(key)], self.ndim)
+
+    def __setitem__(self, key, val):
+        if isinstance(val, RowMajorArray):
+            val = val.base
+        self.base[self._af_key(key)] = val
+
+    def apply(self, func, *args, **kwargs):
+        """
+        Returns the RowMajorArray of func(self.base, *args, **kwargs) for an element wise function `func`.
+
+        RowMajorArray arguments are passed as their base array.
+        """
+        args = [self._operand(arg) for arg in args]
+        return RowMajorArray(func(self.base, *args, **kwargs), self.ndim)
+
+    def _reduce(self, func, axis):
+        if axis is None:
+            return func(self.base)
+        return RowMajorArray(func(self.base, dim=self._af_dim(axis)), self.ndim)
+
+    def sum(self, axis=None):
+        """
+        Sum along `axis`, or of all the elements if axis is None.
+        """
+        return self._reduce(sum, axis)
+
+    def product(self, axis=None):
+        """
+        Product along `axis`, or of all the elements if axis is None.
+        """
+        return self._reduce(product, axis)
+
+    def min(self, axis=None):
+        """
+        Minimum along `axis`, or of all the elements if axis is None.
+        """
+        return self._reduce(min, axis)
+
+    def max(self, axis=None):
+        """
+        Maximum along `axis`, or of all the elements if axis is None.
+        """
+        return self._reduce(max, axis)
+
+    def mean(self, axis=None):
+        """
+        Mean along `axis`, or of all the elements if axis is None.
+        """
+        return self._reduce(mean, axis)
+
+    def all_true(self, axis=None):
+        """
+        Check if all the elements along `axis`, or all the elements if axis is None, are true.
+        """
+        return self._reduce(all_true, axis)
+
+    def any_true(self, axis=None):
+        """
+        Check if any the elements along `axis`, or any of the elements if axis is None, are true.
+        """
+        return self._reduce(any_true, axis)
+
+    def count(self, axis=None):
+        """
+        Count the non zero elements along `axis`, or of all the elements if axis is None.
+        """
+        return self._reduce(count, axis)
+
+    def to_list(self):
+        """
+        Return the data as nested lists, indexed in the order of shape.
+        """
+        _flush_pending()
+        buf = _get_host_data(self.base.arr, self.type(), self.elements())
+        return _host_to_lists(buf, self.type(), self.shape)
+
+    def to_ndarray(self, output=None):
+        """
+        Parameters
+        -----------
+        output: optional: numpy. default: None
+
+        Returns
+        ----------
+        If output is None: Constructs a C contiguous numpy.array from the RowMajorArray.
+        If output is not None: copies content of the RowMajorArray into numpy array.
+
+        Note
+        ------
+        - Only a fortran contiguous output needs the data to be reordered.
+        """
+        _flush_pending()
+        import numpy as np
+        if output is None:
+            output = np.empty(self.shape, dtype=to_typecode[self.type()], order='C')
+
+        if (output.dtype != to_typecode[self.type()]):
+            raise TypeError("Output is not the same type as the array")
+
+        if (output.size != self.elements()):
+            raise RuntimeError("Output size does not match that of input")
+
+        flags = output.flags
+        if flags['C_CONTIGUOUS']:
+            tmp = self.base
+        elif flags['F_CONTIGUOUS']:
+            tmp = self.to_array()
+        else:
+            raise RuntimeError("When output is not None, it must be contiguous")
+
+        if output.size:
+            safe_call(backend.get().af_get_data_ptr(c_void_ptr_t(output.ctypes.data), tmp.arr))
+        return output
+
+    def __array__(self):
+        return self.to_ndarray()
+
+    def __neg__(self):
+        return RowMajorArray(-self.base, self.ndim)
+
+    def __abs__(self):
+        return RowMajorArray(abs(self.base), self.ndim)
+
+def _reverse_dims(a, ndim):
+    if ndim <= 1:
+        return a
+    rdims = tuple(reversed(range(ndim))) + tuple(range(ndim, 4))
+    out = Array()
+    safe_call(backend.get().af_reorder(c_pointer(out.arr), a.arr, *rdims))
+    return out
+
+def _binary_op(op, reflected=False):
+    def func(self, other):
+        other = self._operand(other)
+        res = op(other, self.base) if reflected else op(self.base, other)
+        return RowMajorArray(res, self.ndim)
+    return func
+
+for _name, _op in [("add", operator.add), ("sub", operator.sub), ("mul", operator.mul),
+                   ("truediv", operator.truediv), ("mod", operator.mod), ("pow", operator.pow),
+                   ("and", operator.and_), ("or", operator.or_), ("xor", operator.xor),
+                   ("lshift", operator.lshift), ("rshift", operator.rshift)]:
+    setattr(RowMajorArray, "__%s__" % _name, _binary_op(_op))
+    setattr(RowMajorArray, "__r%s__" % _name, _binary_op(_op, True))
+
+for _name, _op in [("lt", operator.lt), ("le", operator.le), ("gt", operator.gt),
+                   ("ge", operator.ge), ("eq", operator.eq), ("ne", operator.ne)]:
+    setattr(RowMajorArray, "__%s__" % _name, _binary_op(_op))
+
+del _name, _op
@@ -16,6 +16,7 @@ import ctypes as ct
 import traceback
 import os
 import sys
+import json
 
 c_float_t     = ct.c_float
 c_double_t    = ct.c_double
@@ -44,6 +45,10 @@ class af_cdouble_t(ct.Structure):
 AF_VER_MAJOR = '3'
 FORGE_VER_MAJOR = '1'
 
+# Pointer width of the interpreter. Same as platform.architecture()[0][:2] without
+# spawning `file` on the python executable.
+_ARCH_BITS = str(ct.sizeof(ct.c_void_p) * 8)
+
 # Work around for unexpected architectures
 if 'c_dim_t_forced' in globals():
     global c_dim_t_forced
@@ -52,7 +57,7 @@ else:
     # dim_t is long long by default
     c_dim_t = c_longlong_t
     # Change to int for 32 bit x86 and amr architectures
-    if (platform.architecture()[0][0:2] == '32' and
+    if (_ARCH_BITS == '32' and
         (platform.machine()[-2:] == '86' or
          platform.machine()[0:3] == 'arm')):
         c_dim_t = c_int_t
@@ -568,7 +573,7 @@ def _setup():
         if CUDA_PATH is None:
             CUDA_PATH='/usr/local/cuda/'
 
-        if platform.architecture()[0][:2] == '64':
+        if _ARCH_BITS == '64':
             CUDA_FOUND = os.path.isdir(CUDA_PATH + '/lib64') and os.path.isdir(CUDA_PATH + '/nvvm/lib64')
         else:
             CUDA_FOUND = os.path.isdir(CUDA_PATH + '/lib') and os.path.isdir(CUDA_PATH + '/nvvm/lib')
@@ -577,6 +582,128 @@ def _setup():
 
     return pre, post, AF_PATH, AF_SEARCH_PATH, CUDA_FOUND
 
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return -1
+
+class _backend_cache(object):
+    """
+    On-disk record of the libraries found by a previous backend search.
+
+    Records are keyed by the search environment (AF_PATH, AF_SEARCH_PATH, CUDA_PATH, ...)
+    and are discarded as soon as the modification time of any searched directory
+    or loaded library changes. Set AF_DISABLE_BACKEND_CACHE=1 to bypass the cache.
+    """
+
+    def __init__(self, key, search_dirs):
+        self.__key = key
+        self.__stamp = dict((d, _mtime(d)) for d in search_dirs)
+        self.__record = None
+        self.__enabled = os.environ.get('AF_DISABLE_BACKEND_CACHE', '0') != '1'
+
+        cache_dir = os.environ.get('AF_CACHE_DIR')
+        if cache_dir is None:
+            if platform.system() == 'Windows':
+                cache_dir = os.environ.get('LOCALAPPDATA', os.path.expanduser('~'))
+            else:
+                cache_dir = os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache'))
+            cache_dir = os.path.join(cache_dir, 'arrayfire-python')
+        self.__filename = os.path.join(cache_dir, 'backends.json')
+
+    def __read(self):
+        if self.__record is not None:
+            return self.__record
+
+        self.__record = {'stamp' : self.__stamp, 'libs' : {}}
+        if not self.__enabled:
+            return self.__record
+
+        try:
+            with open(self.__filename, 'r') as f:
+                record = json.load(f).get(self.__key)
+        except (OSError, ValueError, AttributeError):
+            record = None
+
+        if record is not None and record.get('stamp') == self.__stamp:
+            self.__record = record
+        return self.__record
+
+    def lookup(self, name):
+        """
+        Return the cached entry for `name` or None if it has to be searched again.
+        """
+        entry = self.__read()['libs'].get(name)
+        if entry is None:
+            return None
+        if entry['path'] is not None and entry['mtime'] is not None:
+            if entry['mtime'] != _mtime(entry['path']):
+                return None
+        return entry
+
+    def store(self, name, path, extra=None):
+        """
+        Record the library used for `name`. A path of None records that it is unavailable.
+        """
+        mtime = _mtime(path) if (path is not None and os.path.isabs(path)) else None
+        self.__read()['libs'][name] = {'path' : path, 'mtime' : mtime, 'extra' : extra}
+
+        if not self.__enabled:
+            return
+
+        try:
+            try:
+                with open(self.__filename, 'r') as f:
+                    content = json.load(f)
+                if not isinstance(content, dict):
+                    content = {}
+            except (OSError, ValueError):
+                content = {}
+            content[self.__key] = self.__record
+
+            os.makedirs(os.path.dirname(self.__filename), exist_ok=True)
+            tmp_filename = '%s.%d.tmp' % (self.__filename, os.getpid())
+            with open(tmp_filename, 'w') as f:
+                json.dump(content, f)
+            os.replace(tmp_filename, self.__filename)
+        except OSError:
+            pass
+
+class _binding(object):
+    """
+    Typed view of a loaded ArrayFire library.
+
+    Functions listed in `_PROTOTYPES` are bound through a ctypes prototype on first
+    use and stored as attributes of the instance, so every later lookup is a plain
+    attribute access. Functions without a prototype (afcl_*, afcu_*, ...) fall back
+    to the untyped function of the underlying library.
+    """
+
+    def __init__(self, clib):
+        self._clib = clib
+
+    def __getattr__(self, name):
+        try:
+            argtypes = _PROTOTYPES[name]
+        except KeyError:
+            func = getattr(self._clib, name)
+        else:
+            restype = _RESTYPES.get(name, c_int_t)
+            func = _prototype(restype, argtypes)((name, self._clib))
+        setattr(self, name, func)
+        return func
+
+_prototypes = {}
+
+def _prototype(restype, argtypes):
+    key = (restype, argtypes)
+    try:
+        return _prototypes[key]
+    except KeyError:
+        _prototypes[key] = proto = ct.CFUNCTYPE(restype, *argtypes)
+        return proto
+
 class _clibrary(object):
 
     def __find_nvrtc_builtins_libname(self, search_path):
@@ -590,22 +717,8 @@ class _clibrary(object):
         post = self.__post.replace(_VER_MAJOR_PLACEHOLDER, ver_major)
         libname = self.__pre + head + name + post
 
-        if self.AF_PATH:
-            if os.path.isdir(self.AF_PATH + '/lib64'):
-                path_search = self.AF_PATH + '/lib64/'
-            else:
-                path_search = self.AF_PATH + '/lib/'
-        else:
-            if os.path.isdir(self.AF_SEARCH_PATH + '/lib64'):
-                path_search = self.AF_SEARCH_PATH + '/lib64/'
-            else:
-                path_search = self.AF_SEARCH_PATH + '/lib/'
-
-        if platform.architecture()[0][:2] == '64':
-            path_site  = sys.prefix + '/lib64/'
-        else:
-            path_site  = sys.prefix + '/lib/'
-
+        path_search = self.__path_search()
+        path_site = self.__path_site()
         path_local = self.AF_PYMODULE_PATH
         libpaths = [('', libname),
                     (path_site, libname),
@@ -616,16 +729,148 @@ class _clibrary(object):
             libpaths.insert(2, (path_search, libname))
         return libpaths
 
+    def __path_search(self):
+        root = self.AF_PATH if self.AF_PATH else self.AF_SEARCH_PATH
+        if os.path.isdir(root + '/lib64'):
+            return root + '/lib64/'
+        else:
+            return root + '/lib/'
+
+    def __path_site(self):
+        if _ARCH_BITS == '64':
+            return sys.prefix + '/lib64/'
+        else:
+            return sys.prefix + '/lib/'
+
+    def __load_forge(self):
+        entry = self.__cache.lookup('forge')
+        if entry is not None:
+            libnames = [('', entry['path'])] if entry['path'] is not None else []
+        else:
+            libnames = reversed(self.__libname('forge', head='', ver_major=FORGE_VER_MAJOR))
+
+        full_libname = None
+        for libname in libnames:
+            try:
+                full_libname = libname[0] + libname[1]
+                ct.cdll.LoadLibrary(full_libname)
+                if self.__verbose:
+                    print('Loaded ' + full_libname)
+                break
+            except OSError:
+                if self.__verbose:
+                    traceback.print_exc()
+                    print('Unable to load ' + full_libname)
+                full_libname = None
+
+        if entry is None:
+            self.__cache.store('forge', full_libname)
+
+    def __load_nvrtc(self, libdir):
+        if not libdir:
+            return None
+
+        nvrtc_name = self.__find_nvrtc_builtins_libname(libdir)
+        if nvrtc_name:
+            ct.cdll.LoadLibrary(libdir + nvrtc_name)
+            if self.__verbose:
+                print('Loaded ' + libdir + nvrtc_name)
+            return libdir + nvrtc_name
+
+        if self.__verbose:
+            print('Could not find local nvrtc-builtins libarary')
+        return None
+
+    def __probe(self, clib):
+        c_dim4 = c_dim_t*4
+        out = c_void_ptr_t(0)
+        dims = c_dim4(10, 10, 1, 1)
+        err = clib.af_randu(c_pointer(out), 4, c_pointer(dims), Dtype.f32.value)
+        if (err == ERR.NONE.value):
+            clib.af_release_array(out)
+            return True
+        return False
+
+    def __load_cached(self, name, entry):
+        try:
+            clib = ct.CDLL(entry['path'])
+            if entry['extra']:
+                ct.cdll.LoadLibrary(entry['extra'])
+        except OSError:
+            if self.__verbose:
+                traceback.print_exc()
+                print('Unable to load cached ' + entry['path'])
+            return None
+
+        if self.__verbose:
+            print('Loaded ' + entry['path'])
+        self.__clibs[name] = _binding(clib)
+        return self.__clibs[name]
+
+    def __load(self, name):
+        """
+        Load and probe the library of a single backend. Returns None if it is unavailable.
+        """
+        if name in self.__searched:
+            return self.__clibs[name]
+        self.__searched.add(name)
+
+        if not self.__forge_searched:
+            self.__forge_searched = True
+            self.__load_forge()
+
+        entry = self.__cache.lookup(name)
+        if entry is not None:
+            if entry['path'] is None:
+                return None
+            clib = self.__load_cached(name, entry)
+            if clib is not None:
+                return clib
+
+        libnames = reversed(self.__libname('' if name == 'unified' else name))
+        for libname in libnames:
+            try:
+                full_libname = libname[0] + libname[1]
+                clib = ct.CDLL(full_libname)
+                if self.__probe(clib):
+                    if self.__verbose:
+                        print('Loaded ' + full_libname)
+
+                    # load nvrtc-builtins library if using cuda
+                    nvrtc = self.__load_nvrtc(libname[0]) if name == 'cuda' else None
+
+                    self.__clibs[name] = _binding(clib)
+                    self.__cache.store(name, full_libname, nvrtc)
+                    return self.__clibs[name]
+            except OSError:
+                if self.__verbose:
+                    traceback.print_exc()
+                    print('Unable to load ' + full_libname)
+
+        self.__cache.store(name, None)
+        return None
+
+    def __select(self):
+        more_info_str = "Please look at https://github.com/arrayfire/arrayfire-python/wiki for more information."
+
+        # Iterate in order of preference
+        for name in ('unified', 'cuda', 'opencl', 'cpu'):
+            lib = self.__load(name)
+            if lib is not None:
+                self.__active = (name, lib)
+                return
+
+        raise RuntimeError("Could not load any ArrayFire libraries.\n" + more_info_str)
+
     def set_unsafe(self, name):
-        lib = self.__clibs[name]
+        lib = self.__load(name)
         if (lib is None):
             raise RuntimeError("Backend not found")
-        self.__name = name
+        # Swap name and bound functions together so no caller sees a mix of both
+        self.__active = (name, lib)
 
     def __init__(self):
 
-        more_info_str = "Please look at https://github.com/arrayfire/arrayfire-python/wiki for more information."
-
         pre, post, AF_PATH, AF_SEARCH_PATH, CUDA_FOUND = _setup()
 
         self.__pre = pre
@@ -638,8 +883,16 @@ class _clibrary(object):
         af_module = __import__(__name__)
         self.AF_PYMODULE_PATH = af_module.__path__[0] + '/' if af_module.__path__ else None
 
+        try:
+            self.__verbose = os.environ['AF_VERBOSE_LOADS'] == '1'
+        except KeyError:
+            self.__verbose = False
+
+        self.__active = None
 
-        self.__name = None
+        # Libraries are only loaded (and probed) when a backend is first requested
+        self.__searched = set()
+        self.__forge_searched = False
 
         self.__clibs = {'cuda'    : None,
                         'opencl'  : None,
@@ -657,68 +910,14 @@ class _clibrary(object):
                                    'cuda'    : 2,
                                    'opencl'  : 4}
 
-        # Try to pre-load forge library if it exists
-        libnames = reversed(self.__libname('forge', head='', ver_major=FORGE_VER_MAJOR))
-
-        try:
-            VERBOSE_LOADS = os.environ['AF_VERBOSE_LOADS'] == '1'
-        except KeyError:
-            VERBOSE_LOADS = False
-
-        for libname in libnames:
-            try:
-                full_libname = libname[0] + libname[1]
-                ct.cdll.LoadLibrary(full_libname)
-                if VERBOSE_LOADS:
-                    print('Loaded ' + full_libname)
-                break
-            except OSError:
-                if VERBOSE_LOADS:
-                    traceback.print_exc()
-                    print('Unable to load ' + full_libname)
-
-        c_dim4 = c_dim_t*4
-        out = c_void_ptr_t(0)
-        dims = c_dim4(10, 10, 1, 1)
-
-        # Iterate in reverse order of preference
-        for name in ('cpu', 'opencl', 'cuda', ''):
-            libnames = reversed(self.__libname(name))
-            for libname in libnames:
-                try:
-                    full_libname = libname[0] + libname[1]
-
-                    ct.cdll.LoadLibrary(full_libname)
-                    __name = 'unified' if name == '' else name
-                    clib = ct.CDLL(full_libname)
-                    self.__clibs[__name] = clib
-                    err = clib.af_randu(c_pointer(out), 4, c_pointer(dims), Dtype.f32.value)
-                    if (err == ERR.NONE.value):
-                        self.__name = __name
-                        clib.af_release_array(out)
-                        if VERBOSE_LOADS:
-                            print('Loaded ' + full_libname)
-
-                        # load nvrtc-builtins library if using cuda
-                        if name == 'cuda':
-                            nvrtc_name = self.__find_nvrtc_builtins_libname(libname[0])
-                            if nvrtc_name:
-                                ct.cdll.LoadLibrary(libname[0] + nvrtc_name)
-
-                                if VERBOSE_LOADS:
-                                    print('Loaded ' + libname[0] + nvrtc_name)
-                            else:
-                                if VERBOSE_LOADS:
-                                    print('Could not find local nvrtc-builtins libarary')
-
-                        break;
-                except OSError:
-                    if VERBOSE_LOADS:
-                        traceback.print_exc()
-                        print('Unable to load ' + full_libname)
-
-        if (self.__name is None):
-            raise RuntimeError("Could not load any ArrayFire libraries.\n" + more_info_str)
+        cache_key = json.dumps([AF_PATH, AF_SEARCH_PATH, os.environ.get('CUDA_PATH'),
+                                self.AF_PYMODULE_PATH, sys.prefix, pre, post])
+        search_dirs = [self.__path_search(), self.__path_site()]
+        if self.AF_PYMODULE_PATH:
+            search_dirs.append(self.AF_PYMODULE_PATH)
+        if os.path.exists('/etc/ld.so.cache'):
+            search_dirs.append('/etc/ld.so.cache')
+        self.__cache = _backend_cache(cache_key, search_dirs)
 
     def get_id(self, name):
         return self.__backend_name_map[name]
@@ -727,13 +926,17 @@ class _clibrary(object):
         return self.__backend_map[bk_id]
 
     def get(self):
-        return self.__clibs[self.__name]
+        if self.__active is None:
+            self.__select()
+        return self.__active[1]
 
     def name(self):
-        return self.__name
+        if self.__active is None:
+            self.__select()
+        return self.__active[0]
 
     def is_unified(self):
-        return self.__name == 'unified'
+        return self.name() == 'unified'
 
     def parse(self, res):
         lst = []
@@ -764,6 +967,10 @@ def set_backend(name, unsafe=False):
         safe_call(backend.get().af_set_backend(backend.get_id(name)))
     else:
         backend.set_unsafe(name)
+
+    # Cached constants belong to the previous backend
+    from .array import _clear_scalar_cache
+    _clear_scalar_cache()
     return
 
 def get_backend():
@@ -856,3 +1063,4 @@ def get_size_of(dtype):
     return size.value
 
 from .util import safe_call
+from ._prototypes import _PROTOTYPES, _RESTYPES
@@ -0,0 +1,366 @@
+#######################################################
+# Copyright (c) 2015, ArrayFire
+# All rights reserved.
+#
+# This file is distributed under 3-clause BSD license.
+# The complete license agreement can be obtained at:
+# http://arrayfire.com/licenses/BSD-3-Clause
+########################################################
+
+"""
+Dispatch of numpy ufuncs and functions called on af.Array (NEP 13 and NEP 18).
+
+Supported calls run on the device through the matching arrayfire function.
+Any other call falls back to numpy on a host copy of the arrays, these
+fallbacks are counted and can be made to warn or raise.
+"""
+
+import operator
+import threading
+import warnings
+import numpy as np
+from .library import *
+from .array import *
+from .array import _to_out
+from .device import is_dbl_supported
+from . import arith, algorithm, statistics, blas, data
+
+_fallback_mode = "count"
+_fallback_counts = {}
+_fallback_lock = threading.Lock()
+
+def set_numpy_fallback(mode="count"):
+    """
+    Choose what happens when numpy is called with an af.Array it can not dispatch to arrayfire.
+
+    Parameters
+    ----------
+    mode : optional: str. default: "count".
+        - "count": copy the arrays to the host and run numpy, counting the call.
+        - "warn": same as "count", also emitting a RuntimeWarning.
+        - "raise": raise a RuntimeError instead.
+    """
+    global _fallback_mode
+    if mode not in ("count", "warn", "raise"):
+        raise RuntimeError("Unknown numpy fallback mode: %s" % mode)
+    _fallback_mode = mode
+
+def numpy_fallbacks():
+    """
+    Returns a dict mapping the numpy functions that fell back to the host to their number of calls.
+    """
+    with _fallback_lock:
+        return dict(_fallback_counts)
+
+def reset_numpy_fallbacks():
+    """
+    Reset the counts returned by af.numpy_fallbacks().
+    """
+    with _fallback_lock:
+        _fallback_counts.clear()
+
+class _Unsupported(Exception):
+    pass
+
+def _to_device(x):
+    if isinstance(x, Array):
+        return x
+    if isinstance(x, np.ndarray):
+        from .interop import np_to_af_array
+        return np_to_af_array(x)
+    if isinstance(x, np.generic):
+        return x.item()
+    if isinstance(x, (bool, int, float, complex)):
+        return x
+    raise _Unsupported()
+
+def _to_host(x):
+    if isinstance(x, Array):
+        return x.to_ndarray()
+    if isinstance(x, (list, tuple)):
+        return type(x)(_to_host(item) for item in x)
+    return x
+
+def _fallback(name, func, args, kwargs):
+    if _fallback_mode == "raise":
+        raise RuntimeError("%s is not supported on af.Array" % name)
+    if _fallback_mode == "warn":
+        warnings.warn("%s is not supported on af.Array, running numpy on a host copy" % name,
+                      RuntimeWarning, stacklevel=4)
+    with _fallback_lock:
+        _fallback_counts[name] = _fallback_counts.get(name, 0) + 1
+
+    out = kwargs.get("out")
+    af_out = None
+    if isinstance(out, tuple) and len(out) == 1 and isinstance(out[0], Array):
+        af_out = out[0]
+        kwargs = dict(kwargs)
+        del kwargs["out"]
+    elif isinstance(out, Array):
+        af_out = out
+        kwargs = dict(kwargs)
+        del kwargs["out"]
+
+    res = func(*_to_host(args), **dict((k, _to_host(v)) for k, v in kwargs.items()))
+    if af_out is not None:
+        from .interop import np_to_af_array
+        return _to_out(np_to_af_array(np.asarray(res)), af_out)
+    return res
+
+def _float_operand(x):
+    # numpy divides integer and bool arrays as float64, af_div would truncate them
+    if isinstance(x, Array) and (x.is_integer() or x.is_bool()):
+        if not is_dbl_supported():
+            raise _Unsupported()
+        return x.as_type(Dtype.f64)
+    return x
+
+def _true_divide(lhs, rhs):
+    return _float_operand(lhs) / _float_operand(rhs)
+
+def _reciprocal(a):
+    # numpy keeps the integer type of the input, with its own rounding
+    if a.is_integer() or a.is_bool():
+        raise _Unsupported()
+    return 1 / a
+
+_unary_ufuncs = {
+    "sin" : arith.sin, "cos" : arith.cos, "tan" : arith.tan,
+    "arcsin" : arith.asin, "arccos" : arith.acos, "arctan" : arith.atan,
+    "sinh" : arith.sinh, "cosh" : arith.cosh, "tanh" : arith.tanh,
+    "arcsinh" : arith.asinh, "arccosh" : arith.acosh, "arctanh" : arith.atanh,
+    "exp" : arith.exp, "expm1" : arith.expm1, "exp2" : arith.pow2,
+    "log" : arith.log, "log1p" : arith.log1p, "log2" : arith.log2, "log10" : arith.log10,
+    "sqrt" : arith.sqrt, "cbrt" : arith.cbrt,
+    "absolute" : arith.abs, "fabs" : arith.abs,
+    "floor" : arith.floor, "ceil" : arith.ceil, "trunc" : arith.trunc,
+    "isnan" : arith.isnan, "isinf" : arith.isinf, "conjugate" : arith.conjg,
+    "negative" : operator.neg, "positive" : operator.pos,
+    "square" : lambda a: a * a,
+    "reciprocal" : _reciprocal,
+    "logical_not" : lambda a: a == 0,
+}
+
+_binary_ufuncs = {
+    "add" : operator.add, "subtract" : operator.sub, "multiply" : operator.mul,
+    "true_divide" : _true_divide, "divide" : _true_divide,
+    "power" : arith.pow, "maximum" : arith.maxof, "minimum" : arith.minof,
+    "arctan2" : arith.atan2, "hypot" : arith.hypot,
+    "greater" : operator.gt, "greater_equal" : operator.ge,
+    "less" : operator.lt, "less_equal" : operator.le,
+    "equal" : operator.eq, "not_equal" : operator.ne,
+    "bitwise_and" : operator.and_, "bitwise_or" : operator.or_, "bitwise_xor" : operator.xor,
+    "left_shift" : operator.lshift, "right_shift" : operator.rshift,
+}
+
+_reduce_ufuncs = {
+    "add" : algorithm.sum, "multiply" : algorithm.product,
+    "maximum" : algorithm.max, "minimum" : algorithm.min,
+    "logical_and" : algorithm.all_true, "logical_or" : algorithm.any_true,
+}
+
+def _ufunc_call(ufunc, method, inputs, kwargs):
+    name = ufunc.__name__
+    out = kwargs.pop("out", None)
+    if method == "reduce":
+        axis = kwargs.pop("axis", 0)
+        keepdims = kwargs.pop("keepdims", False)
+    if kwargs:
+        raise _Unsupported()
+    if out is not None and not (len(out) == 1 and isinstance(out[0], Array)):
+        raise _Unsupported()
+    out = None if out is None else out[0]
+
+    if method == "__call__":
+        args = [_to_device(x) for x in inputs]
+        if name == "matmul" and len(args) == 2:
+            # np.matmul is a ufunc, it never reaches __array_function__
+            return _matmul(args[0], args[1], out=out)
+        if len(args) == 1 and name in _unary_ufuncs and isinstance(args[0], Array):
+            res = _unary_ufuncs[name](args[0])
+        elif len(args) == 2 and name in _binary_ufuncs:
+            res = _binary_ufuncs[name](args[0], args[1])
+        else:
+            raise _Unsupported()
+        return _to_out(res, out)
+
+    if method == "reduce" and name in _reduce_ufuncs and len(inputs) == 1 and out is None:
+        return _reduce(_reduce_ufuncs[name], inputs[0], axis, keepdims)
+
+    raise _Unsupported()
+
+def _array_ufunc(ufunc, method, inputs, kwargs):
+    """
+    Implementation of af.Array.__array_ufunc__.
+    """
+    try:
+        return _ufunc_call(ufunc, method, inputs, dict(kwargs))
+    except _Unsupported:
+        name = "numpy.%s" % ufunc.__name__
+        if method != "__call__":
+            name += "." + method
+        return _fallback(name, getattr(ufunc, method), inputs, kwargs)
+
+def _axis(a, axis):
+    ndims = len(a.dims())
+    if not isinstance(axis, int) or not -ndims <= axis < ndims:
+        raise _Unsupported()
+    return axis % ndims
+
+def _reduce(func, a, axis, keepdims, **kwargs):
+    if not isinstance(a, Array):
+        raise _Unsupported()
+    if isinstance(axis, tuple) and len(axis) == 1:
+        axis = axis[0]
+    if axis is None:
+        if keepdims:
+            raise _Unsupported()
+        return func(a, **kwargs)
+
+    dims = a.dims()
+    dim = _axis(a, axis)
+    if len(dims) == 1 and not keepdims:
+        # Reducing the only dimension gives a scalar in numpy
+        return func(a, **kwargs)
+    res = func(a, dim=dim, **kwargs)
+    if keepdims:
+        return res
+    # Drop the reduced dimension like numpy, this only changes the metadata
+    dims = dims[:dim] + dims[dim + 1:]
+    return data.moddims(res, *dims)
+
+def _reduction(func, **fixed):
+    def impl(a, axis=None, dtype=None, out=None, keepdims=False, **kwargs):
+        if dtype is not None or out is not None or kwargs:
+            raise _Unsupported()
+        return _reduce(func, a, axis, keepdims, **fixed)
+    return impl
+
+def _variance(func):
+    def impl(a, axis=None, dtype=None, out=None, ddof=0, keepdims=False, **kwargs):
+        if dtype is not None or out is not None or kwargs or ddof not in (0, 1):
+            raise _Unsupported()
+        bias = VARIANCE.SAMPLE if ddof else VARIANCE.POPULATION
+        return _reduce(func, a, axis, keepdims, bias=bias)
+    return impl
+
+def _median(a, axis=None, out=None, overwrite_input=False, keepdims=False):
+    if out is not None:
+        raise _Unsupported()
+    return _reduce(statistics.median, a, axis, keepdims)
+
+def _count_nonzero(a, axis=None, keepdims=False):
+    return _reduce(algorithm.count, a, axis, keepdims)
+
+def _arg_reduction(func):
+    def impl(a, axis=None, out=None, **kwargs):
+        # Flat indices of arrayfire are in column major order, only reductions along an axis match numpy
+        if axis is None or out is not None or kwargs or not isinstance(a, Array):
+            raise _Unsupported()
+        return _reduce(lambda x, dim=None: func(x, dim)[1], a, axis, False)
+    return impl
+
+def _matmul(a, b, out=None, **kwargs):
+    a, b = _to_device(a), _to_device(b)
+    if kwargs or not isinstance(a, Array) or not isinstance(b, Array):
+        raise _Unsupported()
+    # A vector on the left is a row in numpy but a column in arrayfire
+    if len(a.dims()) != 2 or len(b.dims()) > 2:
+        raise _Unsupported()
+    return blas.matmul(a, b, out=out)
+
+def _dot(a, b, out=None):
+    a, b = _to_device(a), _to_device(b)
+    if not isinstance(a, Array) or not isinstance(b, Array) or out is not None:
+        raise _Unsupported()
+    if len(a.dims()) == 1 and len(b.dims()) == 1:
+        return blas.dot(a, b, return_scalar=True)
+    return _matmul(a, b)
+
+def _transpose(a, axes=None):
+    if not isinstance(a, Array) or len(a.dims()) > 2 or axes not in (None, (1, 0), [1, 0]):
+        raise _Unsupported()
+    return transpose(a)
+
+def _sort(a, axis=-1, kind=None, order=None, **kwargs):
+    if not isinstance(a, Array) or axis is None or kind is not None or order is not None or kwargs:
+        raise _Unsupported()
+    return algorithm.sort(a, dim=_axis(a, axis))
+
+def _cumsum(a, axis=None, dtype=None, out=None):
+    if not isinstance(a, Array) or dtype is not None or out is not None:
+        raise _Unsupported()
+    if axis is None:
+        if len(a.dims()) > 1:
+            # numpy flattens in row major order
+            raise _Unsupported()
+        return algorithm.accum(a)
+    return algorithm.accum(a, dim=_axis(a, axis))
+
+def _where(condition, *args):
+    if len(args) != 2 or not isinstance(condition, Array):
+        raise _Unsupported()
+    x, y = _to_device(args[0]), _to_device(args[1])
+    if not isinstance(x, Array) and not isinstance(y, Array):
+        raise _Unsupported()
+    return data.select(condition, x, y)
+
+def _clip(a, a_min, a_max, out=None, **kwargs):
+    if not isinstance(a, Array) or kwargs or a_min is None or a_max is None:
+        raise _Unsupported()
+    return arith.clamp(a, _to_device(a_min), _to_device(a_max), out=out)
+
+def _concatenate(arrays, axis=0, out=None, **kwargs):
+    arrays = [_to_device(x) for x in arrays]
+    if out is not None or kwargs or not 2 <= len(arrays) <= 4 or not all(isinstance(x, Array) for x in arrays):
+        raise _Unsupported()
+    return data.join(_axis(arrays[0], axis), *arrays)
+
+def _copy(a, order="K", **kwargs):
+    if not isinstance(a, Array) or kwargs:
+        raise _Unsupported()
+    return a.copy()
+
+_functions = {
+    np.sum : _reduction(algorithm.sum),
+    np.prod : _reduction(algorithm.product),
+    np.min : _reduction(algorithm.min),
+    np.max : _reduction(algorithm.max),
+    np.amin : _reduction(algorithm.min),
+    np.amax : _reduction(algorithm.max),
+    np.all : _reduction(algorithm.all_true),
+    np.any : _reduction(algorithm.any_true),
+    np.mean : _reduction(statistics.mean),
+    np.var : _variance(statistics.var),
+    np.std : _variance(statistics.stdev),
+    np.median : _median,
+    np.count_nonzero : _count_nonzero,
+    np.argmin : _arg_reduction(algorithm.imin),
+    np.argmax : _arg_reduction(algorithm.imax),
+    np.dot : _dot,
+    np.transpose : _transpose,
+    np.sort : _sort,
+    np.cumsum : _cumsum,
+    np.where : _where,
+    np.clip : _clip,
+    np.concatenate : _concatenate,
+    np.copy : _copy,
+    np.shape : lambda a: a.dims(),
+    np.ndim : lambda a: len(a.dims()),
+    np.size : lambda a, axis=None: a.elements() if axis is None else a.dims()[axis],
+}
+
+def _array_function(func, types, args, kwargs):
+    """
+    Implementation of af.Array.__array_function__.
+    """
+    if not all(issubclass(t, (Array, np.ndarray)) for t in types):
+        return NotImplemented
+
+    impl = _functions.get(func)
+    if impl is not None:
+        try:
+            return impl(*args, **kwargs)
+        except _Unsupported:
+            pass
+    return _fallback("numpy.%s" % func.__name__, func, args, kwargs)
@@ -125,11 +125,13 @@ def set_device_id(idx):
     import ctypes as ct
     from .util import safe_call as safe_call
     from .library import backend
+    from .array import _clear_scalar_cache
 
     if (backend.name() != "opencl"):
         raise RuntimeError("Invalid backend loaded")
 
     safe_call(backend.get().afcl_set_device_id(idx))
+    _clear_scalar_cache()
     return
 
 def add_device_context(dev, ctx, que):
@@ -170,11 +172,13 @@ def set_device_context(dev, ctx):
     import ctypes as ct
     from .util import safe_call as safe_call
     from .library import backend
+    from .array import _clear_scalar_cache
 
     if (backend.name() != "opencl"):
         raise RuntimeError("Invalid backend loaded")
 
     safe_call(backend.get().afcl_set_device_context(dev, ctx))
+    _clear_scalar_cache()
 
 def delete_device_context(dev, ctx):
     """
@@ -191,11 +195,13 @@ def delete_device_context(dev, ctx):
     import ctypes as ct
     from .util import safe_call as safe_call
     from .library import backend
+    from .array import _clear_scalar_cache
 
     if (backend.name() != "opencl"):
         raise RuntimeError("Invalid backend loaded")
 
     safe_call(backend.get().afcl_delete_device_context(dev, ctx))
+    _clear_scalar_cache()
 
 
 _to_device_type = {DEVICE_TYPE.CPU.value     : DEVICE_TYPE.CPU,
@@ -43,7 +43,7 @@ class Random_Engine(object):
     def __init__(self, engine_type = RANDOM_ENGINE.PHILOX, seed = 0, engine = None):
         if (engine is None):
             self.engine  = c_void_ptr_t(0)
-            safe_call(backend.get().af_create_random_engine(c_pointer(self.engine), engine_type.value, c_longlong_t(seed)))
+            safe_call(backend.get().af_create_random_engine(c_pointer(self.engine), engine_type.value, c_ulonglong_t(seed)))
         else:
             self.engine = engine
 
@@ -71,7 +71,7 @@ class Random_Engine(object):
         """
         Set the seed for the random engine.
         """
-        safe_call(backend.get().af_random_engine_set_seed(c_pointer(self.engine), c_longlong_t(seed)))
+        safe_call(backend.get().af_random_engine_set_seed(c_pointer(self.engine), c_ulonglong_t(seed)))
 
     def get_seed(self):
         """
@@ -214,7 +214,7 @@ def set_default_random_engine_type(engine_type):
 
     This only affects randu and randn when a random engine is not specified.
     """
-    safe_call(backend.get().af_set_default_random_engine_type(c_pointer(self.engine), engine_type.value))
+    safe_call(backend.get().af_set_default_random_engine_type(engine_type.value))
 
 def get_default_random_engine():
     """
@@ -138,11 +138,11 @@ def approx1_uniform(signal, x, interp_dim, idx_start, idx_step, method=INTERP.LI
         output = Array()
 
         safe_call(backend.get().af_approx1_uniform(c_pointer(output.arr), signal.arr, x.arr,
-                                           c_dim_t(interp_dim), c_double_t(idx_start), c_double_t(idx_step),
+                                           c_int_t(interp_dim), c_double_t(idx_start), c_double_t(idx_step),
                                            method.value, c_float_t(off_grid)))
     else:
         safe_call(backend.get().af_approx1_uniform_v2(c_pointer(output.arr), signal.arr, x.arr,
-                                           c_dim_t(interp_dim), c_double_t(idx_start), c_double_t(idx_step),
+                                           c_int_t(interp_dim), c_double_t(idx_start), c_double_t(idx_step),
                                            method.value, c_float_t(off_grid)))
     return output
 
@@ -297,13 +297,13 @@ def approx2_uniform(signal, pos0, interp_dim0, idx_start0, idx_step0, pos1, inte
     if output is None:
         output = Array()
         safe_call(backend.get().af_approx2_uniform(c_pointer(output.arr), signal.arr,
-                                           pos0.arr, c_dim_t(interp_dim0), c_double_t(idx_start0), c_double_t(idx_step0),
-                                           pos1.arr, c_dim_t(interp_dim1), c_double_t(idx_start1), c_double_t(idx_step1),
+                                           pos0.arr, c_int_t(interp_dim0), c_double_t(idx_start0), c_double_t(idx_step0),
+                                           pos1.arr, c_int_t(interp_dim1), c_double_t(idx_start1), c_double_t(idx_step1),
                                            method.value, c_float_t(off_grid)))
     else:
         safe_call(backend.get().af_approx2_uniform_v2(c_pointer(output.arr), signal.arr,
-                                           pos0.arr, c_dim_t(interp_dim0), c_double_t(idx_start0), c_double_t(idx_step0),
-                                           pos1.arr, c_dim_t(interp_dim1), c_double_t(idx_start1), c_double_t(idx_step1),
+                                           pos0.arr, c_int_t(interp_dim0), c_double_t(idx_start0), c_double_t(idx_step0),
+                                           pos1.arr, c_int_t(interp_dim1), c_double_t(idx_start1), c_double_t(idx_step1),
                                            method.value, c_float_t(off_grid)))
 
     return output
@@ -40,9 +40,9 @@ def mean(a, weights=None, dim=None):
         out = Array()
 
         if weights is None:
-            safe_call(backend.get().af_mean(c_pointer(out.arr), a.arr, c_int_t(dim)))
+            safe_call(backend.get().af_mean(c_pointer(out.arr), a.arr, c_dim_t(dim)))
         else:
-            safe_call(backend.get().af_mean_weighted(c_pointer(out.arr), a.arr, weights.arr, c_int_t(dim)))
+            safe_call(backend.get().af_mean_weighted(c_pointer(out.arr), a.arr, weights.arr, c_dim_t(dim)))
 
         return out
     else:
@@ -89,9 +89,9 @@ def var(a, bias=VARIANCE.DEFAULT, weights=None, dim=None):
         out = Array()
 
         if weights is None:
-            safe_call(backend.get().af_var_v2(c_pointer(out.arr), a.arr, bias.value, c_int_t(dim)))
+            safe_call(backend.get().af_var_v2(c_pointer(out.arr), a.arr, bias.value, c_dim_t(dim)))
         else:
-            safe_call(backend.get().af_var_weighted(c_pointer(out.arr), a.arr, weights.arr, c_int_t(dim)))
+            safe_call(backend.get().af_var_weighted(c_pointer(out.arr), a.arr, weights.arr, c_dim_t(dim)))
 
         return out
     else:
@@ -145,7 +145,7 @@ def meanvar(a, weights=None, bias=VARIANCE.DEFAULT, dim=-1):
         weights  = Array()
 
     safe_call(backend.get().af_meanvar(c_pointer(mean_out.arr), c_pointer(var_out.arr),
-                                       a.arr, weights.arr, bias.value, c_int_t(dim)))
+                                       a.arr, weights.arr, bias.value, c_dim_t(dim)))
 
     return mean_out, var_out
 
@@ -176,7 +176,7 @@ def stdev(a, bias=VARIANCE.DEFAULT, dim=None):
     if dim is not None:
         out = Array()
         safe_call(backend.get().af_stdev_v2(c_pointer(out.arr), a.arr, bias.value,
-                                            c_int_t(dim)))
+                                            c_dim_t(dim)))
         return out
     else:
         real = c_double_t(0)
@@ -231,7 +231,7 @@ def median(a, dim=None):
     """
     if dim is not None:
         out = Array()
-        safe_call(backend.get().af_median(c_pointer(out.arr), a.arr, c_int_t(dim)))
+        safe_call(backend.get().af_median(c_pointer(out.arr), a.arr, c_dim_t(dim)))
         return out
     else:
         real = c_double_t(0)
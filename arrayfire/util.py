@@ -44,13 +44,17 @@ def implicit_dtype(number, a_dtype):
 
     f64v = Dtype.f64.value
     f32v = Dtype.f32.value
+    f16v = Dtype.f16.value
     c32v = Dtype.c32.value
     c64v = Dtype.c64.value
 
+    if n_value == f64v and a_dtype == f16v:
+        return Dtype.f16
+
     if n_value == f64v and (a_dtype == f32v or a_dtype == c32v):
         return Dtype.f32
 
-    if n_value == c64v and (a_dtype == f32v or a_dtype == c32v):
+    if n_value == c64v and (a_dtype == f32v or a_dtype == c32v or a_dtype == f16v):
         return Dtype.c32
 
     return n_dtype
@@ -92,7 +96,7 @@ def get_reversion():
     """
     Function to get the revision hash of the library.
     """
-    return to_str(backend.get().af_get_revision())
+    return backend.get().af_get_revision().decode('utf-8')
 
 to_dtype = {'f' : Dtype.f32,
             'd' : Dtype.f64,
@@ -106,6 +110,7 @@ to_dtype = {'f' : Dtype.f32,
             'L' : Dtype.u64,
             'F' : Dtype.c32,
             'D' : Dtype.c64,
+            'e' : Dtype.f16,
             'hf': Dtype.f16}
 
 to_typecode = {Dtype.f32.value : 'f',
@@ -120,7 +125,7 @@ to_typecode = {Dtype.f32.value : 'f',
                Dtype.u64.value : 'L',
                Dtype.c32.value : 'F',
                Dtype.c64.value : 'D',
-               Dtype.f16.value : 'hf'}
+               Dtype.f16.value : 'e'}
 
 to_c_type = {Dtype.f32.value : c_float_t,
              Dtype.f64.value : c_double_t,
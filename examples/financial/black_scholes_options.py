@@ -20,6 +20,7 @@ def cnd(x):
     temp = (x > 0)
     return temp * (0.5 + af.erf(x/sqrt2)/2) + (1 - temp) * (0.5 - af.erf((-x)/sqrt2)/2)
 
+@af.fuse
 def black_scholes(S, X, R, V, T):
     # S = Underlying stock price
     # X = Strike Price
@@ -14,12 +14,18 @@ from .algorithm import simple_algorithm
 from .arith import simple_arith
 from .array_test import simple_array
 from .blas import simple_blas
+from .container import simple_container
 from .data import simple_data
 from .device import simple_device
+from .dlpack import simple_dlpack
+from .fuse import simple_fuse
 from .image import simple_image
+from .import_time import simple_import_time
 from .index import simple_index
 from .interop import simple_interop
 from .lapack import simple_lapack
+from .layout import simple_layout
+from .numpy_dispatch import simple_numpy_dispatch
 from .random import simple_random
 from .signal import simple_signal
 from .sparse import simple_sparse
@@ -31,12 +37,18 @@ __all__ = [
     "simple_arith",
     "simple_array",
     "simple_blas",
+    "simple_container",
     "simple_data",
     "simple_device",
+    "simple_dlpack",
+    "simple_fuse",
     "simple_image",
+    "simple_import_time",
     "simple_index",
     "simple_interop",
     "simple_lapack",
+    "simple_layout",
+    "simple_numpy_dispatch",
     "simple_random",
     "simple_signal",
     "simple_sparse",
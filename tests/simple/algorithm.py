@@ -116,5 +116,10 @@ def simple_algorithm(verbose=False):
     display_func(af.set_intersect(cc, cc, is_unique=True))
     display_func(af.set_intersect(cc, cc, is_unique=False))
 
+    out = af.constant(0, 1, 3)
+    a = af.randu(3, 3)
+    assert af.sum(a, 0, out=out) is out
+    assert af.max(af.abs(out - af.sum(a, 0))) == 0
+
 
 _util.tests["algorithm"] = simple_algorithm
@@ -218,5 +218,22 @@ def simple_arith(verbose=False):
 
     display_func(test_add(a, b))
 
+    # Scalar operands are broadcast from a cached single element constant
+    c = af.randu(3, 4, 2)
+    assert (c * 2).dims() == c.dims()
+    assert (2 - c).dims() == c.dims()
+    assert af.max(af.abs((c + 1.5) - (c + af.constant(1.5, 3, 4, 2)))) == 0
+    c[0, :] = 7
+    assert af.min(c[0, :]) == 7
+
+    # In place operators update the array itself, out= stores into an existing array
+    d = c
+    c += 1
+    assert d is c and af.min(c[0, :]) == 8
+    out = af.constant(0, 3, 4, 2)
+    assert af.sqrt(c, out=out) is out
+    assert af.max(af.abs(out - af.sqrt(c))) == 0
+    assert af.minof(c, 2.5, out=out) is out and af.max(out) == 2.5
+
 
 _util.tests["arith"] = simple_arith
@@ -10,6 +10,7 @@
 ########################################################
 
 import array as host
+import struct
 
 import arrayfire as af
 
@@ -65,5 +66,70 @@ def simple_array(verbose=False):
 
     print_func(a.is_sparse())
 
+    # Buffer protocol objects are copied directly from their memory
+    a = af.Array(bytes(range(6)))
+    assert a.dtype() == af.Dtype.u8 and a.dims() == (6,)
+    a = af.Array(memoryview(host.array("i", range(6))).cast("B").cast("i", (2, 3)))
+    assert a.dtype() == af.Dtype.s32 and a.dims() == (2, 3)
+    assert a.to_list(True) == [[0, 1, 2], [3, 4, 5]]
+    try:
+        af.Array(b"abc", dims=(100,))
+        assert False, "dims larger than the buffer were accepted"
+    except RuntimeError:
+        pass
+
+    # Cached metadata follows the handle when it is replaced
+    a = af.randu(5, 5)
+    assert a.dims() == (5, 5) and a.type() == af.Dtype.f32.value
+    a[0:2, :] = af.constant(1, 2, 5, dtype=af.Dtype.f32)
+    assert a.dims() == (5, 5)
+    b = af.Array(a)
+    assert b.dims() == a.dims() and b.elements() == 25
+
+    # Only single element constants are cached, full size ones are released with their array
+    a[:, 1:3] = 7
+    assert all(c.elements() == 1 for c in af.array._scalar_cache.values())
+    assert "threading" not in vars(af) and "OrderedDict" not in vars(af)
+
+    # Large arrays only show their edges
+    af.set_display_summary(100, 2, stats=True)
+    text = str(af.randu(50, 40, 3))
+    assert "..." in text and "mean:" in text
+    assert len(text.splitlines()) < 40
+    text = str(af.range(200, dtype=af.Dtype.s32))
+    assert "mean: 99.5000" in text
+    af.set_display_summary()
+
+    # Tiled copies write one slab at a time into the caller's buffer
+    a = af.randu(6, 5, 4)
+    buf = bytearray(a.elements() * 4)
+    a.to_ndarray_tiled(buf, slab_bytes=100)
+    assert bytes(buf) == a.to_array().tobytes()
+    a.to_ndarray_tiled(buf, row_major=True, slab_bytes=100)
+    assert bytes(buf) == a.to_array(row_major=True).tobytes()
+    empty = af.constant(0, 3, 0)
+    assert empty.to_ndarray_tiled(bytearray()) == bytearray()
+
+    # Asynchronous copies match the blocking ones
+    futures = [a.to_host_async(), a.to_host_async(True, True)]
+    assert futures[0].result() == a.to_array()
+    assert futures[1].result() == a.to_array(True, True)
+
+    if af.is_half_supported():
+        # Halves are created from lists and buffers of format 'e'
+        h = af.Array([0.5, 1.5, 2.5], dtype=af.Dtype.f16)
+        assert h.dtype() == af.Dtype.f16
+        assert h.to_list() == [0.5, 1.5, 2.5]
+        h = af.Array(memoryview(struct.pack("3e", 0.5, 1.5, 2.5)).cast("B").cast("e"))
+        assert h.dtype() == af.Dtype.f16
+        assert (h * 2.0).dtype() == af.Dtype.f16
+
+        af.set_storage_dtype(af.Dtype.f16, af.Dtype.f32)
+        try:
+            assert (h * 2.0).dtype() == af.Dtype.f32
+            assert af.sum(h) == 4.5
+        finally:
+            af.set_storage_dtype(None)
+
 
 _util.tests["array"] = simple_array
@@ -23,6 +23,22 @@ def simple_blas(verbose=False):
     display_func(af.matmul(a, b, af.MATPROP.TRANS))
     display_func(af.matmul(a, b, af.MATPROP.NONE, af.MATPROP.TRANS))
 
+    c = af.constant(0, 5, 5)
+    assert af.matmul(a, b, out=c) is c
+    assert af.max(af.abs(c - af.matmul(a, b))) < 1e-5
+
+    d = af.Array(c)
+    af.gemm(a, b, 1.0, 1.0, C=c)
+    assert af.max(af.abs(d - af.matmul(a, b))) < 1e-5
+    assert af.max(af.abs(c - 2 * d)) < 1e-5
+
+    for out in (af.constant(0, 5, 4), af.constant(0, 5, 5, dtype=af.Dtype.f64)):
+        try:
+            af.matmul(a, b, out=out)
+            assert False, "mismatched out was accepted"
+        except (TypeError, RuntimeError):
+            pass
+
     b = af.randu(5, 1)
     display_func(af.dot(b, b))
 
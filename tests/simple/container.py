@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+
+#######################################################
+# Copyright (c) 2015, ArrayFire
+# All rights reserved.
+#
+# This file is distributed under 3-clause BSD license.
+# The complete license agreement can be obtained at:
+# http://arrayfire.com/licenses/BSD-3-Clause
+########################################################
+
+import os
+import tempfile
+
+import arrayfire as af
+
+from . import _util
+
+
+def simple_container(verbose=False):
+    display_func = _util.display_func(verbose)
+
+    a = af.randu(5, 4, 6)
+    b = af.range(10, dtype=af.Dtype.s32)
+
+    for compression in [None, "zlib"]:
+        fd, path = tempfile.mkstemp(suffix=".afc")
+        os.close(fd)
+        try:
+            # Small chunks so that the reads below span several of them
+            af.save_container(path, {"a": a, "b": b}, compression=compression, chunk_bytes=100)
+
+            with af.ArrayContainer(path) as f:
+                assert sorted(f.keys()) == ["a", "b"]
+                assert "a" in f and "c" not in f
+                assert f.info("a") == (af.Dtype.f32, (5, 4, 6))
+                assert f.info("b") == (af.Dtype.s32, (10,))
+
+                assert f["a"].to_list() == a.to_list()
+                assert f["b"].to_list() == b.to_list()
+                assert f.read("a", (slice(1, 3), slice(None), slice(2, 5))).to_list() == a[1:3, :, 2:5].to_list()
+                assert f.read("a", (slice(None), 1, -1)).to_list() == a[:, 1, -1].to_list()
+                assert f.read("a", (0, 0, slice(None, None, 2))).to_list() == a[0, 0, ::2].to_list()
+                assert f.read("b", slice(3, 8)).to_list() == b[3:8].to_list()
+                display_func(f.read("b", -1))
+
+            res = af.read_arrays([(path, "a"), (path, 1), (path, "a")], workers=2)
+            assert [r.to_list() for r in res] == [a.to_list(), b.to_list(), a.to_list()]
+        finally:
+            os.remove(path)
+
+    # Arrays whose last dimension is 0 are stored without chunks
+    empty = af.constant(0, 3, 0)
+    fd, path = tempfile.mkstemp(suffix=".afc")
+    os.close(fd)
+    try:
+        af.save_container(path, {"empty": empty, "b": b})
+        with af.ArrayContainer(path) as f:
+            assert f.info("empty") == (af.Dtype.f32, empty.dims())
+            assert f["empty"].elements() == 0 and f["empty"].dims() == empty.dims()
+        res = af.read_arrays([(path, "empty"), (path, "b")], workers=2)
+        assert res[0].elements() == 0 and res[0].dims() == empty.dims()
+        assert res[1].to_list() == b.to_list()
+    finally:
+        os.remove(path)
+
+    try:
+        af.ArrayContainer(path)
+        assert False, "a missing file was opened"
+    except (IOError, OSError):
+        pass
+
+    # Files written by save_array can be read along with container files
+    fd, path = tempfile.mkstemp(suffix=".af")
+    os.close(fd)
+    try:
+        af.save_array("a", a, path)
+        af.save_array("b", b, path, append=True)
+        res = af.read_arrays([path, (path, "b"), (path, 0)], workers=3)
+        assert [r.to_list() for r in res] == [a.to_list(), b.to_list(), a.to_list()]
+
+        # Worker threads read on the backend and device of the caller
+        expected = [a.to_list(), b.to_list()]
+        if af.get_device_count() > 1:
+            device = af.get_device()
+            af.set_device(1)
+            try:
+                res = af.read_arrays([path, (path, "b")], workers=2)
+                assert [af.get_device_id(r).value for r in res] == [1, 1]
+                assert [r.to_list() for r in res] == expected
+            finally:
+                af.set_device(device)
+        if af.get_backend() == "unified" and len(af.get_available_backends()) > 1:
+            active = af.get_active_backend()
+            af.set_backend([name for name in af.get_available_backends() if name != active][0])
+            try:
+                res = af.read_arrays([path, (path, "b")], workers=2)
+                assert [af.get_backend_id(r) for r in res] == [af.get_active_backend()] * 2
+                assert [r.to_list() for r in res] == expected
+                assert res[0].to_host_async().result() == res[0].to_array()
+            finally:
+                af.set_backend(active)
+    finally:
+        os.remove(path)
+
+
+_util.tests["container"] = simple_container
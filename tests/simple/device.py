@@ -9,6 +9,8 @@
 # http://arrayfire.com/licenses/BSD-3-Clause
 ########################################################
 
+import threading
+
 import arrayfire as af
 
 from . import _util
@@ -43,6 +45,22 @@ def simple_device(verbose=False):
 
     af.set_device(curr_dev)
 
+    if af.get_device_count() > 1:
+        # Cached constants are not shared between threads on different devices
+        x = af.randu(3, 3) + 2
+
+        def other_device(res):
+            af.set_device(1)
+            res.append(af.get_device_id(af.randu(3, 3) + 2).value)
+
+        res = []
+        worker = threading.Thread(target=other_device, args=(res,))
+        worker.start()
+        worker.join()
+        assert res == [1]
+        assert af.get_device_id(af.randu(3, 3) + 2).value == curr_dev
+        display_func(x)
+
     a = af.randu(10, 10)
     display_func(a)
     dev_ptr = af.get_device_ptr(a)
@@ -66,6 +84,22 @@ def simple_device(verbose=False):
     print_func(c)
     print_func(d)
 
+    # Pending results are evaluated together on exit, grouped by shape
+    with af.batched_eval():
+        c = a + b
+        d = af.sin(a) * 2
+        e = af.sum(a, 0) + 1
+        assert len(af.array._pending_eval.arrays) > 0
+    assert af.array._pending_eval.arrays is None
+    assert af.array._pending_eval.depth == 0
+    print_func(c)
+    print_func(d)
+    print_func(e)
+    assert c.to_list() == (a + b).to_list()
+    assert d.to_list() == (af.sin(a) * 2).to_list()
+    assert e.to_list() == (af.sum(a, 0) + 1).to_list()
+    af.eval(c, d, e)
+
     print_func(af.set_manual_eval_flag(True))
     assert(af.get_manual_eval_flag())
     print_func(af.set_manual_eval_flag(False))
@@ -73,5 +107,19 @@ def simple_device(verbose=False):
 
     display_func(af.is_locked_array(a))
 
+    # Pinned buffers are reused per power of two size class
+    pool = af.PinnedMemoryPool(max_bytes=8192)
+    ptr = pool.alloc(3000)
+    pool.free(ptr)
+    assert pool.cached_bytes() == 4096
+    assert pool.alloc(4000) == ptr
+    other = pool.alloc(4000)
+    pool.free(ptr)
+    pool.free(other)
+    pool.free(pool.alloc(8192))
+    assert pool.cached_bytes() == 8192
+    pool.clear()
+    assert pool.cached_bytes() == 0
+
 
 _util.tests["device"] = simple_device
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+
+#######################################################
+# Copyright (c) 2015, ArrayFire
+# All rights reserved.
+#
+# This file is distributed under 3-clause BSD license.
+# The complete license agreement can be obtained at:
+# http://arrayfire.com/licenses/BSD-3-Clause
+########################################################
+
+import arrayfire as af
+
+from . import _util
+
+
+def simple_dlpack(verbose=False):
+    display_func = _util.display_func(verbose)
+
+    a = af.randu(3, 4)
+    device_type, device_id = a.__dlpack_device__()
+    assert device_type in (1, 2, 4, 14)
+
+    b = af.from_dlpack(a)
+    assert b.dims() == a.dims()
+    assert b.to_list() == a.to_list()
+    if device_type == 1:
+        assert b.device_ptr() == a.device_ptr()
+    display_func(b)
+
+    # Strided views are exported as a copy
+    c = af.from_dlpack(a[1:, ::2])
+    assert c.to_list() == a[1:, ::2].to_list()
+
+    # A capsule can only be consumed once
+    capsule = a.__dlpack__()
+    af.from_dlpack(capsule)
+    try:
+        af.from_dlpack(capsule)
+        assert False
+    except TypeError:
+        pass
+
+    if af.AF_NUMPY_FOUND and device_type == 1:
+        import numpy as np
+        n = np.from_dlpack(a)
+        assert n.shape == a.dims()
+        assert (n == a.to_ndarray()).all()
+
+        # Column major tensors are used in place
+        n = np.asfortranarray(np.random.random((5, 3)))
+        d = af.from_dlpack(n)
+        assert d.device_ptr() == n.ctypes.data
+        assert (d.to_ndarray() == n).all()
+
+        # Row major tensors and views are reordered
+        n = np.random.random((5, 3))
+        for view in [n, n[::2], n[1:, 1:]]:
+            d = af.from_dlpack(view)
+            assert d.dims() == view.shape
+            assert (d.to_ndarray() == view).all()
+
+        # No dimension with a unit stride
+        try:
+            af.from_dlpack(n[:, ::2])
+            assert False
+        except RuntimeError:
+            pass
+
+
+_util.tests["dlpack"] = simple_dlpack
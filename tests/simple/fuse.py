@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+
+#######################################################
+# Copyright (c) 2015, ArrayFire
+# All rights reserved.
+#
+# This file is distributed under 3-clause BSD license.
+# The complete license agreement can be obtained at:
+# http://arrayfire.com/licenses/BSD-3-Clause
+########################################################
+
+import arrayfire as af
+
+from . import _util
+
+
+def simple_fuse(verbose=False):
+    display_func = _util.display_func(verbose)
+
+    def cnd(x):
+        temp = (x > 0)
+        return temp * (0.5 + af.erf(x / 1.4142) / 2) + (1 - temp) * (0.5 - af.erf((-x) / 1.4142) / 2)
+
+    fused = af.fuse(cnd)
+    a = af.randn(5, 5)
+    expected = cnd(a).to_list()
+
+    # Traced on the first call, replayed afterwards
+    assert fused(a).to_list() == expected
+    assert fused(a).to_list() == expected
+    display_func(fused(af.randn(5, 5)))
+
+    @af.fuse(maxsize=2)
+    def axpy(alpha, x, y):
+        return alpha * x + y, af.clamp(x, 0.25, 0.75)
+
+    x = af.randu(4, 4)
+    y = af.randu(4, 4)
+    for alpha in [1.0, 2.0, 3.0, 2.0]:
+        res = axpy(alpha, x, y)
+        assert isinstance(res, tuple)
+        assert res[0].to_list() == (alpha * x + y).to_list()
+        assert res[1].to_list() == af.clamp(x, 0.25, 0.75).to_list()
+
+    # Aliased inputs are traced separately from distinct ones
+    assert axpy(2.0, x, x)[0].to_list() == (2.0 * x + x).to_list()
+    assert axpy(2.0, x, y)[0].to_list() == (2.0 * x + y).to_list()
+    assert axpy(2.0, x, af.Array(x))[0].to_list() == (2.0 * x + x).to_list()
+
+    # Host reads can not be replayed, the function keeps running directly
+    @af.fuse
+    def first(x):
+        return x + x.to_list()[0][0]
+
+    assert first(x).to_list() == first(x).to_list()
+
+
+_util.tests["fuse"] = simple_fuse
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+
+#######################################################
+# Copyright (c) 2015, ArrayFire
+# All rights reserved.
+#
+# This file is distributed under 3-clause BSD license.
+# The complete license agreement can be obtained at:
+# http://arrayfire.com/licenses/BSD-3-Clause
+########################################################
+
+import os
+import subprocess
+import sys
+
+from . import _util
+
+_lazy_modules = ["arrayfire.signal", "arrayfire.image", "arrayfire.vision", "arrayfire.graphics",
+                 "arrayfire.interop", "arrayfire.sparse", "arrayfire.ml",
+                 "arrayfire.container", "arrayfire.dlpack",
+                 "arrayfire.numpy_dispatch",
+                 "numpy", "pycuda", "pyopencl", "numba"]
+
+_import_script = """
+import sys, time
+start = time.perf_counter()
+import arrayfire
+print(time.perf_counter() - start)
+print(" ".join(sys.modules))
+"""
+
+
+def simple_import_time(verbose=False):
+    print_func = _util.print_func(verbose)
+
+    # Cold start budget in seconds, best of several fresh interpreters
+    budget = float(os.environ.get("AF_IMPORT_TIME_BUDGET", "0.25"))
+    runs = int(os.environ.get("AF_IMPORT_TIME_RUNS", "5"))
+
+    best = None
+    for _ in range(runs):
+        out = subprocess.check_output([sys.executable, "-c", _import_script], universal_newlines=True)
+        elapsed, modules = out.splitlines()[-2:]
+        elapsed = float(elapsed)
+        best = elapsed if best is None else min(best, elapsed)
+
+        modules = set(modules.split())
+        for name in _lazy_modules:
+            assert name not in modules, "%s imported by 'import arrayfire'" % name
+
+    print_func("import arrayfire: %.1f ms (budget %.1f ms)" % (best * 1e3, budget * 1e3))
+    assert best < budget
+
+    import arrayfire as af
+    for name in ["fft", "medfilt", "harris", "Window", "to_array", "AF_NUMPY_FOUND", "create_sparse",
+                 "convolve2GradientNN", "save_container"]:
+        assert name in dir(af)
+        assert getattr(af, name) is not None
+
+
+_util.tests["import_time"] = simple_import_time
@@ -81,5 +81,14 @@ def simple_index(verbose=False):
     a[b] = c
     display_func(a)
 
+    # Plans resolve the key once and can be reused on arrays of the same shape
+    a = af.randu(5, 5)
+    plan = af.index_plan((a[:, 0] > 0.5, slice(1, 3)), a.dims())
+    assert plan.assign_dims == (int(af.count(a[:, 0] > 0.5)), 2, 1, 1)
+    for ii in range(3):
+        a[plan] = ii
+        display_func(a[plan])
+    assert a[af.index_plan(2, a.dims())].dims() == a[2].dims()
+
 
 _util.tests["index"] = simple_index
@@ -49,7 +49,72 @@ def simple_interop(verbose=False):
         a.to_ndarray(n2)
         assert((n == n2).all())
 
+        n = np.random.random((5, 3, 2))
+        a = af.to_array(n, row_major=True)
+        assert(a.shape == n.shape)
+        assert((a.to_ndarray() == n).all())
+        assert((a[1:4, 2].to_ndarray() == n[1:4, 2:3]).all())
+        assert((a.sum(axis=1).to_ndarray() == n.sum(axis=1, keepdims=True)).all())
+        n2 = np.zeros((5, 3, 2), order='F')
+        a.to_ndarray(n2)
+        assert((n == n2).all())
+        assert((af.np_to_af_array(np.asfortranarray(n), row_major=True).to_ndarray() == n).all())
+        assert((af.np_to_af_array(n[:, ::2], row_major=True).to_ndarray() == n[:, ::2]).all())
+
+        # Strided views with a contiguous first dimension are wrapped without a host copy
+        n = np.random.random((6, 8))
+        f = np.asfortranarray(n)
+        for view in [f[:, ::2], f[1:5, 2:7], n.T[:, ::3]]:
+            assert(af.interop._np_strides(view) is not None)
+            assert((np.array(af.to_array(view)) == view).all())
+        for view in [n[::2], n[1:5, 2:7]]:
+            assert(af.interop._np_strides(view, row_major=True) is not None)
+            assert((af.np_to_af_array(view, row_major=True).to_ndarray() == view).all())
+
+        # Other views are copied
+        for view in [n[:, ::2], n[::2, 1:5], n.T[::3]]:
+            assert(af.interop._np_strides(view) is None)
+            assert((np.array(af.to_array(view)) == view).all())
+        assert(af.interop._np_strides(n[:, ::2], row_major=True) is None)
+        assert((af.np_to_af_array(n[:, ::2], row_major=True).to_ndarray() == n[:, ::2]).all())
+
+        items = [np.random.random((4, 3)) for _ in range(5)]
+        for axis in [-1, 0, 1]:
+            a = af.stack_from_host(items, axis)
+            expected = np.stack(items, axis)
+            assert(a.dims() == expected.shape)
+            assert((np.array(a) == expected).all())
+
+        if af.get_active_backend() == 'cpu':
+            for view in [np.asfortranarray(n), np.asfortranarray(n)[:, ::2]]:
+                a = af.np_to_af_array(view, copy=False)
+                assert((np.array(a) == view).all())
+            try:
+                af.np_to_af_array(n[:, ::2], copy=False)
+                assert(False)
+            except RuntimeError:
+                pass
+
+        if af.is_half_supported():
+            n = np.random.random((4, 3)).astype(np.float16)
+            a = af.np_to_af_array(n)
+            assert(a.dtype() == af.Dtype.f16)
+            assert((np.array(a) == n).all())
+
+            af.set_storage_dtype(af.Dtype.f16, min_elements=10)
+            try:
+                n = np.random.random((4, 3)).astype(np.float32)
+                a = af.np_to_af_array(n)
+                assert(a.dtype() == af.Dtype.f16)
+                assert((np.array(a) == n.astype(np.float16)).all())
+                assert((a + 1).dtype() == af.Dtype.f32)
+                assert(af.stack_from_host([n, n]).dtype() == af.Dtype.f16)
+                assert(af.np_to_af_array(n[:2, :2]).dtype() == af.Dtype.f32)
+            finally:
+                af.set_storage_dtype(None)
+
     if af.AF_PYCUDA_FOUND and af.get_active_backend() == "cuda":
+        import pycuda.autoinit
         import pycuda.gpuarray as cudaArray
         n = np.random.random((5,))
         c = cudaArray.to_gpu(n)
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+
+#######################################################
+# Copyright (c) 2015, ArrayFire
+# All rights reserved.
+#
+# This file is distributed under 3-clause BSD license.
+# The complete license agreement can be obtained at:
+# http://arrayfire.com/licenses/BSD-3-Clause
+########################################################
+
+import arrayfire as af
+
+from . import _util
+
+
+def simple_layout(verbose=False):
+    display_func = _util.display_func(verbose)
+
+    a = af.randu(3, 4, 2)
+    r = af.RowMajorArray.from_array(a)
+    assert r.shape == (3, 4, 2)
+    assert r.base.dims() == (2, 4, 3)
+    assert r.to_list() == [[[a[i, j, k].scalar() for k in range(2)] for j in range(4)] for i in range(3)]
+    assert r.to_array().to_list() == a.to_list()
+
+    # Index keys and reduction axes follow the row major shape
+    assert r[1:3, 0].shape == (2, 1, 2)
+    assert r[1:3, 0].to_array().to_list() == a[1:3, 0].to_list()
+    assert r[:, -1, 1].to_array().to_list() == a[:, -1, 1].to_list()
+    assert r.sum(axis=0).shape == (1, 4, 2)
+    assert r.max(axis=-1).to_array().to_list() == af.max(a, dim=2).to_list()
+    assert abs(r.sum() - af.sum(a)) < 1e-3
+
+    b = 2 * r + r
+    assert b.to_array().to_list() == (2 * a + a).to_list()
+    assert r.apply(af.sin).to_array().to_list() == af.sin(a).to_list()
+    display_func(b)
+
+    r[0, 0, 0] = 5
+    assert r.to_list()[0][0][0] == 5
+
+    try:
+        r + a
+        assert False
+    except TypeError:
+        pass
+
+    v = af.RowMajorArray(af.randu(4), 2)
+    assert v.shape == (1, 4)
+    assert v.to_array().dims() == (1, 4)
+
+
+_util.tests["layout"] = simple_layout
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+
+#######################################################
+# Copyright (c) 2015, ArrayFire
+# All rights reserved.
+#
+# This file is distributed under 3-clause BSD license.
+# The complete license agreement can be obtained at:
+# http://arrayfire.com/licenses/BSD-3-Clause
+########################################################
+
+import arrayfire as af
+
+from . import _util
+
+
+def simple_numpy_dispatch(verbose=False):
+    display_func = _util.display_func(verbose)
+
+    if not af.AF_NUMPY_FOUND:
+        return
+
+    import numpy as np
+
+    n = np.random.random((4, 3)).astype(np.float32)
+    a = af.np_to_af_array(n)
+    af.reset_numpy_fallbacks()
+
+    # Supported calls stay on the device
+    assert isinstance(np.sin(a), af.Array)
+    assert np.allclose(np.sin(a).to_ndarray(), np.sin(n))
+    assert np.allclose((np.float32(2) * a).to_ndarray(), 2 * n)
+    assert np.allclose(np.maximum(a, 0.5).to_ndarray(), np.maximum(n, 0.5))
+    assert abs(np.sum(a) - np.sum(n)) < 1e-4
+    assert np.sum(a, axis=0).dims() == (3,)
+    assert np.allclose(np.sum(a, axis=0).to_ndarray(), np.sum(n, axis=0))
+    assert np.allclose(np.mean(a, axis=1, keepdims=True).to_ndarray(), np.mean(n, axis=1, keepdims=True))
+    assert np.allclose(np.std(a, axis=0).to_ndarray(), np.std(n, axis=0))
+    assert np.allclose(np.add.reduce(a, axis=1).to_ndarray(), np.add.reduce(n, axis=1))
+    assert isinstance(np.matmul(a, np.transpose(a)), af.Array)
+    assert np.allclose(np.matmul(a, np.transpose(a)).to_ndarray(), n @ n.T, atol=1e-4)
+    assert np.allclose(np.where(a > 0.5, a, 0.0).to_ndarray(), np.where(n > 0.5, n, 0))
+
+    # Integer arrays are divided as floats, like numpy does
+    if af.is_dbl_supported():
+        i = af.np_to_af_array(np.arange(6, dtype=np.int32))
+        assert np.allclose(np.divide(i, 4).to_ndarray(), np.arange(6) / 4)
+        assert np.allclose(np.true_divide(7, i + 1).to_ndarray(), 7 / (np.arange(6) + 1))
+
+    out = af.constant(0, 4, 3)
+    np.exp(a, out=(out,))
+    assert np.allclose(out.to_ndarray(), np.exp(n))
+    assert af.numpy_fallbacks() == {}
+
+    # Unsupported calls run numpy on the host and are counted
+    res = np.fliplr(a)
+    assert isinstance(res, np.ndarray)
+    assert (res == np.fliplr(n)).all()
+    np.fliplr(a)
+    assert af.numpy_fallbacks() == {"numpy.fliplr": 2}
+    display_func(af.numpy_fallbacks())
+
+    af.set_numpy_fallback("raise")
+    try:
+        np.fliplr(a)
+        assert False
+    except RuntimeError:
+        pass
+    finally:
+        af.set_numpy_fallback()
+        af.reset_numpy_fallbacks()
+
+
+_util.tests["numpy_dispatch"] = simple_numpy_dispatch